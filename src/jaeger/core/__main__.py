@@ -247,6 +247,10 @@ async def actor(fps_maker):
         await fps.initialise()
 
         await actor_.start()
+
+        if config["actor"].get("status", None):
+            await actor_.start_status_server()
+
         await actor_.run_forever()
 
         await actor_.stop()
@@ -479,5 +483,212 @@ async def unlock(fps_maker: FPSWrapper):
         os.remove(LOCK_FILE)
 
 
+@jaeger.group()
+def benchmark():
+    """Runs performance benchmarks against a virtual FPS."""
+
+    pass
+
+
+@benchmark.command(name="send-command")
+@click.option(
+    "-n",
+    "--n-positioners",
+    type=int,
+    multiple=True,
+    default=(10, 100, 500),
+    show_default=True,
+    help="Number of positioners. Can be passed multiple times.",
+)
+@click.option(
+    "--n-commands",
+    type=int,
+    default=1000,
+    show_default=True,
+    help="Number of commands to send for each case.",
+)
+@cli_coro
+async def benchmark_send_command(n_positioners: tuple[int, ...], n_commands: int):
+    """Measures the overhead of FPS.send_command against the number of robots."""
+
+    from jaeger.core.benchmarks import benchmark_send_command
+
+    warnings.simplefilter("ignore", category=JaegerUserWarning)
+
+    print(f"{'N':>6} {'broadcast':>12} {'targeted':>12} {'default':>12}  (us/call)")
+    for nn in n_positioners:
+        results = await benchmark_send_command(nn, n_commands=n_commands)
+        print(f"{nn:>6} " + " ".join(f"{results[key] * 1e6:12.1f}" for key in results))
+
+
+@benchmark.command(name="initialise")
+@click.option(
+    "-n",
+    "--n-positioners",
+    type=int,
+    multiple=True,
+    default=(10, 100, 500),
+    show_default=True,
+    help="Number of positioners. Can be passed multiple times.",
+)
+@click.option(
+    "--n-runs",
+    type=int,
+    default=3,
+    show_default=True,
+    help="Number of times to initialise the positioners for each case.",
+)
+@cli_coro
+async def benchmark_initialise(n_positioners: tuple[int, ...], n_runs: int):
+    """Measures the time to initialise the positioners against the number of robots."""
+
+    from jaeger.core.benchmarks import benchmark_initialise
+
+    warnings.simplefilter("ignore", category=JaegerUserWarning)
+
+    print(f"{'N':>6} {'initialise':>12} {'array':>12} {'positioner':>12}  (s)")
+    for nn in n_positioners:
+        results = await benchmark_initialise(nn, n_runs=n_runs)
+        print(f"{nn:>6} " + " ".join(f"{results[key]:12.3f}" for key in results))
+
+
+@benchmark.command(name="validation")
+@click.option(
+    "--n-messages",
+    type=int,
+    default=10000,
+    show_default=True,
+    help="Number of messages to validate for each case.",
+)
+@cli_coro
+async def benchmark_validation(n_messages: int):
+    """Measures the cost of validating actor messages against the schema."""
+
+    from jaeger.core.benchmarks import benchmark_validation
+
+    results = await benchmark_validation(n_messages=n_messages)
+
+    cases = list(results[list(results)[0]])
+    print(
+        f"{'keyword':>18} " + " ".join(f"{case:>10}" for case in cases) + "  (us/msg)"
+    )
+    for name, times in results.items():
+        print(f"{name:>18} " + " ".join(f"{times[case] * 1e6:10.2f}" for case in cases))
+
+
+@benchmark.command(name="can-latency")
+@click.option(
+    "--n-commands",
+    type=int,
+    default=1000,
+    show_default=True,
+    help="Number of commands to send for each case.",
+)
+@click.option(
+    "--load",
+    type=float,
+    default=0.005,
+    show_default=True,
+    help="Time the main loop is blocked every millisecond in the loaded cases.",
+)
+@cli_coro
+async def benchmark_can_latency(n_commands: int, load: float):
+    """Measures CAN latencies with and without the dedicated I/O thread."""
+
+    from jaeger.core.benchmarks import benchmark_can_latency
+
+    print(
+        f"{'io_thread':>10} {'load':>6} {'latency':>8} {'p50':>8} {'p95':>8} {'p99':>8}"
+    )
+    for io_thread in [False, True]:
+        for load_ in [0.0, load]:
+            results = await benchmark_can_latency(
+                n_commands=n_commands,
+                io_thread=io_thread,
+                load=load_,
+            )
+            for name, values in results.items():
+                print(
+                    f"{str(io_thread):>10} {load_ * 1e3:6.1f} {name:>8} "
+                    + " ".join(f"{values[pp] * 1e3:8.3f}" for pp in values)
+                )
+    print("(load and latencies in ms)")
+
+
+@benchmark.command(name="cannet-receive")
+@click.option(
+    "-n",
+    "--n-interfaces",
+    type=int,
+    multiple=True,
+    default=(1, 2, 4),
+    show_default=True,
+    help="Number of CAN@net devices. Can be passed multiple times.",
+)
+@click.option(
+    "--n-positioners",
+    type=int,
+    default=500,
+    show_default=True,
+    help="Number of positioners per device.",
+)
+@click.option(
+    "--n-commands",
+    type=int,
+    default=20,
+    show_default=True,
+    help="Number of broadcasts to send for each case.",
+)
+@cli_coro
+async def benchmark_cannet_receive(
+    n_interfaces: tuple[int, ...],
+    n_positioners: int,
+    n_commands: int,
+):
+    """Measures the CAN@net receive throughput with and without worker processes."""
+
+    from jaeger.core.benchmarks import benchmark_cannet_receive
+
+    print(f"{'N':>4} {'workers':>8} {'replies/s':>12} {'ms/command':>12}")
+    for nn in n_interfaces:
+        for receive_workers in [False, True]:
+            results = await benchmark_cannet_receive(
+                n_interfaces=nn,
+                n_positioners=n_positioners,
+                n_commands=n_commands,
+                receive_workers=receive_workers,
+            )
+            print(
+                f"{nn:>4} {str(receive_workers):>8} "
+                f"{results['replies_per_second']:12.0f} "
+                f"{results['time_per_command'] * 1e3:12.2f}"
+            )
+
+
+@benchmark.command(name="executors")
+@click.option(
+    "--n-calls",
+    type=int,
+    default=20,
+    show_default=True,
+    help="Number of calls for each case.",
+)
+@cli_coro
+async def benchmark_executors(n_calls: int):
+    """Measures the overhead of run_in_executor with new and persistent pools."""
+
+    from jaeger.core.benchmarks import benchmark_executors
+    from jaeger.core.utils import shutdown_executors
+
+    results = await benchmark_executors(n_calls=n_calls)
+    shutdown_executors()
+
+    print(f"{'executor':>10} {'new':>12} {'persistent':>12}  (ms/call)")
+    for name, times in results.items():
+        print(
+            f"{name:>10} {times['new'] * 1e3:12.3f} {times['persistent'] * 1e3:12.3f}"
+        )
+
+
 if __name__ == "__main__":
     jaeger()
@@ -15,16 +15,18 @@ import os
 from tempfile import NamedTemporaryFile
 from time import time
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Set, Tuple
 
 import clu
 import clu.protocol
 from clu.tools import ActorHandler
 
 import jaeger.core
-from jaeger.core import __version__, log
+from jaeger.core import __version__, config, log
 from jaeger.core.exceptions import JaegerUserWarning
 
+from .validation import JaegerModel
+
 
 if TYPE_CHECKING:
     from jaeger.core.fps import FPS
@@ -63,12 +65,16 @@ class JaegerActor(clu.LegacyActor):
         fps: FPS,
         *args,
         ping_interval: float | bool | None = None,
+        validation: Dict[str, Any] | None = None,
         **kwargs,
     ):
         jaeger.core.actor_instance = self
 
         self.fps = fps
 
+        # Used by load_schema, which is called by the parent's __init__.
+        self._validation = validation or {}
+
         # This is mostly for the miniwoks. If the schema file is not the base
         # one, merge them.
         base = os.path.join(os.path.dirname(__file__), "..")
@@ -106,20 +112,74 @@ class JaegerActor(clu.LegacyActor):
 
         await super().start(*args, **kwargs)
 
-    async def start_status_server(self, port, delay=1):
-        """Starts a server that outputs the status as a JSON on a timer."""
+    def load_schema(self, schema, is_file=None, additional_properties=False):
+        """Loads the schema into a `.JaegerModel` with per-keyword validation."""
+
+        if schema is None:
+            return super().load_schema(schema, is_file, additional_properties)
 
-        self.status_server = clu.protocol.TCPStreamPeriodicServer(
-            self.host,
-            port,
-            periodic_callback=self._report_status_cb,
-            sleep_time=delay,
+        self.model = JaegerModel(
+            self.name,
+            schema,
+            is_file=is_file,
+            additional_properties=additional_properties,
+            policies=self._validation.get("keywords", None),
+            default_policy=self._validation.get("default", "always"),
+            sample_every=self._validation.get("sample_every", 100),
         )
 
+        return self.model
+
+    async def start_status_server(
+        self,
+        port: int | None = None,
+        delay: float | None = None,
+        delta: bool | None = None,
+    ):
+        """Starts a server that outputs the status as a JSON on a timer.
+
+        The status is computed and serialised once per period and the same
+        buffer is sent to all the connected clients. If ``delta=True``, clients
+        receive the full status when they connect and afterwards only the
+        positioners that have changed since the previous period, with the key
+        ``"delta": true``. Parameters that are `None` are read from
+        ``actor.status`` in the configuration.
+
+        """
+
+        status_config = config["actor"].get("status", None) or {}
+
+        if port is None:
+            port = status_config["port"]
+
+        self._status_delay = delay if delay is not None else status_config["delay"]
+        self._status_delta = (
+            delta if delta is not None else status_config.get("delta", False)
+        )
+
+        # The snapshot is tagged with the tick of the period that created it.
+        self._status_tick: int = 0
+        self._status_snapshot: Tuple[int, bytes, bytes] | None = None
+        self._status_positioners: Dict[int, Any] = {}
+        self._status_transports: Set[asyncio.Transport] = set()
+
+        self.status_server = clu.protocol.TCPStreamServer(self.host, port)
         await self.status_server.start()
 
+        self._status_task = asyncio.create_task(self._emit_status())
+
         self.log.info(f"starting status server on {self.host}:{port}")
 
+    async def stop(self):
+        """Stops the actor and the status server."""
+
+        if getattr(self, "_status_task", None) is not None:
+            self._status_task.cancel()
+            self._status_task = None
+            self.status_server.stop()
+
+        await super().stop()
+
     async def _report_alive(self, ping_interval: float | bool | None = None):
         """Outputs the ``alive_at`` keyword."""
 
@@ -133,18 +193,68 @@ class JaegerActor(clu.LegacyActor):
             self.write("d", {"alive_at": time()}, broadcast=True)
             await asyncio.sleep(ping_interval)
 
-    async def _report_status_cb(self, transport):
-        """Reports the status to the status server."""
+    async def _emit_status(self):
+        """Sends the status to all the status server clients once per period."""
+
+        while True:
+            self._status_tick += 1
+
+            for transport in list(self.status_server.transports):
+                await self._report_status_cb(transport)
+
+            await asyncio.sleep(self._status_delay)
+
+    async def _get_status_snapshot(self) -> Tuple[bytes, bytes]:
+        """Returns the serialised full and delta status for this period.
+
+        The snapshot is reused by all the transports during the same period.
+
+        """
+
+        if self._status_snapshot is not None:
+            snapshot_tick, full, delta = self._status_snapshot
+            if snapshot_tick == self._status_tick:
+                return full, delta
 
         status = await self.fps.report_status()
-        status_json = json.dumps(status)
+        full = json.dumps(status).encode() + b"\n"
 
-        transport.write(status_json.encode() + "\n".encode())
+        delta = b""
+        if self._status_delta:
+            positioners = status["positioners"]
+            changed = {
+                pid: data
+                for pid, data in positioners.items()
+                if self._status_positioners.get(pid, None) != data
+            }
+            self._status_positioners = positioners
 
-        return status
+            delta_status = {**status, "positioners": changed, "delta": True}
+            delta = json.dumps(delta_status).encode() + b"\n"
+
+            # Forget the transports that have disconnected.
+            self._status_transports &= set(self.status_server.transports)
+
+        self._status_snapshot = (self._status_tick, full, delta)
+
+        return full, delta
+
+    async def _report_status_cb(self, transport):
+        """Reports the status to the status server."""
+
+        full, delta = await self._get_status_snapshot()
+
+        if self._status_delta and transport in self._status_transports:
+            transport.write(delta)
+        else:
+            transport.write(full)
+            if self._status_delta:
+                self._status_transports.add(transport)
 
     async def _status_watcher(self):
-        """Listens to the status async generator."""
+        """Outputs the FPS status when it changes."""
 
-        async for status in self.fps.async_status():
-            self.write("i", fps_status=f"0x{status.value:x}")
+        with self.fps.subscribe(positioners=False) as subscription:
+            async for event in subscription:
+                if event.status is not None:
+                    self.write("i", fps_status=f"0x{event.status.value:x}")
@@ -6,7 +6,13 @@
 # @Filename: debug.py
 # @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
 
+import time
+
+import click
+import numpy
+
 from jaeger.core import __version__, config
+from jaeger.core.latency import LATENCY_GROUPS, LATENCY_METRICS, latency_stats
 
 from . import jaeger_parser
 
@@ -34,3 +40,119 @@ def info_(command, fps):
     )
 
     return command.finish()
+
+
+@debug.command()
+@click.argument("POSITIONER_IDS", type=int, nargs=-1)
+@click.option(
+    "--seconds",
+    type=float,
+    default=60.0,
+    show_default=True,
+    help="How far back to look, in seconds.",
+)
+def history(command, fps, positioner_ids, seconds):
+    """Reports the recorded position history of positioners."""
+
+    if fps.history is None:
+        return command.fail(error="The telemetry history is disabled.")
+
+    pids = list(positioner_ids) or None
+
+    recorded = fps.history.query(seconds=seconds, positioner_ids=pids)
+    latest = fps.history.at(time.monotonic(), positioner_ids=pids)
+    velocities = fps.history.velocity(positioner_ids=pids, seconds=seconds)
+
+    def clean(value):
+        return -999.0 if numpy.isnan(value) else round(value, 4)
+
+    for ii, pid in enumerate(recorded["positioner_ids"]):
+        n_samples = int((~numpy.isnan(recorded["alpha"][:, ii])).sum())
+        alpha, beta, _ = latest[pid]
+        valpha, vbeta = velocities[pid]
+
+        command.info(
+            positioner_history=[
+                pid,
+                n_samples,
+                clean(alpha),
+                clean(beta),
+                clean(valpha),
+                clean(vbeta),
+            ]
+        )
+
+    return command.finish()
+
+
+@debug.command()
+@click.argument("KEYS", type=str, nargs=-1)
+@click.option(
+    "--by",
+    "group",
+    type=click.Choice(LATENCY_GROUPS),
+    default="command",
+    show_default=True,
+    help="How to group the latencies.",
+)
+@click.option(
+    "--metric",
+    type=click.Choice(LATENCY_METRICS),
+    default="last_reply",
+    show_default=True,
+    help="The latency to report.",
+)
+@click.option(
+    "--top",
+    type=int,
+    default=None,
+    help="Only report the keys with the highest p90 latency.",
+)
+@click.option("--reset", is_flag=True, help="Clear the latency statistics.")
+def latency(command, fps, keys, group, metric, top, reset):
+    """Reports command latency statistics.
+
+    Latencies are in milliseconds. KEYS are the command names, buses
+    (<channel>/<bus>), or positioner IDs to report; by default all are reported.
+
+    """
+
+    if reset:
+        latency_stats.reset()
+        return command.finish(text="Latency statistics cleared.")
+
+    if not latency_stats.enabled:
+        return command.fail(error="Latency statistics are disabled.")
+
+    if len(keys) == 0:
+        selected = None
+    elif group == "positioner":
+        if not all([key.isdigit() for key in keys]):
+            return command.fail(error="Positioner IDs must be integers.")
+        selected = [int(key) for key in keys]
+    else:
+        selected = list(keys)
+
+    summary = latency_stats.summary(group=group, metric=metric, keys=selected)
+
+    rows = list(summary.items())
+    if top is not None:
+        rows = sorted(rows, key=lambda row: -numpy.nan_to_num(row[1]["p90"]))[:top]
+
+    def ms(value):
+        return -999.0 if numpy.isnan(value) else round(value * 1000, 3)
+
+    for key, stats in rows:
+        command.info(
+            latency=[
+                group,
+                str(key),
+                metric,
+                stats["n_commands"],
+                stats["n_timeouts"],
+                stats["n"],
+                *[ms(stats[name]) for name in ["mean", "p50", "p90", "p99", "max"]],
+            ]
+        )
+
+    return command.finish()
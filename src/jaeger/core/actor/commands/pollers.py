@@ -23,11 +23,27 @@ def pollers():
 
 @pollers.command()
 async def list(command, fps):
-    """Lists available pollers."""
+    """Lists available pollers and their timing metrics."""
 
     poller_status = []
     for name in fps.pollers.names:
-        poller_status.append(name + ("*" if fps.pollers[name].running else ""))
+        poller = fps.pollers[name]
+        poller_status.append(name + ("*" if poller.running else ""))
+
+        metrics = poller.metrics
+        command.info(
+            poller=[
+                name,
+                poller.running,
+                round(metrics["delay"], 3),
+                metrics["n_calls"],
+                *[
+                    round(metrics[key], 4) if metrics[key] is not None else -999.0
+                    for key in ["period", "jitter", "max_jitter"]
+                ],
+                metrics["n_overruns"],
+            ]
+        )
 
     command.finish(text=",".join(poller_status))
 
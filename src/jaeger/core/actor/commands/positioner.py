@@ -246,13 +246,35 @@ async def initialise(command, fps, positioner_id, datums=False):
     is_flag=True,
     help="Do not print the status of each positioner.",
 )
+@click.option(
+    "-b",
+    "--batch",
+    is_flag=True,
+    help="Output the status of the positioners as column arrays.",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=100,
+    show_default=True,
+    help="Number of positioners in each batched message.",
+)
 async def status(
     command: JaegerCommandType,
     fps: FPS,
     positioners,
     quiet: bool = False,
+    batch: bool = False,
+    batch_size: int = 100,
 ):
-    """Reports the position and status bit of a list of positioners."""
+    """Reports the position and status bit of a list of positioners.
+
+    With ``--batch`` the status of the positioners is output as column arrays
+    (``status_positioner_id``, ``status_alpha``, etc.) in messages of up to
+    ``--batch-size`` positioners each, instead of one ``positioner_status``
+    message per positioner.
+
+    """
 
     positioner_ids = positioners or list(fps.positioners.keys())
 
@@ -263,6 +285,7 @@ async def status(
         command.actor.write("d", {"alive_at": time()}, broadcast=True)
         command.info(locked=fps.locked)
         command.info(n_positioners=len(fps.positioners))
+        command.info(quarantined=sorted(fps.quarantined))
         command.info(fps_status=f"0x{fps.status.value:x}")
 
     try:
@@ -271,7 +294,10 @@ async def status(
     except JaegerError as err:
         return command.fail(error=f"Failed reporting status: {err}")
 
-    if quiet is False:
+    if quiet is False and batch is True:
+        _write_status_batches(command, fps, sorted(positioner_ids), batch_size)
+
+    elif quiet is False:
         for pid in sorted(positioner_ids):
             p = fps[pid]
 
@@ -308,6 +334,60 @@ async def status(
     command.set_status(clu.CommandStatus.DONE)
 
 
+def _write_status_batches(
+    command: JaegerCommandType,
+    fps: FPS,
+    positioner_ids: list[int],
+    batch_size: int = 100,
+):
+    """Outputs the status of the positioners as batches of column arrays."""
+
+    interfaces = fps.can.interfaces if isinstance(fps.can, JaegerCAN) else []
+
+    for start in range(0, len(positioner_ids), batch_size):
+        columns: dict[str, list] = {
+            "status_positioner_id": [],
+            "status_alpha": [],
+            "status_beta": [],
+            "status_bits": [],
+            "status_initialised": [],
+            "status_disabled": [],
+            "status_offline": [],
+            "status_bootloader": [],
+            "status_firmware": [],
+            "status_interface": [],
+            "status_bus": [],
+        }
+
+        for pid in positioner_ids[start : start + batch_size]:
+            p = fps[pid]
+
+            if pid in fps.positioner_to_bus and len(interfaces) > 0:
+                interface, bus = fps.positioner_to_bus[pid]
+                interface = interfaces.index(interface) + 1
+            else:
+                interface = -1
+                bus = -1
+
+            columns["status_positioner_id"].append(pid)
+            columns["status_alpha"].append(
+                -999 if p.alpha is None else round(float(p.alpha), 4)
+            )
+            columns["status_beta"].append(
+                -999 if p.beta is None else round(float(p.beta), 4)
+            )
+            columns["status_bits"].append(f"0x{int(p.status):x}")
+            columns["status_initialised"].append(p.initialised)
+            columns["status_disabled"].append(p.disabled)
+            columns["status_offline"].append(p.offline)
+            columns["status_bootloader"].append(p.is_bootloader() or False)
+            columns["status_firmware"].append(p.firmware or "?")
+            columns["status_interface"].append(interface)
+            columns["status_bus"].append(-1 if bus is None else bus)
+
+        command.write("i", columns)
+
+
 @jaeger_parser.command()
 @click.argument("POSITIONER-ID", type=int, nargs=-1, required=False)
 @click.argument("ALPHA", type=click.FloatRange(0.0, 100.0))
@@ -494,9 +574,27 @@ async def led_off(command, fps, positioner_id):
 
 
 @jaeger_parser.command()
-async def reload(command, fps):
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only initialise new or changed positioners and remove vanished ones.",
+)
+async def reload(command, fps, incremental: bool = False):
     """Reinitialise the FPS."""
 
+    if incremental:
+        try:
+            added, removed = await fps.update_roster()
+        except BaseException as err:
+            return command.fail(error=f"Incremental initialisation failed: {err}")
+
+        command.info(n_positioners=len(fps))
+
+        return command.finish(
+            text=f"Added or reinitialised positioners: {added}. "
+            f"Removed positioners: {removed}."
+        )
+
     try:
         await fps.initialise(start_pollers=fps.pollers.running)
     except BaseException as err:
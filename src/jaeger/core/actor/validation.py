@@ -0,0 +1,346 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: validation.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import logging
+import numbers
+
+from typing import Any, Callable, Dict, List, Optional
+
+import jsonschema
+import jsonschema.exceptions
+
+from clu.model import Model
+
+from jaeger.core import log
+
+
+__all__ = ["JaegerModel", "VALIDATION_POLICIES", "compile_schema"]
+
+
+#: The valid validation policies.
+VALIDATION_POLICIES = ["always", "debug", "sample", "skip"]
+
+
+Checker = Callable[[Any], bool]
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+#: Type checks, matching the draft 7 validator used by CLU.
+_TYPE_CHECKS: Dict[str, Checker] = {
+    "string": lambda value: isinstance(value, str),
+    "number": _is_number,
+    "integer": _is_integer,
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+    "array": lambda value: isinstance(value, (list, tuple)),
+    "object": lambda value: isinstance(value, dict),
+}
+
+#: The keywords that `.compile_schema` can compile.
+_SUPPORTED_KEYWORDS = {
+    "type",
+    "items",
+    "enum",
+    "oneOf",
+    "anyOf",
+    "properties",
+    "required",
+    "additionalProperties",
+}
+
+
+def _all(checks: List[Checker]) -> Checker:
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(value: Any) -> bool:
+        for check_ in checks:
+            if not check_(value):
+                return False
+        return True
+
+    return check
+
+
+def compile_schema(schema: Any) -> Checker | None:
+    """Compiles a simple JSON schema into a function that checks a value.
+
+    Supports the ``type``, ``items``, ``enum``, ``oneOf``, ``anyOf``,
+    ``properties``, ``required``, and ``additionalProperties`` keywords, which
+    are the ones used in the jaeger schema. Other draft 7 validation keywords are
+    not supported and `None` is returned; keywords that are not part of draft 7,
+    such as ``title``, are ignored.
+
+    Returns
+    -------
+    checker
+        A function that returns `True` if the value is valid. The checker does not
+        report why a value is invalid; use a `jsonschema` validator for that.
+
+    """
+
+    if schema is True:
+        return lambda value: True
+    elif schema is False:
+        return lambda value: False
+    elif not isinstance(schema, dict):
+        return None
+
+    draft7_keywords = set(jsonschema.Draft7Validator.VALIDATORS)
+    if len((set(schema) & draft7_keywords) - _SUPPORTED_KEYWORDS) > 0:
+        return None
+
+    checks: List[Checker] = []
+
+    if "type" in schema:
+        types = schema["type"]
+        if isinstance(types, str):
+            types = [types]
+        if any([type_ not in _TYPE_CHECKS for type_ in types]):
+            return None
+
+        type_checks = [_TYPE_CHECKS[type_] for type_ in types]
+        if len(type_checks) == 1:
+            checks.append(type_checks[0])
+        else:
+            checks.append(lambda value: any([tc(value) for tc in type_checks]))
+
+    if "enum" in schema:
+        enum = schema["enum"]
+        if not all([isinstance(item, str) for item in enum]):
+            return None
+
+        enum_set = set(enum)
+        checks.append(lambda value: isinstance(value, str) and value in enum_set)
+
+    if "items" in schema:
+        items = schema["items"]
+        is_array = _TYPE_CHECKS["array"]
+
+        if isinstance(items, list):
+            item_checks = [compile_schema(item) for item in items]
+            if any([item_check is None for item_check in item_checks]):
+                return None
+
+            def check_items(value: Any) -> bool:
+                if not is_array(value):
+                    return True
+                for item_check, item in zip(item_checks, value):
+                    if not item_check(item):  # type: ignore
+                        return False
+                return True
+
+        else:
+            item_check = compile_schema(items)
+            if item_check is None:
+                return None
+
+            def check_items(value: Any) -> bool:
+                if not is_array(value):
+                    return True
+                for item in value:
+                    if not item_check(item):
+                        return False
+                return True
+
+        checks.append(check_items)
+
+    for keyword, combine in [("oneOf", "one"), ("anyOf", "any")]:
+        if keyword not in schema:
+            continue
+
+        sub_checks = [compile_schema(sub) for sub in schema[keyword]]
+        if any([sub_check is None for sub_check in sub_checks]):
+            return None
+
+        if combine == "one":
+            checks.append(lambda value, sc=sub_checks: sum([c(value) for c in sc]) == 1)
+        else:
+            checks.append(lambda value, sc=sub_checks: any([c(value) for c in sc]))
+
+    if any(
+        [key in schema for key in ["properties", "required", "additionalProperties"]]
+    ):
+        properties = schema.get("properties", {})
+        required = schema.get("required", [])
+        additional = schema.get("additionalProperties", True)
+        if not isinstance(additional, bool):
+            return None
+
+        property_checks = {key: compile_schema(sub) for key, sub in properties.items()}
+        if any([pc is None for pc in property_checks.values()]):
+            return None
+
+        def check_object(value: Any) -> bool:
+            if not isinstance(value, dict):
+                return True
+            for key in required:
+                if key not in value:
+                    return False
+            for key, item in value.items():
+                property_check = property_checks.get(key, None)
+                if property_check is None:
+                    if additional is False:
+                        return False
+                elif not property_check(item):
+                    return False
+            return True
+
+        checks.append(check_object)
+
+    if len(checks) == 0:
+        return lambda value: True
+
+    return _all(checks)
+
+
+class JaegerModel(Model):
+    """An actor model that validates each keyword with a cached validator.
+
+    CLU validates every message against the full actor schema. This model
+    instead compiles a checker for each keyword the first time it is output (see
+    `.compile_schema`) and reuses it, and applies a validation policy per
+    keyword:
+
+    - ``always``: the keyword is validated every time.
+    - ``debug``: the keyword is validated only if the console handler of the
+      jaeger logger is at ``DEBUG`` level.
+    - ``sample``: the keyword is validated once every ``sample_every`` messages.
+    - ``skip``: the keyword is not validated.
+
+    Keywords not defined in the schema are always rejected if the schema does not
+    allow additional properties. The model is updated with every message
+    regardless of the policy.
+
+    Parameters
+    ----------
+    name
+        The name of the model.
+    schema
+        The schema, as a dictionary, JSON string, or file path.
+    policies
+        A dictionary of keyword to validation policy.
+    default_policy
+        The policy for the keywords not in ``policies``.
+    sample_every
+        How often to validate keywords with the ``sample`` policy.
+    kwargs
+        Other parameters to pass to `~clu.model.Model`.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        schema: Any,
+        policies: Optional[Dict[str, str]] = None,
+        default_policy: str = "always",
+        sample_every: int = 100,
+        **kwargs,
+    ):
+        super().__init__(name, schema, **kwargs)
+
+        self.policies = policies or {}
+        self.default_policy = default_policy
+        self.sample_every = max(sample_every, 1)
+
+        for policy in list(self.policies.values()) + [default_policy]:
+            if policy not in VALIDATION_POLICIES:
+                raise ValueError(f"Invalid validation policy {policy!r}.")
+
+        self._validators: Dict[str, Any] = {}
+        self._checkers: Dict[str, Checker | None] = {}
+        self._n_seen: Dict[str, int] = {}
+
+        #: The number of keywords validated and skipped.
+        self.n_validated: int = 0
+        self.n_skipped: int = 0
+
+    def _get_validator(self, keyword: str):
+        """Returns the cached validator and compiled checker for a keyword."""
+
+        if keyword in self._validators:
+            return self._validators[keyword], self._checkers[keyword]
+
+        properties = self.schema["properties"]
+        if keyword in properties:
+            validator = self.validator.evolve(schema=properties[keyword])
+            checker = compile_schema(properties[keyword])
+        else:
+            validator = None
+            checker = None
+
+        self._validators[keyword] = validator
+        self._checkers[keyword] = checker
+
+        return validator, checker
+
+    def _should_validate(self, keyword: str) -> bool:
+        """Decides whether to validate a keyword based on its policy."""
+
+        policy = self.policies.get(keyword, self.default_policy)
+
+        if policy == "always":
+            return True
+        elif policy == "skip":
+            return False
+        elif policy == "debug":
+            handler = getattr(log, "sh", None)
+            return handler is not None and handler.level <= logging.DEBUG
+        elif policy == "sample":
+            n_seen = self._n_seen.get(keyword, 0)
+            self._n_seen[keyword] = n_seen + 1
+            return n_seen % self.sample_every == 0
+
+        return True
+
+    def validate(self, instance: Dict[str, Any], update_model: bool = True):
+        """Validates a new instance using the per-keyword policies."""
+
+        additional_properties = self.schema.get("additionalProperties", True)
+
+        for keyword, value in instance.items():
+            validator, checker = self._get_validator(keyword)
+
+            try:
+                if validator is None:
+                    if additional_properties is False:
+                        raise jsonschema.exceptions.ValidationError(
+                            f"Additional properties are not allowed "
+                            f"({keyword!r} was unexpected)"
+                        )
+                    self.validator.validate({keyword: value})
+
+                elif self._should_validate(keyword):
+                    # Use the compiled checker if possible and only run the
+                    # full validator to report why a value is invalid.
+                    if checker is None or not checker(value):
+                        validator.validate(value)
+                    self.n_validated += 1
+
+                else:
+                    self.n_skipped += 1
+
+            except jsonschema.exceptions.ValidationError as err:
+                return False, err
+
+        if update_model:
+            self.update_model(instance)
+
+        return True, None
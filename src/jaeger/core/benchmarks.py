@@ -0,0 +1,555 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: benchmarks.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+import time
+
+from typing import Dict, List
+
+import numpy
+
+from jaeger.core import utils
+from jaeger.core.can import CANnetInterface, JaegerCAN
+from jaeger.core.interfaces import VirtualBus
+from jaeger.core.maskbits import PositionerStatus
+from jaeger.core.positioner.commands import (
+    CommandID,
+    GetActualPosition,
+    GetFirmwareVersion,
+)
+from jaeger.core.testing import VirtualCANnet, VirtualFPS, VirtualPositioner
+from jaeger.core.utils import AsyncioExecutor, get_executor, run_in_executor
+
+
+__all__ = [
+    "benchmark_send_command",
+    "benchmark_initialise",
+    "benchmark_validation",
+    "benchmark_can_latency",
+    "benchmark_cannet_receive",
+    "benchmark_executors",
+]
+
+
+async def benchmark_send_command(
+    n_positioners: int,
+    n_commands: int = 1000,
+    firmware: str = "04.01.21",
+) -> Dict[str, float]:
+    """Measures the overhead of `.FPS.send_command`.
+
+    Creates a `.VirtualFPS` with ``n_positioners`` positioners and calls
+    `~.FPS.send_command` ``n_commands`` times with a broadcast, with an explicit
+    list of all the positioners, and with the default list of positioners. The
+    commands are cancelled immediately so only the validation and creation of
+    the command are measured.
+
+    Parameters
+    ----------
+    n_positioners
+        The number of positioners in the FPS.
+    n_commands
+        The number of commands to send for each case.
+    firmware
+        The firmware version to assign to the positioners.
+
+    Returns
+    -------
+    results
+        A dictionary with the mean time per call, in seconds, for each case.
+
+    """
+
+    fps = VirtualFPS()
+
+    try:
+        await fps.start_can()
+
+        for positioner_id in range(1, n_positioners + 1):
+            positioner = fps.add_positioner(positioner_id)
+            positioner.firmware = firmware
+
+        cases: Dict[str, int | List[int] | None] = {
+            "broadcast": 0,
+            "targeted": list(fps.positioners),
+            "default": None,
+        }
+
+        results = {}
+        for name, positioner_ids in cases.items():
+            t0 = time.perf_counter()
+
+            for _ in range(n_commands):
+                command = fps.send_command(
+                    CommandID.GET_STATUS,
+                    positioner_ids=positioner_ids,
+                )
+                command.cancel(silent=True)
+
+            results[name] = (time.perf_counter() - t0) / n_commands
+
+    finally:
+        if fps.can is not None and not isinstance(fps.can, str):
+            fps.can.stop()
+        fps.discard()
+
+    return results
+
+
+async def benchmark_initialise(
+    n_positioners: int,
+    n_runs: int = 3,
+) -> Dict[str, float]:
+    """Measures the time to initialise the positioners of a virtual FPS.
+
+    Creates a `.VirtualFPS` with ``n_positioners`` virtual positioners and runs
+    a full `.FPS.initialise` to discover them. Then initialises the positioners
+    ``n_runs`` times sending each step as one command to all the positioners
+    (``array``, as `.FPS.initialise` does), and ``n_runs`` times calling
+    `.Positioner.initialise` for each positioner (``positioner``, as
+    `.FPS.initialise` used to do).
+
+    Parameters
+    ----------
+    n_positioners
+        The number of virtual positioners.
+    n_runs
+        The number of times to initialise the positioners for each case.
+
+    Returns
+    -------
+    results
+        A dictionary with the time of the full initialisation (``initialise``)
+        and the mean time to initialise the positioners for each case, in
+        seconds.
+
+    """
+
+    fps = VirtualFPS()
+
+    try:
+        for positioner_id in range(1, n_positioners + 1):
+            fps.add_virtual_positioner(positioner_id)
+
+            # POSITION_RESTORED does not fit in the 32-bit status of the replies.
+            vpositioner = fps._vpositioners[positioner_id]
+            vpositioner.status &= ~PositionerStatus.POSITION_RESTORED
+
+        await fps.start_can()
+
+        t0 = time.perf_counter()
+        await fps.initialise(start_pollers=False)
+        results = {"initialise": time.perf_counter() - t0}
+
+        if len(fps) != n_positioners:
+            raise RuntimeError(f"Found {len(fps)} of {n_positioners} positioners.")
+
+        t0 = time.perf_counter()
+        for _ in range(n_runs):
+            failed = await fps._initialise_positioners()
+            if len(failed) > 0:
+                raise RuntimeError(f"Failed initialising positioners {failed}.")
+        results["array"] = (time.perf_counter() - t0) / n_runs
+
+        t0 = time.perf_counter()
+        for _ in range(n_runs):
+            await asyncio.gather(
+                *[positioner.initialise() for positioner in fps.values()]
+            )
+        results["positioner"] = (time.perf_counter() - t0) / n_runs
+
+    finally:
+        if fps.can is not None and not isinstance(fps.can, str):
+            fps.can.stop()
+        fps._process_messages_task.cancel()
+        fps._vpositioner_bus.close()
+        fps.discard()
+
+    return results
+
+
+async def benchmark_validation(n_messages: int = 10000) -> Dict[str, Dict[str, float]]:
+    """Measures the cost of validating actor messages against the schema.
+
+    Validates a ``positioner_status``, an ``fps_status``, and a batched status
+    message (see the ``status --batch`` actor command) ``n_messages`` times with
+    the default CLU model, which validates the message against the whole schema,
+    and with a `.JaegerModel` using the ``always``, ``sample``, and ``skip``
+    policies. The model is not updated.
+
+    Parameters
+    ----------
+    n_messages
+        The number of messages to validate for each case.
+
+    Returns
+    -------
+    results
+        A dictionary of message to a dictionary with the mean time per message,
+        in seconds, for each case.
+
+    """
+
+    from clu.model import Model
+
+    from jaeger.core.actor.validation import JaegerModel
+
+    schema = os.path.join(os.path.dirname(__file__), "config/schema.json")
+
+    positioner_status = [1, 10.0, 180.0, "0x1", True, False, False, False]
+    positioner_status += ["04.01.21", 1, 1, "?"]
+
+    batch = {
+        "status_positioner_id": list(range(1, 101)),
+        "status_alpha": [10.0] * 100,
+        "status_beta": [180.0] * 100,
+        "status_bits": ["0x1"] * 100,
+        "status_initialised": [True] * 100,
+        "status_disabled": [False] * 100,
+        "status_offline": [False] * 100,
+        "status_bootloader": [False] * 100,
+        "status_firmware": ["04.01.21"] * 100,
+        "status_interface": [1] * 100,
+        "status_bus": [1] * 100,
+    }
+
+    messages = {
+        "positioner_status": {"positioner_status": positioner_status},
+        "fps_status": {"fps_status": "0x1"},
+        "batch": batch,
+    }
+
+    models = {
+        "clu": Model("jaeger", schema),
+        "always": JaegerModel("jaeger", schema, default_policy="always"),
+        "sample": JaegerModel("jaeger", schema, default_policy="sample"),
+        "skip": JaegerModel("jaeger", schema, default_policy="skip"),
+    }
+
+    results = {}
+    for message_name, message in messages.items():
+        results[message_name] = {}
+        for model_name, model in models.items():
+            t0 = time.perf_counter()
+
+            for _ in range(n_messages):
+                valid, err = model.validate(message, update_model=False)
+                if not valid:
+                    raise ValueError(f"Invalid message {message_name!r}: {err}")
+
+            elapsed = time.perf_counter() - t0
+            results[message_name][model_name] = elapsed / n_messages
+
+    return results
+
+
+async def _run_virtual_hardware(bus: VirtualBus, positioner_ids: List[int]):
+    """Replies to the messages in a virtual bus as a set of positioners."""
+
+    vpositioners = {pid: VirtualPositioner(pid, bus=bus) for pid in positioner_ids}
+
+    while True:
+        msg = await bus.get()
+
+        positioner_id, command_id, uid, __ = utils.parse_identifier(msg.arbitration_id)
+
+        if positioner_id == 0:
+            for vp in vpositioners.values():
+                await vp.process_message(msg, positioner_id, command_id, uid)
+        elif positioner_id in vpositioners:
+            vp = vpositioners[positioner_id]
+            await vp.process_message(msg, positioner_id, command_id, uid)
+
+
+async def _block_loop(interval: float, duration: float):
+    """Blocks the event loop for ``duration`` seconds every ``interval`` seconds."""
+
+    while True:
+        await asyncio.sleep(interval)
+        time.sleep(duration)
+
+
+async def benchmark_can_latency(
+    n_commands: int = 1000,
+    n_positioners: int = 10,
+    io_thread: bool = False,
+    load: float = 0.0,
+    channel: str = "benchmark",
+) -> Dict[str, Dict[str, float]]:
+    """Measures the latency of CAN commands with and without load in the loop.
+
+    Creates a `.JaegerCAN` with a virtual interface and a set of virtual
+    positioners that reply from a separate thread, as real hardware would, and
+    sends ``n_commands`` ``GET_ACTUAL_POSITION`` commands, one at a time. While
+    the commands are running a task blocks the main event loop for ``load``
+    seconds every millisecond, simulating a busy actor.
+
+    Two latencies are measured for each command: the bus latency, from the time
+    the messages are sent to the time the first reply is received and
+    timestamped by the `.Notifier`, and the total latency until the command is
+    done in the main loop.
+
+    Parameters
+    ----------
+    n_commands
+        The number of commands to send.
+    n_positioners
+        The number of virtual positioners.
+    io_thread
+        Whether to run the interface in a dedicated I/O thread.
+    load
+        How long to block the main loop every millisecond, in seconds.
+    channel
+        The virtual channel to use.
+
+    Returns
+    -------
+    results
+        A dictionary with the ``p50``, ``p95``, and ``p99`` percentiles of the
+        ``bus`` and ``total`` latencies, in seconds.
+
+    """
+
+    positioner_ids = list(range(1, n_positioners + 1))
+
+    # The virtual positioners run in their own thread and loop.
+    hardware_bus = VirtualBus(channel)
+    hardware = AsyncioExecutor()
+    asyncio.run_coroutine_threadsafe(
+        _run_virtual_hardware(hardware_bus, positioner_ids),
+        hardware.loop,
+    )
+
+    can = JaegerCAN("virtual", channels=[channel], io_thread=io_thread)
+    await can.start()
+
+    load_task = None
+    if load > 0:
+        load_task = asyncio.create_task(_block_loop(0.001, load))
+
+    bus_latency: List[float] = []
+    total_latency: List[float] = []
+
+    try:
+        for ii in range(n_commands):
+            pid = positioner_ids[ii % n_positioners]
+            command = GetActualPosition(positioner_ids=pid, timeout=1)
+
+            assert can.command_queue
+            can.command_queue.put_nowait(command)
+            await command
+
+            if len(command.replies) == 0 or command.start_time is None:
+                continue
+
+            end_time = time.time()
+            received_time = command.replies[0].received_time
+
+            bus_latency.append(received_time - command.start_time)
+            total_latency.append(end_time - command.start_time)
+
+    finally:
+        if load_task:
+            load_task.cancel()
+        can.stop()
+        hardware.shutdown(wait=True)
+        hardware_bus.close()
+
+    if len(bus_latency) == 0:
+        raise RuntimeError("All the commands failed.")
+
+    results = {}
+    for name, values in [("bus", bus_latency), ("total", total_latency)]:
+        p50, p95, p99 = numpy.percentile(values, [50, 95, 99])
+        results[name] = {"p50": p50, "p95": p95, "p99": p99}
+
+    return results
+
+
+def _serve_virtual_cannet(host: str, port: int, positioners: Dict[int, List[int]]):
+    """Runs a `.VirtualCANnet` until the process is terminated."""
+
+    async def serve():
+        device = await VirtualCANnet(host, port, positioners).start()
+        assert device._server
+        await device._server.serve_forever()
+
+    asyncio.run(serve())
+
+
+async def benchmark_cannet_receive(
+    n_interfaces: int = 4,
+    n_positioners: int = 500,
+    n_commands: int = 20,
+    receive_workers: bool = False,
+    port: int = 19300,
+) -> Dict[str, float]:
+    r"""Measures the throughput of replies received from CAN\@net devices.
+
+    Starts ``n_interfaces`` `.VirtualCANnet` devices, each one in its own
+    process, listening on ``127.0.0.N`` with ``n_positioners`` virtual
+    positioners split across four buses. A `.CANnetInterface` connects to all
+    the devices and ``n_commands`` ``GET_FIRMWARE_VERSION`` broadcasts are sent,
+    one at a time. Each broadcast is answered by all the positioners.
+
+    Parameters
+    ----------
+    n_interfaces
+        The number of CAN\@net devices.
+    n_positioners
+        The number of positioners per device.
+    n_commands
+        The number of broadcasts to send.
+    receive_workers
+        Whether to read and parse the replies in worker processes (see
+        `.CANNetWorkerBus`).
+    port
+        The port on which the devices listen.
+
+    Returns
+    -------
+    results
+        A dictionary with the number of replies received per second and the mean
+        time per broadcast, in seconds.
+
+    """
+
+    buses = [1, 2, 3, 4]
+    hosts = [f"127.0.0.{ii + 1}" for ii in range(n_interfaces)]
+
+    context = multiprocessing.get_context("spawn")
+    devices = []
+
+    positioner_id = 1
+    for host in hosts:
+        positioners: Dict[int, List[int]] = {bus: [] for bus in buses}
+        for ii in range(n_positioners):
+            positioners[buses[ii % len(buses)]].append(positioner_id)
+            positioner_id += 1
+
+        process = context.Process(
+            target=_serve_virtual_cannet,
+            args=(host, port, positioners),
+            daemon=True,
+        )
+        process.start()
+        devices.append(process)
+
+    n_total = n_interfaces * n_positioners
+
+    can = None
+    try:
+        # Wait until the devices are listening.
+        for host in hosts:
+            for _ in range(100):
+                try:
+                    _, writer = await asyncio.open_connection(host, port)
+                    writer.close()
+                    break
+                except OSError:
+                    await asyncio.sleep(0.1)
+
+        interface_args = {
+            "port": port,
+            "buses": buses,
+            "bitrate": 1000000,
+            "timeout": 1,
+            "receive_workers": receive_workers,
+        }
+        can = CANnetInterface("cannet", channels=hosts, interface_args=interface_args)
+        await can.start()
+
+        if len(can.interfaces) != n_interfaces:
+            raise RuntimeError("Failed connecting to the virtual devices.")
+
+        n_replies = 0
+        t0 = time.perf_counter()
+
+        for _ in range(n_commands):
+            command = GetFirmwareVersion(
+                positioner_ids=0,
+                n_positioners=n_total,
+                timeout=10,
+            )
+
+            assert can.command_queue
+            can.command_queue.put_nowait(command)
+            await command
+
+            n_replies += len(command.replies)
+
+        elapsed = time.perf_counter() - t0
+
+    finally:
+        if can is not None:
+            can.stop()
+        for process in devices:
+            process.terminate()
+            process.join()
+
+    if n_replies < n_commands * n_total:
+        raise RuntimeError(f"Received {n_replies} of {n_commands * n_total} replies.")
+
+    return {
+        "replies_per_second": n_replies / elapsed,
+        "time_per_command": elapsed / n_commands,
+    }
+
+
+async def benchmark_executors(n_calls: int = 20) -> Dict[str, Dict[str, float]]:
+    """Measures the time to run a trivial function with `.run_in_executor`.
+
+    Compares a new executor for each call, as `.run_in_executor` used to do, with
+    the persistent executors returned by `.get_executor`, for thread and process
+    executors. The persistent executors are started before the measurement.
+
+    Parameters
+    ----------
+    n_calls
+        The number of calls for each case.
+
+    Returns
+    -------
+    results
+        A dictionary of executor type to a dictionary with the mean time per call,
+        in seconds, with a ``new`` and a ``persistent`` executor.
+
+    """
+
+    loop = asyncio.get_running_loop()
+
+    pool_classes = {
+        "thread": concurrent.futures.ThreadPoolExecutor,
+        "process": concurrent.futures.ProcessPoolExecutor,
+    }
+
+    results = {}
+    for name, PoolClass in pool_classes.items():
+        t0 = time.perf_counter()
+        for _ in range(n_calls):
+            with PoolClass() as pool:
+                await loop.run_in_executor(pool, abs, -1)
+        new = (time.perf_counter() - t0) / n_calls
+
+        # Start the workers before measuring.
+        get_executor(name)
+        await run_in_executor(abs, -1, executor=name)
+
+        t0 = time.perf_counter()
+        for _ in range(n_calls):
+            await run_in_executor(abs, -1, executor=name)
+        persistent = (time.perf_counter() - t0) / n_calls
+
+        results[name] = {"new": new, "persistent": persistent}
+
+    return results
@@ -11,6 +11,7 @@ from __future__ import annotations
 import asyncio
 import binascii
 import collections
+import itertools
 import pprint
 import re
 import socket
@@ -23,18 +24,31 @@ from typing import (
     Generic,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
-    cast,
 )
 
 import jaeger.core
 from jaeger.core import can_log, config, log, start_file_loggers
 from jaeger.core.exceptions import JaegerCANError
-from jaeger.core.interfaces import BusABC, CANNetBus, Message, Notifier, VirtualBus
+from jaeger.core.interfaces import (
+    BusABC,
+    CANNetBus,
+    CANNetWorkerBus,
+    Message,
+    Notifier,
+    VirtualBus,
+)
 from jaeger.core.maskbits import CommandStatus
+from jaeger.core.metrics import metrics
 from jaeger.core.positioner import Command, CommandID, EmptyPool
-from jaeger.core.utils import Poller, parse_identifier
+from jaeger.core.utils import (
+    AsyncioExecutor,
+    Poller,
+    get_identifier,
+    parse_identifier,
+)
 
 
 try:
@@ -66,6 +80,13 @@ Bus_co = TypeVar("Bus_co", bound="BusABC")
 T = TypeVar("T", bound="JaegerCAN")
 
 
+_FRAMES_SENT = metrics.counter(
+    "jaeger_can_frames_sent_total",
+    "Number of frames sent to an interface.",
+    ["interface"],
+)
+
+
 @dataclass
 class JaegerCAN(Generic[Bus_co]):
     """A CAN interface with a command queue and reply handling.
@@ -92,6 +113,15 @@ class JaegerCAN(Generic[Bus_co]):
     interface_args
         Keyword arguments to pass to the interfaces when
         initialising it (e.g., port, baudrate, etc).
+    io_thread
+        If `True`, the interfaces and the notifier run on their own event loop in
+        a separate thread. Reading and parsing replies and writing messages to
+        the interfaces are then not delayed by other work in the main loop (e.g.,
+        the actor). Commands are still created and completed in the main loop,
+        so the end-to-end latency of a command (from `.send_command` until it
+        is done) is unchanged; only the time a reply waits to be read is
+        reduced. After a collision, ``SEND_TRAJECTORY_ABORT`` is sent from the
+        I/O loop and only the locking of the FPS waits for the main loop.
 
     """
 
@@ -99,6 +129,7 @@ class JaegerCAN(Generic[Bus_co]):
     channels: list | tuple
     fps: Optional[jaeger.core.fps.FPS] = None
     interface_args: Dict[str, Any] = field(default_factory=dict)
+    io_thread: bool = False
 
     def __post_init__(self):
         if self.interface_type not in INTERFACES:
@@ -123,23 +154,40 @@ class JaegerCAN(Generic[Bus_co]):
 
         self.notifier: Notifier | None = None
 
+        # Maps positioner_id to (interface index, bus). Built from the FPS
+        # positioner-to-bus map and used to route and interleave messages.
+        self._routing: Dict[int, Tuple[int, int | None]] = {}
+
+        # The main loop and, if io_thread=True, the executor running the I/O loop.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._io_executor: AsyncioExecutor | None = None
+
+        # Set in the I/O loop when the abort after a collision has been sent, and
+        # cleared in the main loop once the FPS has been locked.
+        self._collision_abort_sent: bool = False
+
     async def start(self: T) -> T:
         self.stop()
 
         itype = self.interface_type
 
-        InterfaceClass: Type[Bus_co] = INTERFACES[itype]["class"]
+        InterfaceClass = self._get_interface_class()
         self.multibus = INTERFACES[itype]["multibus"]
 
         if not isinstance(self.channels, (list, tuple)):
             self.channels = [self.channels]
 
+        self._loop = asyncio.get_running_loop()
+        if self.io_thread:
+            log.debug("starting CAN I/O thread.")
+            self._io_executor = AsyncioExecutor()
+
         for channel in self.channels:
             iargs = "".join([f" {k}={repr(v)}" for k, v in self.interface_args.items()])
             log.debug(f"creating interface {itype}, channel={channel!r}{iargs}.")
             try:
                 interface = InterfaceClass(channel, **self.interface_args)
-                result = await interface.open()
+                result = await self._run_io(interface.open())
                 if result is False:
                     raise ConnectionError()
                 self.interfaces.append(interface)
@@ -156,21 +204,53 @@ class JaegerCAN(Generic[Bus_co]):
         self.command_queue = asyncio.Queue()
         self._command_queue_task = asyncio.create_task(self._process_command_queue())
 
-        self.notifier = Notifier(
-            listeners=[self._process_reply_queue],
-            buses=self.interfaces,
-        )
+        self.notifier = await self._run_io(self._create_notifier())
+
+        self.refresh_routing_table()
 
         self._started = True
 
         return self
 
+    def _get_interface_class(self) -> Type[Bus_co]:
+        """Returns the bus class for the interfaces."""
+
+        return INTERFACES[self.interface_type]["class"]
+
     def stop(self):
         """Stops the interfaces."""
 
-        if self.notifier:
-            self.notifier.stop()
-            self.notifier = None
+        if self._io_executor is not None:
+            # Close the notifier and interfaces in their own loop and wait.
+            future = asyncio.run_coroutine_threadsafe(
+                self._stop_io(),
+                self._io_executor.loop,
+            )
+            try:
+                future.result(timeout=5)
+            except Exception as err:
+                log.warning(f"Failed stopping the CAN I/O loop: {err}")
+
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
+
+        else:
+            if self.notifier:
+                self.notifier.stop()
+
+            self._close_interfaces()
+
+        self.notifier = None
+        self.interfaces = []
+        self._routing = {}
+
+        if self._command_queue_task:
+            self._command_queue_task.cancel()
+
+        self._started = False
+
+    def _close_interfaces(self):
+        """Closes the interfaces."""
 
         for interface in self.interfaces:
             interface: Any
@@ -179,12 +259,56 @@ class JaegerCAN(Generic[Bus_co]):
             except AttributeError:
                 pass
 
-        self.interfaces = []
+    async def _stop_io(self):
+        """Stops the notifier and closes the interfaces in the I/O loop."""
 
-        if self._command_queue_task:
-            self._command_queue_task.cancel()
+        if self.notifier:
+            self.notifier.stop()
+            await asyncio.gather(*self.notifier.tasks, return_exceptions=True)
 
-        self._started = False
+        self._close_interfaces()
+
+    async def _create_notifier(self) -> Notifier:
+        """Creates the notifier. Must run in the I/O loop."""
+
+        return Notifier(
+            listeners=[self._process_reply_queue],
+            buses=self.interfaces,
+        )
+
+    async def _run_io(self, coro):
+        """Runs a coroutine in the I/O loop and waits for the result."""
+
+        if self._io_executor is None:
+            return await coro
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._io_executor.loop)
+        return await asyncio.wrap_future(future)
+
+    def _call_io(self, callback, *args):
+        """Schedules a callback in the I/O loop, or calls it immediately."""
+
+        if self._io_executor is None:
+            return callback(*args)
+
+        self._io_executor.loop.call_soon_threadsafe(callback, *args)
+
+    async def _run_main(self, coro):
+        """Runs a coroutine in the main loop and waits for the result."""
+
+        if self._io_executor is None or self._loop is None:
+            return await coro
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return await asyncio.wrap_future(future)
+
+    def _create_main_task(self, coro):
+        """Creates a task in the main loop."""
+
+        if self._io_executor is None or self._loop is None:
+            return asyncio.create_task(coro)
+
+        self._loop.call_soon_threadsafe(self._loop.create_task, coro)
 
     @classmethod
     async def create(
@@ -194,6 +318,7 @@ class JaegerCAN(Generic[Bus_co]):
         interface_type: Optional[str] = None,
         channels: list | tuple = [],
         interface_args: Dict[str, Any] = {},
+        io_thread: bool = False,
     ) -> "JaegerCAN":
         """Create and initialise a new bus interface from a configuration profile.
 
@@ -214,6 +339,9 @@ class JaegerCAN(Generic[Bus_co]):
         interface_args
             Keyword arguments to pass to the interfaces when
             initialising it (e.g., port, baudrate, etc).
+        io_thread
+            Whether to run the interfaces in a separate thread. Can be overridden
+            by the ``io_thread`` key in the profile.
 
         """
 
@@ -243,6 +371,8 @@ class JaegerCAN(Generic[Bus_co]):
             else:
                 raise KeyError("channel or channels key not found.")
 
+            io_thread = config_data.pop("io_thread", io_thread)
+
             interface_args = config_data
 
         elif profile is not None and interface_type is not None:
@@ -258,6 +388,7 @@ class JaegerCAN(Generic[Bus_co]):
             channels=channels,
             fps=fps,
             interface_args=interface_args,
+            io_thread=io_thread,
         )
 
         await instance.start()
@@ -270,6 +401,75 @@ class JaegerCAN(Generic[Bus_co]):
         rc = self.running_commands
         self.running_commands = {key: cmd for key, cmd in rc.items() if not cmd.done()}
 
+    def refresh_routing_table(self):
+        """Rebuilds the positioner to ``(interface index, bus)`` routing table.
+
+        Must be called when the FPS positioner-to-bus map changes. Positioners
+        not yet in the table are routed lazily by `.get_route`.
+
+        """
+
+        self._routing = {}
+
+        if self.fps is None:
+            return
+
+        for positioner_id in self.fps.positioner_to_bus:
+            self.get_route(positioner_id)
+
+    def get_route(self, positioner_id: int) -> Tuple[int, int | None] | None:
+        """Returns the interface index and bus for a positioner.
+
+        Returns `None` if the positioner is not in the positioner-to-bus map, in
+        which case messages must be sent to all the interfaces and buses.
+
+        """
+
+        if positioner_id in self._routing:
+            return self._routing[positioner_id]
+
+        if self.fps is None or positioner_id not in self.fps.positioner_to_bus:
+            return None
+
+        interface, bus = self.fps.positioner_to_bus[positioner_id]
+        if interface not in self.interfaces:
+            return None
+
+        route = (self.interfaces.index(interface), bus)
+        self._routing[positioner_id] = route
+
+        return route
+
+    def _interleave_messages(self, messages: list) -> list:
+        """Returns a list of ``(message, route)`` sorted round-robin by bus.
+
+        Messages for the same bus keep their relative order, so the order of the
+        messages sent to each positioner is preserved. Messages without a route
+        (broadcasts or unmapped positioners) have ``route=None``.
+
+        """
+
+        is_multibus = self.multibus or len(self.interfaces) > 1
+        if not is_multibus:
+            return [(message, None) for message in messages]
+
+        by_route: Dict[Tuple[int, int | None] | None, list] = {}
+        for message in messages:
+            route = None
+            if message.positioner_id != 0:
+                route = self.get_route(message.positioner_id)
+            by_route.setdefault(route, []).append((message, route))
+
+        if len(by_route) == 1:
+            return next(iter(by_route.values()))
+
+        return [
+            item
+            for group in itertools.zip_longest(*by_route.values())
+            for item in group
+            if item is not None
+        ]
+
     async def _process_command_queue(self):
         """Processes messages in the command queue."""
 
@@ -295,8 +495,17 @@ class JaegerCAN(Generic[Bus_co]):
                 if cmd.positioner_ids == [0]:
                     # We'll ignore this case silently since generally this happens only
                     # with GET_FIRMWARE or GET_STATUS that can usually be delayed.
-                    loop = asyncio.get_event_loop()
-                    loop.call_later(1, self.command_queue.put_nowait, cmd)
+                    # The broadcast UID is in use by another broadcast of the same
+                    # command (e.g., from a poller). Queue the command again as soon
+                    # as that one finishes and releases the UID.
+                    running = self.running_commands.get(cmd.command_id << 15, None)
+                    if running is not None and not running.done():
+                        running.add_done_callback(
+                            lambda _, cmd=cmd: self.command_queue.put_nowait(cmd)
+                        )
+                    else:
+                        loop = asyncio.get_event_loop()
+                        loop.call_later(1, self.command_queue.put_nowait, cmd)
                     continue
             except jaeger.core.JaegerError as ee:
                 can_log.error(f"found error while getting messages: {ee}")
@@ -310,17 +519,14 @@ class JaegerCAN(Generic[Bus_co]):
         if command_id == CommandID.COLLISION_DETECTED:
             # Sending stop trajectories causes many more robots to report a collision
             # so if the FPS has already been locked we ignore those.
-            if not self.fps or self.fps.locked:
+            if not self.fps or self.fps.locked or self._collision_abort_sent:
                 return
 
-            log.error(
-                f"A collision was detected in positioner {positioner_id}. "
-                "Sending SEND_TRAJECTORY_ABORT and locking the FPS."
-            )
-
-            if self.fps:
-                await self.fps.lock(by=[positioner_id])
-                return
+            # Stop the positioners from this loop, without waiting for the main
+            # loop, and then lock the FPS in the main loop.
+            self._send_collision_abort()
+            self._create_main_task(self._handle_collision(positioner_id))
+            return
 
         if command_id == 0:
             can_log.warning(
@@ -332,17 +538,18 @@ class JaegerCAN(Generic[Bus_co]):
 
         command_id_flag = CommandID(command_id)
 
-        self.refresh_running_commands()
-
+        # Completed commands are pruned when new commands are sent, so they may
+        # still be in the running commands. Skip them here instead of rebuilding
+        # the dictionary for each reply.
         cmd_key = (positioner_id << 25) + (command_id << 15) + reply_uid
+        running_cmd = self.running_commands.get(cmd_key, None)
 
-        if cmd_key in self.running_commands:
-            running_cmd = self.running_commands[cmd_key]
-        elif (command_id << 15) + reply_uid in self.running_commands:
+        if running_cmd is None or running_cmd.done():
             # Checks if the reply corresponds to a broadcast.
             cmd_key = (command_id << 15) + reply_uid
-            running_cmd = self.running_commands[cmd_key]
-        else:
+            running_cmd = self.running_commands.get(cmd_key, None)
+
+        if running_cmd is None or running_cmd.done():
             can_log.debug(
                 f"[{command_id_flag.name}, {positioner_id}]: "
                 f"cannot find a matching running command."
@@ -364,7 +571,81 @@ class JaegerCAN(Generic[Bus_co]):
             f"to command {running_cmd.command_uid}."
         )
 
-        asyncio.create_task(running_cmd.process_reply(msg))
+        self._create_main_task(running_cmd.process_reply(msg))
+
+    def _send_collision_abort(self):
+        """Sends ``SEND_TRAJECTORY_ABORT`` to all the positioners.
+
+        Called after a collision from the loop that processes the replies. The
+        messages are written directly to the interfaces, without creating a
+        command, so that the abort does not depend on the main loop. Replies to
+        the abort are ignored.
+
+        """
+
+        assert self.fps
+
+        self._collision_abort_sent = True
+
+        command_id = int(CommandID.SEND_TRAJECTORY_ABORT)
+        is_multibus = self.multibus or len(self.interfaces) > 1
+
+        batch: List[Tuple[BusABC, Message, int | None]] = []
+        for pid in list(self.fps.keys()):
+            positioner = self.fps.get(pid, None)
+            if positioner is None or positioner.disabled:
+                continue
+
+            message = Message(
+                arbitration_id=get_identifier(pid, command_id),
+                is_extended_id=True,
+                data=bytearray([]),
+            )
+
+            route = self.get_route(pid) if is_multibus else None
+            if route is None:
+                for iface in self.interfaces:
+                    batch.append((iface, message, None))
+            else:
+                iface_idx, bus = route
+                batch.append((self.interfaces[iface_idx], message, bus))
+
+        self._send_batch(batch)
+
+    async def _handle_collision(self, positioner_id: int):
+        """Locks the FPS after a collision. Runs in the main loop.
+
+        ``SEND_TRAJECTORY_ABORT`` has already been sent by
+        `._send_collision_abort`. The FPS is marked as locked immediately so that
+        no new moves are accepted. Then the running move commands are cancelled
+        and, once the positioners have stopped, the lock is reported.
+
+        """
+
+        try:
+            if not self.fps or self.fps.locked:
+                return
+
+            self.fps._set_locked(by=[positioner_id])
+
+            log.error(
+                f"A collision was detected in positioner {positioner_id}. "
+                "SEND_TRAJECTORY_ABORT has been sent. Locking the FPS."
+            )
+
+            for command in list(self.running_commands.values()):
+                if command.move_command and not command.done():
+                    command.cancel(silent=True)
+
+            self.refresh_running_commands()
+
+            # Give the positioners time to stop before requesting their status.
+            await asyncio.sleep(0.5)
+
+            await self.fps.lock(by=[positioner_id], stop_trajectories=False)
+
+        finally:
+            self._collision_abort_sent = False
 
     def send_messages(self, cmd: Command):
         """Sends messages to the interface.
@@ -392,7 +673,14 @@ class JaegerCAN(Generic[Bus_co]):
 
         messages = cmd.get_messages()
 
-        for message in messages:
+        self.refresh_running_commands()
+
+        # With io_thread, the messages are written in the I/O loop in one batch.
+        batch: List[Tuple[BusABC, Message, int | None]] = []
+
+        # Interleave the messages so that all the buses transmit in parallel
+        # instead of saturating one bus at a time.
+        for message, route in self._interleave_messages(messages):
             if cmd.status.failed:
                 can_log.debug(
                     f"{log_header} not sending more messages "
@@ -405,18 +693,17 @@ class JaegerCAN(Generic[Bus_co]):
             cmd_key += message.uid
 
             self.running_commands[cmd_key] = message.command
+            cmd.add_message_route(message, route)
 
             # Get the interface and buses to which to send this command.
-            interfaces = self.interfaces
-            bus = None
-            is_multibus = self.multibus or len(self.interfaces) > 1
-            if is_multibus and message.positioner_id != 0:
-                if self.fps and message.positioner_id in self.fps.positioner_to_bus:
-                    interface, bus = self.fps.positioner_to_bus[message.positioner_id]
-                    interfaces = [cast(Bus_co, interface)]
-
-            for iface in interfaces:
-                iface_idx = self.interfaces.index(iface)
+            if route is None:
+                bus = None
+                interfaces = enumerate(self.interfaces)
+            else:
+                iface_idx, bus = route
+                interfaces = [(iface_idx, self.interfaces[iface_idx])]
+
+            for iface_idx, iface in interfaces:
                 data_hex = binascii.hexlify(message.data).decode()
                 can_log.debug(
                     log_header + "sending message with "
@@ -427,13 +714,30 @@ class JaegerCAN(Generic[Bus_co]):
                     f"bus={0 if not bus else bus!r}."
                 )
 
-                if bus:
+                if self._io_executor is not None:
+                    batch.append((iface, message, bus))
+                elif bus:
                     iface.send(message, bus=bus)  # type: ignore
                 else:
                     iface.send(message)
 
+                if metrics.enabled:
+                    _FRAMES_SENT.inc(labels=(str(iface.channel),))
+
         cmd.status = CommandStatus.RUNNING
 
+        if len(batch) > 0:
+            self._call_io(self._send_batch, batch)
+
+    def _send_batch(self, batch: List[Tuple[BusABC, Message, int | None]]):
+        """Writes a batch of messages to the interfaces."""
+
+        for iface, message, bus in batch:
+            if bus:
+                iface.send(message, bus=bus)  # type: ignore
+            else:
+                iface.send(message)
+
     @staticmethod
     def print_profiles() -> List[str]:
         """Prints interface profiles and returns a list of profile names."""
@@ -487,6 +791,9 @@ class CANnetInterface(JaegerCAN[CANNetBus]):
     This class bahaves as `.JaegerCAN` but allows communication with the
     device itself and tracks its status.
 
+    If ``receive_workers=True`` is passed in the interface arguments, each
+    device is read and parsed in its own process (see `.CANNetWorkerBus`).
+
     """
 
     status_interval: float = 5
@@ -497,6 +804,12 @@ class CANnetInterface(JaegerCAN[CANNetBus]):
 
         self.device_status_poller: Poller | None = None
 
+    def _get_interface_class(self) -> Type[CANNetBus]:
+        if self.interface_args.get("receive_workers", False):
+            return CANNetWorkerBus
+
+        return CANNetBus
+
     async def start(self):
         r"""Starts CAN\@net connection."""
 
@@ -508,8 +821,8 @@ class CANnetInterface(JaegerCAN[CANNetBus]):
         # Get ID and version of interfaces. No need to ask for this in each
         # status poll.
         for interface in self.interfaces:
-            interface.write("DEV IDENTIFY")
-            interface.write("DEV VERSION")
+            self._call_io(interface.write, "DEV IDENTIFY")
+            self._call_io(interface.write, "DEV VERSION")
 
         # We use call_soon later to be sure the event loop is running when we start
         # the poller. This prevents problems when using the library in IPython.
@@ -646,4 +959,4 @@ class CANnetInterface(JaegerCAN[CANNetBus]):
 
         for interface in self.interfaces:
             for bus in interface.buses:
-                interface.write(f"CAN {bus} STATUS")
+                self._call_io(interface.write, f"CAN {bus} STATUS")
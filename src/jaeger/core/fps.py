@@ -9,6 +9,11 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
+import os
+import pathlib
+import time
 import warnings
 from dataclasses import dataclass
 
@@ -23,6 +28,7 @@ from typing import (
 )
 
 import numpy
+from packaging.version import Version
 from typing_extensions import Self
 
 import jaeger.core
@@ -32,19 +38,40 @@ from jaeger.core.exceptions import (
     FPSLockedError,
     JaegerError,
     JaegerUserWarning,
-    PositionerError,
 )
 from jaeger.core.interfaces import BusABC
-from jaeger.core.maskbits import FPSStatus, PositionerStatus
+from jaeger.core.maskbits import (
+    CommandStatus,
+    FPSStatus,
+    PositionerStatus,
+    ResponseCode,
+)
+from jaeger.core.metrics import MetricsServer, collect_fps_metrics, metrics
 from jaeger.core.positioner import Positioner
 from jaeger.core.positioner.commands import (
     Command,
     CommandID,
+    GetActualPosition,
     GetFirmwareVersion,
     goto,
     send_trajectory,
 )
-from jaeger.core.utils import Poller, PollerList
+from jaeger.core.shared import SharedStateWriter
+from jaeger.core.streaming import TelemetryStreamServer
+from jaeger.core.telemetry import (
+    TelemetryArchive,
+    TelemetryEvent,
+    TelemetryHistory,
+    TelemetryHub,
+    TelemetrySubscription,
+    get_state_array,
+)
+from jaeger.core.utils import (
+    Poller,
+    PollerList,
+    prewarm_process_executor,
+    shutdown_executors,
+)
 
 
 try:
@@ -61,6 +88,12 @@ LOCK_FILE = "/var/tmp/sdss/jaeger.lock"
 
 _FPS_INSTANCES: dict[Type[BaseFPS], BaseFPS] = {}
 
+_LOCK_EVENTS = metrics.counter(
+    "jaeger_fps_lock_events_total",
+    "Number of times the FPS has been locked or unlocked.",
+    ["event"],
+)
+
 
 class BaseFPS(Dict[int, Positioner]):
     """A class describing the Focal Plane System.
@@ -99,8 +132,83 @@ class BaseFPS(Dict[int, Positioner]):
         dict.__init__(new_obj, {})
         new_obj.initialised = False
 
+        new_obj._disabled_ids = set()
+        new_obj._offline_ids = set()
+        new_obj._bootloader_ids = set()
+        new_obj._no_firmware_ids = set()
+
         return new_obj
 
+    def __setitem__(self, positioner_id: int, positioner: Positioner):
+        dict.__setitem__(self, positioner_id, positioner)
+        self._update_index(positioner)
+
+    def __delitem__(self, positioner_id: int):
+        dict.__delitem__(self, positioner_id)
+        self._remove_from_index(positioner_id)
+
+    def pop(self, positioner_id: int, *args):
+        positioner = dict.pop(self, positioner_id, *args)
+        self._remove_from_index(positioner_id)
+
+        return positioner
+
+    def clear(self):
+        dict.clear(self)
+        for ids in self._get_indexes():
+            ids.clear()
+
+    def _get_indexes(self) -> List[set[int]]:
+        """Returns the index sets."""
+
+        return [
+            self._disabled_ids,
+            self._offline_ids,
+            self._bootloader_ids,
+            self._no_firmware_ids,
+        ]
+
+    def _update_index(self, positioner: Positioner):
+        """Updates the index sets for a positioner.
+
+        The sets of disabled, offline, bootloader, and no-firmware positioners
+        are kept up to date as positioners are added or removed, or their
+        ``disabled``, ``offline``, or ``firmware`` attributes change, so that
+        checks that would require iterating over all the positioners become
+        set operations.
+
+        """
+
+        positioner_id = positioner.positioner_id
+        if dict.get(self, positioner_id, None) is not positioner:
+            return
+
+        is_bootloader = positioner.is_bootloader()
+
+        values = [
+            positioner.disabled,
+            positioner.offline,
+            is_bootloader is True,
+            is_bootloader is None,
+        ]
+        for ids, value in zip(self._get_indexes(), values):
+            if value:
+                ids.add(positioner_id)
+            else:
+                ids.discard(positioner_id)
+
+    def _remove_from_index(self, positioner_id: int):
+        """Removes a positioner from the index sets."""
+
+        for ids in self._get_indexes():
+            ids.discard(positioner_id)
+
+    @property
+    def connected(self) -> set[int]:
+        """The set of positioners that are not offline."""
+
+        return self.keys() - self._offline_ids
+
     @classmethod
     def get_instance(cls, *args, **kwargs) -> Self:
         """Returns the running instance."""
@@ -214,22 +322,138 @@ class FPS(BaseFPS):
 
         self.disabled: set[int] = set([])
 
-        self.__status_event = asyncio.Event()
+        # Positioners that have stopped replying. They are excluded from the
+        # expected replies and default target lists until they reply again.
+        self.quarantined: set[int] = set([])
+        self._n_missed: Dict[int, int] = {}
 
-        # Position and status pollers
-        self.pollers = PollerList(
-            [
-                Poller(
-                    "status",
-                    self.update_status,
-                    delay=config["fps"]["status_poller_delay"],
-                ),
-                Poller(
-                    "position",
-                    self.update_position,
-                    delay=config["fps"]["position_poller_delay"],
-                ),
-            ]
+        # Consecutive roster updates that a positioner has not replied to.
+        self._n_roster_missed: Dict[int, int] = {}
+
+        # Publishes status changes and positioner updates to subscribers.
+        self.hub = TelemetryHub()
+
+        # Unix time of the last status or position update of each positioner.
+        self.telemetry_times: Dict[int, float] = {}
+
+        # Unix time at which the GET_STATUS broadcast of the last full status
+        # update was sent, and an event set when a new one is applied.
+        self._status_sent_time: float | None = None
+        self._status_update_event = asyncio.Event()
+
+        # In-memory history of statuses and positions.
+        history_config = config["fps"].get("history", None) or {}
+        if history_config.get("enabled", False):
+            self.history = TelemetryHistory(
+                size=history_config.get("size", 1000),
+                max_positioners=history_config.get("max_positioners", 600),
+            )
+        else:
+            self.history = None
+
+        # Persistent archive of statuses, positions, and reply latencies.
+        archive_config = config["fps"].get("archive", None) or {}
+        if archive_config.get("enabled", False):
+            self.archive = TelemetryArchive(
+                archive_config.get("path", "~/.jaeger/telemetry"),
+                segment_size=archive_config.get("segment_size", 1_000_000),
+                batch_size=archive_config.get("batch_size", 5000),
+                flush_interval=archive_config.get("flush_interval", 10.0),
+            )
+        else:
+            self.archive = None
+
+        # Local binary stream of the FPS state.
+        stream_config = config["fps"].get("stream", None) or {}
+        if stream_config.get("enabled", False):
+            self.stream = TelemetryStreamServer(
+                self,
+                path=stream_config.get("path", None),
+                host=stream_config.get("host", "127.0.0.1"),
+                port=stream_config.get("port", 19995),
+                max_rate=stream_config.get("max_rate", 10.0),
+                max_buffer=stream_config.get("max_buffer", 1_000_000),
+                max_dropped=stream_config.get("max_dropped", 100),
+            )
+        else:
+            self.stream = None
+
+        # Shared memory export of the FPS state.
+        shared_config = config["fps"].get("shared_state", None) or {}
+        if shared_config.get("enabled", False):
+            self.shared_state = SharedStateWriter(
+                name=shared_config.get("name", "jaeger_fps_state"),
+                capacity=shared_config.get("capacity", 600),
+            )
+        else:
+            self.shared_state = None
+
+        # Prometheus metrics endpoint.
+        metrics_config = config["fps"].get("metrics", None) or {}
+        if metrics.enabled:
+            metrics.set_collector("fps", lambda: collect_fps_metrics(self))
+            self.metrics_server = MetricsServer(
+                metrics,
+                host=metrics_config.get("host", "127.0.0.1"),
+                port=metrics_config.get("port", 19996),
+            )
+        else:
+            self.metrics_server = None
+
+        # Starts the worker processes of the shared process executor.
+        self._prewarm_task: asyncio.Task | None = None
+
+        # Position and status pollers, or a single poller that updates both.
+        overrun = config["fps"].get("poller_overrun", "skip")
+        if config["fps"].get("combined_telemetry", False):
+            self.pollers = PollerList(
+                [
+                    Poller(
+                        "telemetry",
+                        self._poll_telemetry,
+                        delay=min(
+                            config["fps"]["status_poller_delay"],
+                            config["fps"]["position_poller_delay"],
+                        ),
+                        overrun=overrun,
+                    ),
+                ]
+            )
+        else:
+            self.pollers = PollerList(
+                [
+                    Poller(
+                        "status",
+                        self._poll_status,
+                        delay=config["fps"]["status_poller_delay"],
+                        overrun=overrun,
+                    ),
+                    Poller(
+                        "position",
+                        self._poll_position,
+                        delay=config["fps"]["position_poller_delay"],
+                        overrun=overrun,
+                    ),
+                ]
+            )
+
+        # The current poller policy and the number of nested suspensions.
+        self._poller_policy: str | None = None
+        self._n_suspended: int = 0
+        self._resume_pollers: bool = False
+
+        # Low-rate poller that probes quarantined positioners.
+        self.quarantine_poller = Poller(
+            "quarantine",
+            self._probe_quarantined,
+            delay=config["fps"].get("quarantine_probe_delay", 30),
+        )
+
+        # Low-rate poller that looks for new, changed, or vanished positioners.
+        self.hotplug_poller = Poller(
+            "hotplug",
+            self._check_hotplug,
+            delay=config["fps"].get("hotplug_poller_delay", 60),
         )
 
     @classmethod
@@ -342,6 +566,12 @@ class FPS(BaseFPS):
         self.clear()
         self.positioner_to_bus = {}
 
+        self.quarantined = set([])
+        self._n_missed = {}
+        self._n_roster_missed = {}
+        await self.quarantine_poller.stop()
+        await self.hotplug_poller.stop()
+
         # Stop pollers while initialising
         if self.pollers.running:
             await self.pollers.stop()
@@ -355,24 +585,27 @@ class FPS(BaseFPS):
             warnings.warn("CAN interfaces not found.", JaegerUserWarning)
             return self
 
-        # Get the positioner-to-bus map
-        await self._get_positioner_bus_map()
+        # Try to confirm the cached layout. If that fails, do a full discovery.
+        get_fw_command = await self._warm_start()
 
-        # Stop poller in case they are running
-        await self.pollers.stop()
+        if get_fw_command is None:
+            # Get the positioner-to-bus map
+            await self._get_positioner_bus_map()
 
-        get_fw_command = self.send_command(
-            CommandID.GET_FIRMWARE_VERSION,
-            positioner_ids=0,
-            timeout=config["fps"]["initialise_timeouts"],
-        )
+            # Stop poller in case they are running
+            await self.pollers.stop()
+
+            get_fw_command = await self._send_discovery_broadcast(
+                CommandID.GET_FIRMWARE_VERSION
+            )
 
         assert isinstance(get_fw_command, GetFirmwareVersion)
-        await get_fw_command
 
         if get_fw_command.status.failed:
             raise JaegerError("Failed retrieving firmware version.")
 
+        firmwares = get_fw_command.get_firmware()
+
         # Loops over each reply and set the positioner status to OK. If the
         # positioner was not in the list, adds it.
         for reply in get_fw_command.replies:
@@ -387,7 +620,7 @@ class FPS(BaseFPS):
 
             positioner = self.positioners[reply.positioner_id]
             positioner.fps = self
-            positioner.firmware = get_fw_command.get_firmware()[reply.positioner_id]
+            positioner.firmware = firmwares[reply.positioner_id]
 
             if (
                 positioner.positioner_id in config["fps"]["disabled_positioners"]
@@ -416,6 +649,8 @@ class FPS(BaseFPS):
         # Mark as initialised here although we have some more work to do.
         self.initialised = True
 
+        self._save_roster()
+
         positioners = self.positioners.values()
         c_pids = sorted([pp.positioner_id for pp in positioners if not pp.offline])
         if len(c_pids) > 0:
@@ -435,18 +670,12 @@ class FPS(BaseFPS):
             await self.stop_trajectory()
 
         # Initialise positioners
-        try:
-            disable_precise_moves = config["positioner"]["disable_precise_moves"]
-            # if disable_precise_moves:
-            #     warnings.warn("Disabling precise moves.", JaegerUserWarning)
-            pos_initialise = [
-                positioner.initialise(disable_precise_moves=disable_precise_moves)
-                for positioner in self.values()
-                if positioner.offline is False
-            ]
-            await asyncio.gather(*pos_initialise)
-        except (JaegerError, PositionerError) as err:
-            raise JaegerError(f"Some positioners failed to initialise: {err}")
+        disable_precise_moves = config["positioner"]["disable_precise_moves"]
+        failed = await self._initialise_positioners(disable_precise_moves)
+        if len(failed) > 0:
+            raise JaegerError(
+                f"Some positioners failed to initialise: {sorted(failed)}"
+            )
 
         if disable_precise_moves is True and any(
             [self[i].precise_moves for i in self if self[i].offline is False]
@@ -494,8 +723,352 @@ class FPS(BaseFPS):
                 JaegerUserWarning,
             )
 
+        await self._set_loop_modes()
+
+        # Issue an update status to get the status set.
+        await self.update_status()
+
+        # Start the pollers
+        if start_pollers and not self.is_bootloader():
+            self.pollers.start()
+            if config["fps"].get("hotplug_poller_delay", None):
+                self.hotplug_poller.start()
+
+        if self.stream is not None:
+            await self.stream.start()
+
+        if self.metrics_server is not None:
+            await self.metrics_server.start()
+
+        executor_config = config.get("executors", None) or {}
+        if executor_config.get("prewarm", False) and self._prewarm_task is None:
+            self._prewarm_task = asyncio.create_task(prewarm_process_executor())
+
+        return self
+
+    async def update_roster(self) -> Tuple[List[int], List[int]]:
+        """Incrementally updates the list of connected positioners.
+
+        Unlike `.initialise`, the FPS is not cleared. A ``GET_FIRMWARE_VERSION``
+        broadcast is compared with the current positioners. New positioners and
+        positioners whose firmware or bus have changed are initialised, and
+        positioners that miss ``fps.roster_remove_threshold`` consecutive replies
+        are removed. Offline and quarantined positioners are not affected.
+
+        Returns
+        -------
+        diff
+            A tuple with the lists of added or changed positioners and of removed
+            positioners.
+
+        """
+
+        if not self.initialised:
+            raise JaegerError("The FPS has not been initialised.")
+
+        assert isinstance(self.can, JaegerCAN), "CAN connection not established."
+
+        connected = [pid for pid in self if self[pid].offline is False]
+
+        get_fw_command = await self._send_discovery_broadcast(
+            CommandID.GET_FIRMWARE_VERSION,
+            roster=[pid for pid in connected if pid not in self.quarantined],
+        )
+        assert isinstance(get_fw_command, GetFirmwareVersion)
+
+        if get_fw_command.status.failed:
+            raise JaegerError("Failed retrieving firmware version.")
+
+        firmwares = get_fw_command.get_firmware()
+        replies = {reply.positioner_id: reply for reply in get_fw_command.replies}
+
+        changed = []
+        for pid, reply in replies.items():
+            if pid in self and self[pid].offline:
+                continue
+
+            if hasattr(reply.message, "interface"):
+                route = (reply.message.interface, reply.message.bus)
+            else:
+                route = None
+
+            if pid not in self:
+                if route:
+                    self.add_positioner(pid, interface=route[0], bus=route[1])
+                else:
+                    self.add_positioner(pid)
+            elif (
+                self[pid].firmware == firmwares[pid]
+                and self.positioner_to_bus.get(pid, None) == route
+            ):
+                continue
+            elif route:
+                self.positioner_to_bus[pid] = route
+
+            self[pid].firmware = firmwares[pid]
+            if pid in config["fps"]["disabled_positioners"] or pid in self.disabled:
+                self[pid].disabled = True
+                self.disabled.add(pid)
+
+            changed.append(pid)
+
+        removed = []
+        threshold = config["fps"].get("roster_remove_threshold", 1) or 1
+        for pid in connected:
+            if pid in replies:
+                self._n_roster_missed.pop(pid, None)
+                continue
+            elif pid in self.quarantined:
+                # Quarantined positioners are not expected to reply. They are
+                # probed by the quarantine poller instead.
+                continue
+
+            self._n_roster_missed[pid] = self._n_roster_missed.get(pid, 0) + 1
+            if self._n_roster_missed[pid] >= threshold:
+                removed.append(pid)
+
+        for pid in removed:
+            self.pop(pid)
+            self.positioner_to_bus.pop(pid, None)
+            self._n_missed.pop(pid, None)
+            self._n_roster_missed.pop(pid, None)
+
+        if len(removed) > 0:
+            warnings.warn(
+                f"Positioners {removed} have been removed.", JaegerUserWarning
+            )
+
+        if len(changed) == 0 and len(removed) == 0:
+            return ([], [])
+
+        self.can.refresh_routing_table()
+        self._save_roster()
+
+        if len(changed) == 0:
+            return ([], removed)
+
+        log.info(f"Initialising new or changed positioners: {changed}.")
+
+        disable_precise_moves = config["positioner"]["disable_precise_moves"]
+        failed = await self._initialise_positioners(
+            disable_precise_moves,
+            positioner_ids=changed,
+        )
+        if len(failed) > 0:
+            raise JaegerError(
+                f"Some positioners failed to initialise: {sorted(failed)}"
+            )
+
+        collided = [pid for pid in changed if self[pid].collision]
+        if len(collided) > 0 and not self.locked:
+            await self.lock(by=collided, do_warn=False, snapshot=False)
+            warnings.warn(
+                "A new positioner is collided. The FPS has been locked.",
+                JaegerUserWarning,
+            )
+
+        await self._set_loop_modes(
+            positioner_ids=[pid for pid in changed if not self[pid].is_bootloader()]
+        )
+
+        return (changed, removed)
+
+    async def _check_hotplug(self):
+        """Updates the roster if the FPS is not busy. Used by the hot-plug poller.
+
+        The main pollers are stopped while trajectories or firmware are being
+        sent, so the check is skipped if they are not running.
+
+        """
+
+        if not self.initialised or self.locked or self.moving:
+            return
+
+        if not self.pollers.running or self.is_bootloader():
+            return
+
+        changed, removed = await self.update_roster()
+        if len(changed) > 0 or len(removed) > 0:
+            if jaeger.core.actor_instance:
+                jaeger.core.actor_instance.write("i", {"n_positioners": len(self)})
+
+    async def _initialise_positioners(
+        self,
+        disable_precise_moves: bool = False,
+        positioner_ids: Optional[List[int]] = None,
+    ) -> Dict[int, str]:
+        """Initialises all the connected positioners.
+
+        Equivalent to calling `.Positioner.initialise` for each positioner, but
+        each step is sent as a single command to all the positioners. Positioners
+        that fail a step are not included in the following ones. The firmware
+        version must have already been set.
+
+        If ``positioner_ids`` is passed, only those positioners are initialised.
+
+        Returns a dictionary of positioner ID to error message for the positioners
+        that failed to initialise.
+
+        """
+
+        failed: Dict[int, str] = {}
+
+        if positioner_ids is None:
+            positioner_ids = list(self.positioners)
+
+        pids = [pid for pid in positioner_ids if self[pid].offline is False]
+        for pid in pids:
+            firmware = self[pid].firmware
+            self[pid].reset()
+            self[pid].firmware = firmware
+
+        status_cmd = await self._send_initialise_step(
+            CommandID.GET_STATUS,
+            pids,
+            failed,
+            "cannot get status.",
+            timeout=1,
+        )
+        if status_cmd is not None:
+            status = status_cmd.get_positioner_status()  # type: ignore
+            for pid, status_int in status.items():
+                if pid in self and pid not in failed:
+                    await self[pid].update_status(status_int)
+
+        # Positioners in bootloader mode are done at this point.
+        pids = [
+            pid for pid in pids if pid not in failed and not self[pid].is_bootloader()
+        ]
+        for pid in pids:
+            if not self[pid].initialised:
+                failed[pid] = "failed initialising."
+
+        pids = [pid for pid in pids if pid not in failed]
+        position_cmd = await self._send_initialise_step(
+            CommandID.GET_ACTUAL_POSITION,
+            pids,
+            failed,
+            "failed updating position.",
+            timeout=1,
+        )
+        if position_cmd is not None:
+            positions = position_cmd.get_positions()  # type: ignore
+            for pid, position in positions.items():
+                if pid in self and pid not in failed:
+                    await self[pid].update_position(position)
+
+        # Set the default speed and precise moves mode for enabled positioners.
+        enabled = [pid for pid in pids if pid not in failed and not self[pid].disabled]
+        speed = config["positioner"]["motor_speed"]
+        await self._send_initialise_step(
+            CommandID.SET_SPEED,
+            enabled,
+            failed,
+            "failed setting speed.",
+            alpha=float(speed),
+            beta=float(speed),
+        )
+
+        precise_mode = not disable_precise_moves
+        precise = []
+        for pid in enabled:
+            if pid in failed:
+                continue
+
+            self[pid].speed = (speed, speed)
+
+            firmware = self[pid].firmware
+            if firmware and Version(firmware) >= Version("04.01.17"):
+                precise.append(pid)
+
+        if precise_mode:
+            alpha_id = CommandID.SWITCH_ON_PRECISE_MOVE_ALPHA
+            beta_id = CommandID.SWITCH_ON_PRECISE_MOVE_BETA
+        else:
+            alpha_id = CommandID.SWITCH_OFF_PRECISE_MOVE_ALPHA
+            beta_id = CommandID.SWITCH_OFF_PRECISE_MOVE_BETA
+
+        await asyncio.gather(
+            *[
+                self._send_initialise_step(
+                    command_id,
+                    precise,
+                    failed,
+                    "failed switching precise moves.",
+                )
+                for command_id in [alpha_id, beta_id]
+            ]
+        )
+
+        for pid in pids:
+            if pid in failed:
+                continue
+
+            if pid in precise or self[pid].disabled:
+                self[pid].precise_moves = precise_mode
+
+        for pid in sorted(failed):
+            log.error(f"Positioner {pid}: {failed[pid]}")
+
+        return failed
+
+    async def _send_initialise_step(
+        self,
+        command_id: CommandID,
+        positioner_ids: List[int],
+        failed: Dict[int, str],
+        error: str,
+        **kwargs,
+    ) -> Command | None:
+        """Sends a command to multiple positioners during initialisation.
+
+        Positioners that do not reply or reply with an error are added to
+        ``failed`` with the message ``error``. Replies with ``UNKNOWN_COMMAND``
+        are accepted. Returns `None` without sending anything if
+        ``positioner_ids`` is empty.
+
+        """
+
+        if len(positioner_ids) == 0:
+            return None
+
+        command = self.send_command(
+            command_id,
+            positioner_ids=positioner_ids,
+            **kwargs,
+        )
+        await command
+
+        valid_codes = [ResponseCode.COMMAND_ACCEPTED, ResponseCode.UNKNOWN_COMMAND]
+        for reply in command.replies:
+            if reply.response_code not in valid_codes:
+                failed.setdefault(reply.positioner_id, error)
+
+        for pid in command.get_missing_positioners():
+            failed.setdefault(pid, error)
+
+        return command
+
+    async def _set_loop_modes(self, positioner_ids: Optional[List[int]] = None):
+        """Sets the collision detection and loop modes from the configuration.
+
+        Parameters
+        ----------
+        positioner_ids
+            The positioners to configure. If `None`, configures all the connected
+            positioners.
+
+        """
+
+        if positioner_ids is None:
+            positioner_ids = list(self.positioners)
+
         # Disable collision detection for listed robots.
-        disable_collision = config["fps"]["disable_collision_detection_positioners"]
+        disable_collision = [
+            pid
+            for pid in config["fps"]["disable_collision_detection_positioners"]
+            if pid in positioner_ids
+        ]
         if len(disable_collision) > 0:
             if self.locked:
                 warnings.warn(
@@ -519,7 +1092,11 @@ class FPS(BaseFPS):
                 )
 
         # Set robots to open loop mode
-        open_loop_positioners = config["fps"].get("open_loop_positioners", [])
+        open_loop_positioners = [
+            pid
+            for pid in config["fps"].get("open_loop_positioners", [])
+            if pid in positioner_ids
+        ]
         if len(open_loop_positioners) > 0:
             if self.locked:
                 warnings.warn(
@@ -541,74 +1118,416 @@ class FPS(BaseFPS):
                     positioner_ids=open_loop_positioners,
                 )
 
-        # Ensure closed loop mode for remaining robots. This does not work if
-        # any of the robots is collided.
-        if not self.locked:
-            closed_loop_positioners = list(
-                set([pid for pid in self.positioners if not self[pid].disabled])
-                - set(disable_collision)
-                - set(open_loop_positioners)
-            )
-            await self.send_command(
-                CommandID.ALPHA_CLOSED_LOOP_COLLISION_DETECTION,
-                positioner_ids=closed_loop_positioners,
-            )
-            await self.send_command(
-                CommandID.BETA_CLOSED_LOOP_COLLISION_DETECTION,
-                positioner_ids=closed_loop_positioners,
-            )
+        # Ensure closed loop mode for remaining robots. This does not work if
+        # any of the robots is collided.
+        if not self.locked:
+            closed_loop_positioners = list(
+                set([pid for pid in positioner_ids if not self[pid].disabled])
+                - set(disable_collision)
+                - set(open_loop_positioners)
+            )
+            if len(closed_loop_positioners) == 0:
+                return
+
+            await self.send_command(
+                CommandID.ALPHA_CLOSED_LOOP_COLLISION_DETECTION,
+                positioner_ids=closed_loop_positioners,
+            )
+            await self.send_command(
+                CommandID.BETA_CLOSED_LOOP_COLLISION_DETECTION,
+                positioner_ids=closed_loop_positioners,
+            )
+
+    def set_status(self, status: FPSStatus):
+        """Sets the status of the FPS."""
+
+        if status != self.status:
+            self.status = status
+            self.hub.publish(status=status)
+
+            self._apply_poller_policy()
+
+    async def _poll_status(self):
+        """Callback for the status poller."""
+
+        await self.update_status()
+        self._apply_poller_policy(self.pollers.status)
+
+    async def _poll_position(self):
+        """Callback for the position poller."""
+
+        await self.update_position()
+        self._apply_poller_policy(self.pollers.position)
+
+    async def _poll_telemetry(self):
+        """Callback for the combined telemetry poller."""
+
+        await self.update_telemetry()
+        self._apply_poller_policy(self.pollers.telemetry)
+
+    def _apply_poller_policy(self, poller: Poller | None = None):
+        """Adjusts the delays of the pollers to the state of the FPS.
+
+        The ``fps.poller_policies`` configuration defines a ``min_delay``,
+        ``max_delay``, and ``backoff`` factor for the ``locked``, ``moving``, and
+        ``idle`` states. When the state changes the pollers are set to the minimum
+        delay for the new state and woken if they were waiting longer. Each time
+        ``poller`` runs in the same state its delay is multiplied by the backoff
+        factor, up to the maximum delay.
+
+        """
+
+        policies = config["fps"].get("poller_policies", None)
+        if not policies:
+            return
+
+        if self.locked:
+            name = "locked"
+        elif self.moving:
+            name = "moving"
+        else:
+            name = "idle"
+
+        policy = policies[name]
+        min_delay = policy["min_delay"]
+        max_delay = policy.get("max_delay", min_delay)
+
+        if name != self._poller_policy:
+            log.debug(f"Setting poller policy to {name!r}.")
+            self._poller_policy = name
+
+            for pp in self.pollers:
+                wake = pp.delay > min_delay
+                pp.delay = min_delay
+                if wake:
+                    pp.wake()
+
+        elif poller is not None:
+            delay = poller.delay * policy.get("backoff", 1)
+            poller.delay = min(max(delay, min_delay), max_delay)
+
+    @contextlib.asynccontextmanager
+    async def suspend_pollers(self):
+        """Suspends the pollers while the bus is used for bulk transfers.
+
+        The pollers are stopped when the context is entered and restarted on exit
+        if they were running. Suspensions can be nested ::
+
+            async with fps.suspend_pollers():
+                ...
+
+        """
+
+        if self._n_suspended == 0:
+            self._resume_pollers = self.pollers.running
+            await self.pollers.stop()
+
+        self._n_suspended += 1
+
+        try:
+            yield
+        finally:
+            self._n_suspended -= 1
+            if self._n_suspended == 0 and self._resume_pollers:
+                self._resume_pollers = False
+                self.pollers.start()
+
+                self._poller_policy = None
+                self._apply_poller_policy()
+
+    def subscribe(
+        self,
+        maxsize: int = 100,
+        positioners: bool = True,
+    ) -> TelemetrySubscription:
+        """Subscribes to FPS status changes and positioner updates.
+
+        The first event contains the current status of the FPS and, if
+        ``positioners=True``, the position and status of all the positioners.
+        Subsequent events only contain the values that have changed. See
+        `.TelemetryHub` for details.
+
+        Parameters
+        ----------
+        maxsize
+            The maximum number of queued events before they are coalesced.
+        positioners
+            If `False`, only FPS status changes are received.
+
+        """
+
+        subscription = self.hub.subscribe(maxsize=maxsize, positioners=positioners)
+        subscription.put(
+            TelemetryEvent(
+                time.time(),
+                status=self.status,
+                positioners=self._get_telemetry_rows(self.positioners),
+            )
+        )
+
+        return subscription
+
+    def _get_telemetry_rows(self, positioner_ids):
+        """Returns the ``(alpha, beta, status)`` rows for the hub."""
+
+        return {
+            pid: (self[pid].alpha, self[pid].beta, int(self[pid].status))
+            for pid in positioner_ids
+            if pid in self
+        }
+
+    async def async_status(self):
+        """Generator that yields FPS status changes."""
+
+        with self.subscribe(positioners=False) as subscription:
+            async for event in subscription:
+                if event.status is not None:
+                    yield event.status
+
+    async def _get_positioner_bus_map(self):
+        """Creates the positioner-to-bus map.
+
+        Only relevant if the bus interface is multichannel/multibus.
+
+        """
+
+        assert isinstance(self.can, JaegerCAN), "CAN connection not established."
+
+        if len(self.can.interfaces) == 1 and not self.can.multibus:
+            return
+
+        id_cmd = await self._send_discovery_broadcast(CommandID.GET_ID)
+
+        # Parse the replies
+        for reply in id_cmd.replies:
+            iface = reply.message.interface
+            bus = reply.message.bus
+            self.positioner_to_bus[reply.positioner_id] = (iface, bus)
+
+        self.can.refresh_routing_table()
+
+    async def _send_discovery_broadcast(
+        self,
+        command_id: CommandID,
+        roster: Optional[List[int]] = None,
+    ) -> Command:
+        """Sends a discovery broadcast and awaits it.
+
+        The broadcast times out after ``fps.initialise_timeouts`` seconds unless
+        all the positioners in the ``roster``, other than quarantined ones, reply
+        first, in which case it finishes after a grace period of
+        ``fps.discovery_grace_time`` seconds to allow for new positioners to
+        reply. If ``roster`` is `None`, uses the last known roster from the
+        roster file.
+
+        """
+
+        command = self.send_command(
+            command_id,
+            positioner_ids=0,
+            timeout=config["fps"]["initialise_timeouts"],
+        )
+
+        if roster is None:
+            roster = self._load_roster()
+
+        if roster is None or len(roster) == 0:
+            await command
+            return command
+
+        # Quarantined positioners are not expected to reply.
+        pending = set(roster) - self.quarantined
+        if len(pending) == 0:
+            await command
+            return command
+
+        async for reply in command:
+            pending.discard(reply.positioner_id)
+            if len(pending) == 0:
+                break
+
+        if not command.done():
+            grace_time = config["fps"].get("discovery_grace_time", 0.05)
+            await asyncio.wait([command], timeout=grace_time)
+            if not command.done():
+                command.finish_command(CommandStatus.DONE)
+
+        return command
+
+    def _get_roster_file(self) -> pathlib.Path | None:
+        """Returns the path to the roster file, or `None` if disabled."""
+
+        roster_file = config["fps"].get("roster_file", None)
+        if roster_file is None:
+            return None
+
+        return pathlib.Path(os.path.expanduser(os.path.expandvars(roster_file)))
+
+    def _read_roster_file(self) -> Dict[str, Any] | None:
+        """Reads the roster file."""
+
+        roster_file = self._get_roster_file()
+        if roster_file is None or not roster_file.exists():
+            return None
+
+        try:
+            return json.loads(roster_file.read_text())
+        except Exception as err:
+            log.warning(f"Failed reading roster file {roster_file!s}: {err}")
+            return None
+
+    def _load_roster(self) -> List[int] | None:
+        """Returns the last known list of connected positioners."""
+
+        roster = self._read_roster_file()
+        if roster is None or "positioners" not in roster:
+            return None
+
+        return list(map(int, roster["positioners"]))
+
+    def _load_layout(self) -> Dict[int, Dict[str, Any]] | None:
+        """Returns the cached layout of the positioners.
+
+        The layout is a dictionary of positioner ID to a dictionary with the
+        ``interface`` index, ``bus``, ``firmware``, and ``flags`` class name.
+
+        """
+
+        roster = self._read_roster_file()
+        if roster is None or "layout" not in roster:
+            return None
+
+        return {int(pid): entry for pid, entry in roster["layout"].items()}
+
+    def _save_roster(self):
+        """Saves the connected positioners and their layout to the roster file."""
+
+        roster_file = self._get_roster_file()
+        if roster_file is None:
+            return
+
+        assert isinstance(self.can, JaegerCAN)
+
+        layout = {}
+        for positioner in self.values():
+            if positioner.offline or positioner.firmware is None:
+                continue
+
+            pid = positioner.positioner_id
+            interface = bus = None
+            if pid in self.positioner_to_bus:
+                iface, bus = self.positioner_to_bus[pid]
+                if iface in self.can.interfaces:
+                    interface = self.can.interfaces.index(iface)
+
+            layout[pid] = {
+                "interface": interface,
+                "bus": bus,
+                "firmware": positioner.firmware,
+                "flags": positioner.get_positioner_flags().__name__,
+            }
+
+        roster = {
+            "positioners": sorted(layout),
+            "n_interfaces": len(self.can.interfaces),
+            "layout": layout,
+        }
+
+        try:
+            roster_file.parent.mkdir(parents=True, exist_ok=True)
+            roster_file.write_text(json.dumps(roster))
+        except Exception as err:
+            log.warning(f"Failed writing roster file {roster_file!s}: {err}")
+
+    async def _warm_start(self) -> GetFirmwareVersion | None:
+        """Restores and confirms the cached positioner layout.
+
+        Adds the positioners in the cached layout with their interface and bus and
+        sends them a targeted ``GET_FIRMWARE_VERSION``. If all of them reply from
+        the expected bus and with the cached firmware, a short discovery
+        broadcast, which finishes when the cached positioners have replied, is
+        sent to find positioners that are not in the cached layout, and the
+        broadcast command is returned. Otherwise clears the FPS and returns
+        `None`, in which case a full discovery is needed. Only used if
+        ``fps.warm_start`` is enabled.
+
+        """
+
+        if not config["fps"].get("warm_start", False):
+            return None
 
-        # Issue an update status to get the status set.
-        await self.update_status()
+        layout = self._load_layout()
+        roster = self._read_roster_file()
+        if not layout or not roster:
+            return None
 
-        # Start the pollers
-        if start_pollers and not self.is_bootloader():
-            self.pollers.start()
+        assert isinstance(self.can, JaegerCAN)
+        interfaces = self.can.interfaces
 
-        return self
+        if roster.get("n_interfaces", None) != len(interfaces):
+            log.info("Number of interfaces has changed. Ignoring cached layout.")
+            return None
 
-    def set_status(self, status: FPSStatus):
-        """Sets the status of the FPS."""
+        for pid, entry in layout.items():
+            if entry["interface"] is None:
+                self.add_positioner(pid)
+            else:
+                self.add_positioner(
+                    pid,
+                    interface=entry["interface"],
+                    bus=entry["bus"],
+                )
 
-        if status != self.status:
-            self.status = status
-            if not self.__status_event.is_set():
-                self.__status_event.set()
+        self.can.refresh_routing_table()
 
-    async def async_status(self):
-        """Generator that yields FPS status changes."""
+        get_fw_command = self.send_command(
+            CommandID.GET_FIRMWARE_VERSION,
+            positioner_ids=sorted(layout),
+            timeout=config["fps"]["initialise_timeouts"],
+        )
+        assert isinstance(get_fw_command, GetFirmwareVersion)
+        await get_fw_command
 
-        yield self.status
-        while True:
-            await self.__status_event.wait()
-            yield self.status
-            self.__status_event.clear()
+        firmwares = get_fw_command.get_firmware()
+        replies = {reply.positioner_id: reply for reply in get_fw_command.replies}
 
-    async def _get_positioner_bus_map(self):
-        """Creates the positioner-to-bus map.
+        is_multibus = self.can.multibus or len(interfaces) > 1
 
-        Only relevant if the bus interface is multichannel/multibus.
+        valid = not get_fw_command.status.failed
+        for pid, entry in layout.items():
+            if not valid:
+                break
 
-        """
+            if pid not in replies or firmwares[pid] != entry["firmware"]:
+                valid = False
+                break
 
-        assert isinstance(self.can, JaegerCAN), "CAN connection not established."
+            self[pid].firmware = firmwares[pid]
+            if self[pid].get_positioner_flags().__name__ != entry["flags"]:
+                valid = False
 
-        if len(self.can.interfaces) == 1 and not self.can.multibus:
-            return
+            if is_multibus and entry["interface"] is not None:
+                message = replies[pid].message
+                expected = (interfaces[entry["interface"]], entry["bus"])
+                if (message.interface, message.bus) != expected:
+                    valid = False
 
-        timeout = config["fps"]["initialise_timeouts"]
-        id_cmd = self.send_command(
-            CommandID.GET_ID,
-            positioner_ids=[0],
-            timeout=timeout,
+        if not valid:
+            log.info("Cached layout does not match. Running full discovery.")
+            self.clear()
+            self.positioner_to_bus = {}
+            self.can.refresh_routing_table()
+            return None
+
+        log.debug(f"Confirmed cached layout with {len(layout)} positioners.")
+
+        # Find positioners that have been connected since the layout was cached.
+        discovery_command = await self._send_discovery_broadcast(
+            CommandID.GET_FIRMWARE_VERSION,
+            roster=sorted(layout),
         )
-        await id_cmd
 
-        # Parse the replies
-        for reply in id_cmd.replies:
-            iface = reply.message.interface
-            bus = reply.message.bus
-            self.positioner_to_bus[reply.positioner_id] = (iface, bus)
+        return discovery_command
 
     @property
     def locked(self):
@@ -623,9 +1542,14 @@ class FPS(BaseFPS):
         return self.status & FPSStatus.MOVING
 
     def is_bootloader(self):
-        """Returns `True` if any positioner is in bootloader mode."""
+        """Returns `True` if any positioner is in bootloader mode.
 
-        return any([pos.is_bootloader() is not False for pos in self.values()])
+        Positioners whose firmware is unknown are considered to be in bootloader
+        mode.
+
+        """
+
+        return len(self._bootloader_ids) > 0 or len(self._no_firmware_ids) > 0
 
     def send_command(
         self,
@@ -674,7 +1598,8 @@ class FPS(BaseFPS):
             raise JaegerError("CAN connection not established.")
 
         if positioner_ids is None:
-            positioner_ids = [p for p in self if not self[p].disabled]
+            excluded = self._disabled_ids | self.quarantined
+            positioner_ids = [p for p in self if p not in excluded]
 
         if not isinstance(command, Command):
             if isinstance(command, str):
@@ -693,18 +1618,22 @@ class FPS(BaseFPS):
         pids = command.positioner_ids
 
         if broadcast:
-            if any([self[pos].disabled for pos in self]) and not command.safe:
+            if len(self._disabled_ids) > 0 and not command.safe:
                 raise JaegerError("Some positioners are disabled.")
         else:
-            if any([self[pid].disabled for pid in pids]) and not command.safe:
+            if not command.safe and not self._disabled_ids.isdisjoint(pids):
                 raise JaegerError("Some commanded positioners are disabled.")
 
-        if not broadcast and not all([p in self for p in pids]):
+        if not broadcast and not self.keys() >= set(pids):
             raise JaegerError("Some positioners are not connected.")
 
         # Check if we are in bootloader mode.
-        in_boot = [p for p in pids if p != 0 and self[p].is_bootloader()]
-        if (broadcast and self.is_bootloader()) or (not broadcast and any(in_boot)):
+        if broadcast:
+            in_boot = self.is_bootloader()
+        else:
+            in_boot = not self._bootloader_ids.isdisjoint(pids)
+
+        if in_boot:
             if not command.bootloader:
                 raise JaegerError(
                     f"Cannot send command {command.command_id.name!r} "
@@ -760,7 +1689,11 @@ class FPS(BaseFPS):
 
         """
 
-        self._locked = True
+        self._set_locked(by=by)
+
+        if metrics.enabled:
+            _LOCK_EVENTS.inc(labels=("lock",))
+
         if do_warn:
             warnings.warn("Locking the FPS.", JaegerUserWarning)
 
@@ -775,8 +1708,6 @@ class FPS(BaseFPS):
         beta = -999.0
 
         if by and len(by) > 0:
-            self.locked_by += by
-
             status_bits = self.positioners[by[0]].status
             if status_bits & PositionerStatus.COLLISION_ALPHA:
                 axes = "alpha"
@@ -809,6 +1740,21 @@ class FPS(BaseFPS):
 
             log.debug(f"Saving snapshot with highlight {highlight} ({self.locked_by})")
 
+    def _set_locked(self, by: Optional[List[int]] = None):
+        """Sets the lock state without stopping or updating the positioners.
+
+        Used by `.lock` and when a collision is detected, so that no new moves
+        are accepted while the positioners stop.
+
+        """
+
+        self._locked = True
+        for pid in by or []:
+            if pid not in self.locked_by:
+                self.locked_by.append(pid)
+
+        self._apply_poller_policy()
+
     async def unlock(self, force=False):
         """Unlocks the `.FPS` if all collisions have been resolved."""
 
@@ -827,6 +1773,11 @@ class FPS(BaseFPS):
         self._locked = False
         self.locked_by = []
 
+        self._apply_poller_policy()
+
+        if metrics.enabled:
+            _LOCK_EVENTS.inc(labels=("unlock",))
+
         return True
 
     def get_positions(self, ignore_disabled=False) -> numpy.ndarray:
@@ -868,8 +1819,9 @@ class FPS(BaseFPS):
         timeout
             How long to wait before timing out the command.
         is_retry
-            A flag to determine whether the function is being called
-            as a retry if the previous command timed out.
+            If `True`, the call is itself a retry of a previous update and the
+            positioners that do not reply are not retried again. Otherwise
+            they are retried up to ``fps.max_retries`` times.
 
         """
 
@@ -882,13 +1834,22 @@ class FPS(BaseFPS):
             positioner_ids = [positioner_ids]
 
         if positioner_ids == [0]:
-            valid = [pid for pid in self if self[pid].offline is False]
+            valid = self._get_expected_positioners()
             n_positioners = len(valid) if len(valid) > 0 else None
         else:
+            # Only command, expect replies from, and retry connected positioners.
+            positioner_ids = [
+                pid for pid in positioner_ids if pid in self and not self[pid].offline
+            ]
+            if len(positioner_ids) == 0:
+                return True
+
+            valid = list(positioner_ids)
             n_positioners = None
 
-        await self.update_firmware_version(timeout=timeout)
+        await self.update_firmware_version(timeout=timeout, count_misses=False)
 
+        sent_time = time.time()
         command = self.send_command(
             CommandID.GET_STATUS,
             positioner_ids=positioner_ids,
@@ -901,15 +1862,21 @@ class FPS(BaseFPS):
             log.warning(f"{CommandID.GET_STATUS.name!r} failed during update status.")
             return False
 
-        if command.status.timed_out and not is_retry and n_positioners is not None:
-            log.warning("GET_STATUS timed out. Retrying.")
-            return await self.update_status(positioner_ids, is_retry=True)
+        commands = [command]
+        if command.status.timed_out and not is_retry:
+            commands += await self._retry_non_responders(command, valid, timeout)
+
+        self._track_non_responders(valid, commands)
 
-        if len(command.replies) == 0:
+        statuses: Dict[int, int] = {}
+        for cmd in commands:
+            statuses.update(cmd.get_positioner_status())  # type: ignore
+
+        if len(statuses) == 0:
             return True
 
         update_status_coros = []
-        for pid, status_int in command.get_positioner_status().items():  # type: ignore
+        for pid, status_int in statuses.items():
             if pid not in self:
                 continue
 
@@ -917,25 +1884,94 @@ class FPS(BaseFPS):
 
         await asyncio.gather(*update_status_coros)
 
-        # Set the status of the FPS based on positioner information.
+        self._record_telemetry(statuses=statuses, commands=commands)
+
+        self._update_fps_status()
+
+        if positioner_ids == [0]:
+            self._set_status_updated(sent_time)
+
+        return True
+
+    def _set_status_updated(self, sent_time: float):
+        """Records that a full status update sent at ``sent_time`` was applied."""
+
+        self._status_sent_time = sent_time
+
+        self._status_update_event.set()
+        self._status_update_event = asyncio.Event()
+
+    async def wait_for_status_update(self, since: float, timeout: float) -> bool:
+        """Waits for a full status update sent after ``since``.
+
+        Useful to follow the status updated by the pollers without sending
+        additional ``GET_STATUS`` broadcasts.
+
+        Parameters
+        ----------
+        since
+            The Unix time after which the ``GET_STATUS`` broadcast must have
+            been sent.
+        timeout
+            How long to wait, in seconds.
+
+        Returns
+        -------
+        updated
+            `True` if the status was updated, `False` if the wait timed out.
+
+        """
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while self._status_sent_time is None or self._status_sent_time < since:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+
+            try:
+                await asyncio.wait_for(self._status_update_event.wait(), remaining)
+            except asyncio.TimeoutError:
+                return False
+
+        return True
+
+    def _update_fps_status(self):
+        """Sets the status of the FPS based on positioner information."""
+
         # First get the current bitmask without the status bit.
         current = self.status & ~FPSStatus.STATUS_BITS
 
-        pbits = numpy.array([int(p.status) for p in self.values() if not p.disabled])
+        pbits = numpy.array(
+            [int(p.status) for p in self.values() if not p.disabled],
+            dtype=int,
+        )
+
+        # Quarantined positioners are not replying so their status may be stale,
+        # but a collision they reported must still be considered.
+        not_quarantined = numpy.array(
+            [
+                p.positioner_id not in self.quarantined
+                for p in self.values()
+                if not p.disabled
+            ],
+            dtype=bool,
+        )
 
         coll_bits = PositionerStatus.COLLISION_ALPHA | PositionerStatus.COLLISION_BETA
 
         if ((pbits & coll_bits) > 0).any():
             self.set_status(current | FPSStatus.COLLIDED)
 
-        elif ((pbits & PositionerStatus.DISPLACEMENT_COMPLETED) > 0).all():
+        elif (
+            (pbits[not_quarantined] & PositionerStatus.DISPLACEMENT_COMPLETED) > 0
+        ).all():
             self.set_status(current | FPSStatus.IDLE)
 
         else:
             self.set_status(current | FPSStatus.MOVING)
 
-        return True
-
     async def update_position(
         self,
         positioner_ids: Optional[int | List[int]] = None,
@@ -952,8 +1988,9 @@ class FPS(BaseFPS):
         timeout
             How long to wait before timing out the command.
         is_retry
-            A flag to determine whether the function is being called
-            as a retry if the previous command timed out.
+            If `True`, the call is itself a retry of a previous update and the
+            positioners that do not reply are not retried again. Otherwise
+            they are retried up to ``fps.max_retries`` times.
 
         """
 
@@ -965,7 +2002,9 @@ class FPS(BaseFPS):
             positioner_ids = [
                 pos.positioner_id
                 for pos in self.values()
-                if pos.initialised and not pos.is_bootloader()
+                if pos.initialised
+                and not pos.is_bootloader()
+                and pos.positioner_id not in self.quarantined
             ]
             if positioner_ids == []:
                 return numpy.array([])
@@ -978,35 +2017,381 @@ class FPS(BaseFPS):
             if pid in self and (not self[pid].disabled and not self[pid].offline)
         ]
 
-        command = await self.send_command(
+        command = self.send_command(
             CommandID.GET_ACTUAL_POSITION,
             positioner_ids=positioner_ids,
             timeout=timeout,
         )
 
+        positions = await self._update_positions_from_replies(command)
+
         if command.status.failed:
             log.error(f"{command.name} failed during update position.")
             return False
 
+        commands = [command]
         if command.status.timed_out and not is_retry:
-            log.warning("GET_ACTUAL_POSITION timed out. Retrying.")
-            return await self.update_position(positioner_ids, is_retry=True)
+            commands += await self._retry_non_responders(
+                command,
+                positioner_ids,
+                timeout,
+            )
+            for retry in commands[1:]:
+                positions.update(await self._update_positions_from_replies(retry))
 
-        update_position_commands = []
-        for pid, position in command.get_positions().items():  # type: ignore
-            if pid not in self:
+        self._track_non_responders(positioner_ids, commands, count_misses=False)
+
+        self._record_telemetry(positions=positions, commands=commands)
+
+        return self.get_positions()
+
+    async def update_telemetry(self, timeout: float = 2) -> bool:
+        """Updates the status and position of all positioners in a single cycle.
+
+        ``GET_FIRMWARE_VERSION``, ``GET_STATUS``, and ``GET_ACTUAL_POSITION`` are
+        sent concurrently so that their messages are interleaved on the bus. The
+        replies are applied to the positioners and the FPS status is updated
+        together once all the commands are done, so that the statuses and
+        positions correspond to the same cycle. No other commands are sent while
+        the replies are applied; the status of a positioner whose firmware
+        version is not known is ignored until a later cycle.
+
+        Parameters
+        ----------
+        timeout
+            How long to wait before timing out the commands.
+
+        """
+
+        if len(self.positioners) == 0:
+            return True
+
+        valid = self._get_expected_positioners()
+        n_positioners = len(valid) if len(valid) > 0 else None
+
+        position_ids = [
+            pos.positioner_id
+            for pos in self.values()
+            if pos.initialised
+            and not pos.is_bootloader()
+            and not pos.disabled
+            and not pos.offline
+            and pos.positioner_id not in self.quarantined
+        ]
+
+        sent_time = time.time()
+        fw_command = self.send_command(
+            CommandID.GET_FIRMWARE_VERSION,
+            positioner_ids=0,
+            timeout=timeout,
+            n_positioners=n_positioners,
+        )
+        status_command = self.send_command(
+            CommandID.GET_STATUS,
+            positioner_ids=0,
+            timeout=timeout,
+            n_positioners=n_positioners,
+        )
+        cycle = [fw_command, status_command]
+
+        if len(position_ids) > 0:
+            position_command = self.send_command(
+                CommandID.GET_ACTUAL_POSITION,
+                positioner_ids=position_ids,
+                timeout=timeout,
+            )
+            cycle.append(position_command)
+        else:
+            position_command = None
+
+        await asyncio.gather(*cycle)
+
+        if any([command.status.failed for command in cycle]):
+            log.warning("Telemetry update failed.")
+            return False
+
+        # Retry the positioners that did not reply to each of the commands.
+        retries = await asyncio.gather(
+            *[
+                self._retry_non_responders(
+                    command,
+                    valid if command is not position_command else position_ids,
+                    timeout,
+                )
+                for command in cycle
+                if command.status.timed_out
+            ]
+        )
+        commands = cycle + [retry for group in retries for retry in group]
+
+        self._track_non_responders(valid, commands)
+
+        firmwares: Dict[int, str] = {}
+        statuses: Dict[int, int] = {}
+        positions: Dict[int, Tuple[float, float]] = {}
+        for command in commands:
+            if command.command_id == CommandID.GET_FIRMWARE_VERSION:
+                firmwares.update(command.get_firmware())  # type: ignore
+            elif command.command_id == CommandID.GET_STATUS:
+                statuses.update(command.get_positioner_status())  # type: ignore
+            else:
+                for reply in command.replies:
+                    if reply.response_code == ResponseCode.COMMAND_ACCEPTED:
+                        position = GetActualPosition.decode(reply.data)
+                        positions[reply.positioner_id] = position
+
+        # Apply all the updates without yielding to the event loop. Statuses are
+        # not applied to positioners with unknown firmware, since updating them
+        # would require sending GET_FIRMWARE_VERSION.
+        for pid, firmware in firmwares.items():
+            if pid in self:
+                self[pid].firmware = firmware
+
+        for pid, status_int in list(statuses.items()):
+            if pid not in self or not self[pid].firmware:
+                statuses.pop(pid)
                 continue
 
-            update_position_commands.append(self[pid].update_position(position))
+            await self[pid].update_status(status_int)
 
-        await asyncio.gather(*update_position_commands)
+        for pid, position in positions.items():
+            if pid in self:
+                await self[pid].update_position(position)
 
-        return self.get_positions()
+        self._update_fps_status()
+        self._set_status_updated(sent_time)
+
+        self._record_telemetry(
+            positions=positions,
+            statuses=statuses,
+            commands=commands,
+        )
+
+        return True
+
+    def _record_telemetry(
+        self,
+        positions: Optional[Dict[int, Tuple[float, float]]] = None,
+        statuses: Optional[Dict[int, int]] = None,
+        commands: Optional[List[Command]] = None,
+    ):
+        """Records an update in the history, archive, shared state, and hub."""
+
+        now = time.time()
+        for pid in set(positions or {}) | set(statuses or {}):
+            self.telemetry_times[pid] = now
+
+        if self.history is not None:
+            self.history.record(positions=positions, statuses=statuses)
+
+        if self.shared_state is not None:
+            state = get_state_array(self.values(), times=self.telemetry_times)
+            self.shared_state.update(state, t=now)
+
+        if len(self.hub) > 0:
+            pids = set(positions or {}) | set(statuses or {})
+            self.hub.publish(positioners=self._get_telemetry_rows(pids))
+
+        if self.archive is not None:
+            latencies: Dict[int, float] = {}
+            for command in commands or []:
+                if command.start_time is None:
+                    continue
+                for reply in command.replies:
+                    latency = reply.received_time - command.start_time
+                    latencies[reply.positioner_id] = latency
+
+            self.archive.append(
+                positions=positions,
+                statuses=statuses,
+                latencies=latencies,
+            )
+
+    def _get_expected_positioners(self) -> List[int]:
+        """Returns the positioners expected to reply to a broadcast."""
+
+        excluded = self._offline_ids | self.quarantined
+
+        return [pid for pid in self if pid not in excluded]
+
+    def _track_non_responders(
+        self,
+        expected: List[int],
+        commands: List[Command],
+        count_misses: bool = True,
+    ):
+        """Counts consecutive missed replies and quarantines non-responders.
+
+        Positioners in ``expected`` that did not reply to any of ``commands``
+        accumulate a missed reply. After ``fps.quarantine_threshold`` consecutive
+        misses they are quarantined. Quarantined positioners that reply are
+        released.
+
+        Misses are counted once per status poll. Other updates call this with
+        ``count_misses=False`` so that replies reset the count and release
+        quarantined positioners, but silent positioners are not counted twice.
+
+        """
+
+        replied = set(
+            [reply.positioner_id for cmd in commands for reply in cmd.replies]
+        )
+
+        for pid in replied:
+            self._n_missed.pop(pid, None)
+
+        if len(replied & self.quarantined) > 0:
+            self.release_quarantine(list(replied & self.quarantined))
+
+        threshold = config["fps"].get("quarantine_threshold", None)
+        if not threshold or not count_misses:
+            return
+
+        non_responders = []
+        for pid in expected:
+            if pid in replied or pid in self.quarantined or pid not in self:
+                continue
+
+            self._n_missed[pid] = self._n_missed.get(pid, 0) + 1
+            if self._n_missed[pid] >= threshold:
+                non_responders.append(pid)
+
+        if len(non_responders) > 0:
+            self.quarantine(non_responders)
+
+    def quarantine(self, positioner_ids: List[int]):
+        """Quarantines positioners that are not replying.
+
+        Quarantined positioners are not expected to reply to broadcasts and
+        are excluded from the default list of positioners to command. They
+        are periodically probed with ``GET_ID`` and released when they reply.
+
+        """
+
+        new = set(positioner_ids) - self.quarantined
+        if len(new) == 0:
+            return
+
+        warnings.warn(
+            f"Positioners {sorted(new)} are not replying and have been quarantined.",
+            JaegerUserWarning,
+        )
+
+        self.quarantined |= new
+        self._report_quarantined()
+
+        if not self.quarantine_poller.running:
+            self.quarantine_poller.start()
+
+    def release_quarantine(self, positioner_ids: List[int]):
+        """Releases positioners from quarantine."""
+
+        released = set(positioner_ids) & self.quarantined
+        if len(released) == 0:
+            return
+
+        log.info(f"Positioners {sorted(released)} released from quarantine.")
+
+        self.quarantined -= released
+        for pid in released:
+            self._n_missed.pop(pid, None)
+
+        self._report_quarantined()
+
+        if len(self.quarantined) == 0 and self.quarantine_poller.running:
+            asyncio.create_task(self.quarantine_poller.stop())
+
+    def _report_quarantined(self):
+        """Outputs the list of quarantined positioners to the actor."""
+
+        if jaeger.core.actor_instance:
+            jaeger.core.actor_instance.write(
+                "w",
+                {"quarantined": sorted(self.quarantined)},
+            )
+
+    async def _probe_quarantined(self):
+        """Probes the quarantined positioners with ``GET_ID``."""
+
+        if len(self.quarantined) == 0:
+            return
+
+        id_cmd = self.send_command(
+            CommandID.GET_ID,
+            positioner_ids=sorted(self.quarantined),
+            timeout=config["fps"]["initialise_timeouts"],
+        )
+        await id_cmd
+
+        self.release_quarantine(id_cmd.get_ids())  # type: ignore
+
+    async def _update_positions_from_replies(
+        self,
+        command: Command,
+    ) -> Dict[int, Tuple[float, float]]:
+        """Updates the positions from a ``GET_ACTUAL_POSITION`` command.
+
+        Positions are updated as the replies arrive so that a positioner that
+        does not reply does not delay the rest. Returns the updated positions.
+
+        """
+
+        assert isinstance(command, GetActualPosition)
+
+        positions = {}
+        async for reply in command:
+            pid = reply.positioner_id
+            if pid not in self or reply.response_code != ResponseCode.COMMAND_ACCEPTED:
+                continue
+
+            positions[pid] = command.decode(reply.data)
+            await self[pid].update_position(positions[pid])
+
+        return positions
+
+    async def _retry_non_responders(
+        self,
+        command: Command,
+        expected: List[int],
+        timeout: float,
+    ) -> List[Command]:
+        """Resends a command only to the positioners that did not reply to it.
+
+        Each positioner is retried at most ``fps.max_retries`` times. Returns the
+        list of retry commands, which have already been awaited.
+
+        """
+
+        retries: List[Command] = []
+
+        missing = command.get_missing_positioners(expected)
+        for _ in range(config["fps"].get("max_retries", 1)):
+            if len(missing) == 0:
+                break
+
+            log.warning(f"{command.name} timed out. Retrying positioners {missing}.")
+
+            retry = self.send_command(
+                command.command_id,
+                positioner_ids=missing,
+                timeout=timeout,
+            )
+            await retry
+
+            retries.append(retry)
+
+            if retry.status.failed:
+                break
+
+            missing = retry.get_missing_positioners()
+
+        return retries
 
     async def update_firmware_version(
         self,
         timeout: float = 2,
         is_retry: bool = False,
+        count_misses: bool = True,
     ) -> bool:
         """Updates the firmware version of all connected positioners.
 
@@ -1015,15 +2400,20 @@ class FPS(BaseFPS):
         timeout
             How long to wait before timing out the command.
         is_retry
-            A flag to determine whether the function is being called
-            as a retry if the previous command timed out.
+            If `True`, the call is itself a retry of a previous update and the
+            positioners that do not reply are not retried again. Otherwise
+            they are retried up to ``fps.max_retries`` times.
+        count_misses
+            Whether positioners that do not reply count towards quarantine. Set
+            to `False` when called as part of `.update_status`, which counts
+            the misses of the poll.
 
         """
 
         if len(self.positioners) == 0:
             return True
 
-        valid = [pid for pid in self if self[pid].offline is False]
+        valid = self._get_expected_positioners()
         n_positioners = len(valid) if len(valid) > 0 else None
 
         get_fw_command = self.send_command(
@@ -1040,21 +2430,18 @@ class FPS(BaseFPS):
             log.error("Failed retrieving firmware version.")
             return False
 
-        if (
-            get_fw_command.status.timed_out
-            and not is_retry
-            and n_positioners is not None
-        ):
-            log.warning("GET_FIRMWARE_VERSION timed out. Retrying.")
-            return await self.update_firmware_version(timeout=timeout, is_retry=True)
+        commands = [get_fw_command]
+        if get_fw_command.status.timed_out and not is_retry:
+            commands += await self._retry_non_responders(get_fw_command, valid, timeout)
 
-        for reply in get_fw_command.replies:
-            pid = reply.positioner_id
-            if pid not in self.positioners:
-                continue
+        self._track_non_responders(valid, commands, count_misses=count_misses)
+
+        for cmd in commands:
+            for pid, firmware in cmd.get_firmware().items():  # type: ignore
+                if pid not in self.positioners:
+                    continue
 
-            positioner = self.positioners[pid]
-            positioner.firmware = get_fw_command.get_firmware()[pid]
+                self.positioners[pid].firmware = firmware
 
         return True
 
@@ -1070,9 +2457,10 @@ class FPS(BaseFPS):
         """
 
         if clear_flags is False:
+            # Include quarantined positioners, just in case.
             await self.send_command(
                 "SEND_TRAJECTORY_ABORT",
-                positioner_ids=None,
+                positioner_ids=[pid for pid in self if not self[pid].disabled],
                 timeout=0,
                 now=True,
             )
@@ -1202,6 +2590,24 @@ class FPS(BaseFPS):
         log.debug("Stopping all pollers.")
         if self.pollers:
             await self.pollers.stop()
+        await self.quarantine_poller.stop()
+        await self.hotplug_poller.stop()
+
+        if self.archive is not None:
+            await self.archive.close()
+
+        if self.stream is not None:
+            await self.stream.stop()
+
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
+
+        if self.shared_state is not None:
+            self.shared_state.close()
+            self.shared_state = None
+
+        log.debug("Shutting down the executors.")
+        shutdown_executors(wait=False)
 
         log.debug("Cancelling all pending tasks and shutting down.")
 
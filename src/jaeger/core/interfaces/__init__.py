@@ -5,3 +5,4 @@ from .cannet import CANNetBus
 from .message import Message
 from .notifier import Notifier
 from .virtual import VirtualBus
+from .workers import CANNetWorkerBus, FrameRing
@@ -9,9 +9,12 @@
 from __future__ import annotations
 
 import asyncio
+import time
 
 from typing import TYPE_CHECKING, Any, Callable, Coroutine, List, TypeVar
 
+from jaeger.core.metrics import metrics
+
 from .message import Message
 
 
@@ -25,6 +28,13 @@ Listener_co = Callable[..., Coroutine[Message, Any, Any]]
 Bus_co = TypeVar("Bus_co", bound="BusABC")
 
 
+_FRAMES_RECEIVED = metrics.counter(
+    "jaeger_can_frames_received_total",
+    "Number of frames received from an interface.",
+    ["interface"],
+)
+
+
 class Notifier:
     """Notifier class to report bus messages to multiple listeners."""
 
@@ -67,8 +77,14 @@ class Notifier:
     async def _monitor_bus(self, bus: BusABC):
         """Monitors buses and calls the listeners when a message is received."""
 
+        labels = (str(getattr(bus, "channel", "")),)
+
         while True:
             msg = await bus.get()
             if msg is not None:
+                if not msg.timestamp:
+                    msg.timestamp = time.time()
+                if metrics.enabled:
+                    _FRAMES_RECEIVED.inc(labels=labels)
                 for listener in self.listeners:
                     asyncio.create_task(listener(msg))
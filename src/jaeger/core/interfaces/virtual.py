@@ -17,7 +17,7 @@ from jaeger.core.interfaces.bus import BusABC
 from .message import Message
 
 
-queues: Dict[str, List[asyncio.Queue]] = {}
+buses: Dict[str, List[VirtualBus]] = {}
 
 
 class VirtualBus(BusABC):
@@ -28,22 +28,51 @@ class VirtualBus(BusABC):
 
         self.queue: asyncio.Queue[Message] = asyncio.Queue()
 
-        if self.channel not in queues:
-            queues[self.channel] = [self.queue]
+        # The loop that reads the queue. Set on the first call to get.
+        self.loop: asyncio.AbstractEventLoop | None = None
+
+        if self.channel not in buses:
+            buses[self.channel] = [self]
         else:
-            queues[self.channel].append(self.queue)
+            buses[self.channel].append(self)
 
     def send(self, msg: Message):
         """Send message to the virtual bus (self does not receive a copy)."""
 
-        for queue in queues[self.channel]:
-            if queue is self.queue:
+        for bus in buses[self.channel]:
+            if bus is self:
                 continue
-            queue.put_nowait(msg)
+            bus.put(msg)
+
+    def put(self, msg: Message):
+        """Adds a message to the queue. Can be called from any thread."""
+
+        if self.loop is None or self.loop.is_closed():
+            self.queue.put_nowait(msg)
+            return
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self.loop:
+            self.queue.put_nowait(msg)
+        else:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, msg)
+
+    def close(self):
+        """Stops listening to the channel."""
+
+        if self in buses.get(self.channel, []):
+            buses[self.channel].remove(self)
 
     async def get(self):
         """Get messages from the bus."""
 
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+
         msg = await self.queue.get()
 
         return msg
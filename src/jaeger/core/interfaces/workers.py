@@ -0,0 +1,444 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: workers.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import multiprocessing
+import socket
+import uuid
+from multiprocessing import shared_memory
+
+from typing import Any, Deque, Dict
+
+import numpy
+
+from jaeger.core import can_log
+
+from .cannet import CANNetBus, CANNetMessage
+
+
+__all__ = ["FRAME_RECORD_DTYPE", "FrameRing", "CANNetWorkerBus"]
+
+
+#: The maximum payload of a record. Enough for a CAN frame. Longer messages,
+#: such as replies from the device, are split over several records.
+RECORD_PAYLOAD = 64
+
+#: A decoded frame. ``size`` is the number of valid bytes in ``data``.
+FRAME_RECORD_DTYPE = numpy.dtype(
+    [
+        ("timestamp", "<f8"),
+        ("arbitration_id", "<u4"),
+        ("size", "<u2"),
+        ("bus", "u1"),
+        ("flags", "u1"),
+        ("data", "u1", (RECORD_PAYLOAD,)),
+    ]
+)
+
+#: The ring header. The counters only increase; the number of records waiting
+#: to be read is ``write_count - read_count``.
+RING_HEADER_DTYPE = numpy.dtype(
+    [
+        ("capacity", "<u8"),
+        ("write_count", "<u8"),
+        ("read_count", "<u8"),
+        ("dropped", "<u8"),
+    ]
+)
+
+FLAG_EXTENDED = 1
+FLAG_REMOTE = 2
+FLAG_DEVICE = 4
+FLAG_CONTINUED = 8
+
+
+class FrameRing:
+    """A single-producer, single-consumer ring of frames in shared memory.
+
+    The producer (`.push`) and the consumer (`.drain`) can be in different
+    processes. Each side only updates its own counter, after the records have
+    been written or copied. If the ring is full new frames are dropped and
+    counted in `.dropped`.
+
+    Messages longer than `.RECORD_PAYLOAD` are written to consecutive records.
+    All but the last are flagged with ``FLAG_CONTINUED`` and the consumer must
+    concatenate their data. The records of a message are always published
+    together.
+
+    The segment is removed by the process that created it, so the ring should
+    only be attached from that process or its children.
+
+    Parameters
+    ----------
+    name
+        The name of the shared memory segment.
+    capacity
+        The number of records in the ring. Only used when creating the segment.
+    create
+        Whether to create the segment or attach to an existing one.
+
+    """
+
+    def __init__(self, name: str, capacity: int = 65536, create: bool = False):
+        self.name = name
+
+        if create:
+            size = RING_HEADER_DTYPE.itemsize + capacity * FRAME_RECORD_DTYPE.itemsize
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            try:
+                self.shm = shared_memory.SharedMemory(name=name, track=False)
+            except TypeError:
+                # Python < 3.13. Worker processes share the resource tracker of
+                # the process that created the segment, so registering it again
+                # is harmless, and the creator removes it.
+                self.shm = shared_memory.SharedMemory(name=name)
+
+        self.header = numpy.ndarray((), dtype=RING_HEADER_DTYPE, buffer=self.shm.buf)
+        if create:
+            self.header["capacity"] = capacity
+            self.header["write_count"] = 0
+            self.header["read_count"] = 0
+            self.header["dropped"] = 0
+
+        self.capacity = int(self.header["capacity"])
+        self.records = numpy.ndarray(
+            (self.capacity,),
+            dtype=FRAME_RECORD_DTYPE,
+            buffer=self.shm.buf,
+            offset=RING_HEADER_DTYPE.itemsize,
+        )
+
+    @property
+    def dropped(self) -> int:
+        """The number of frames dropped because the ring was full."""
+
+        return int(self.header["dropped"])
+
+    def __len__(self) -> int:
+        """The number of records waiting to be read."""
+
+        return int(self.header["write_count"]) - int(self.header["read_count"])
+
+    def push(self, message: CANNetMessage) -> bool:
+        """Adds a message to the ring. Returns `False` if the ring is full."""
+
+        data = bytes(message.data)
+        n_records = max(1, -(-len(data) // RECORD_PAYLOAD))
+
+        write_count = int(self.header["write_count"])
+        n_used = write_count - int(self.header["read_count"])
+        if n_used + n_records > self.capacity:
+            self.header["dropped"] += 1
+            return False
+
+        flags = 0
+        if message.bus is None:
+            flags |= FLAG_DEVICE
+        if message.is_extended_id:
+            flags |= FLAG_EXTENDED
+        if message.is_remote_frame:
+            flags |= FLAG_REMOTE
+
+        for index in range(n_records):
+            chunk = data[index * RECORD_PAYLOAD : (index + 1) * RECORD_PAYLOAD]
+
+            record = self.records[(write_count + index) % self.capacity]
+            record["timestamp"] = message.timestamp
+            record["arbitration_id"] = message.arbitration_id
+            record["size"] = len(chunk)
+            record["bus"] = message.bus or 0
+            record["flags"] = flags | (FLAG_CONTINUED if index < n_records - 1 else 0)
+            record["data"][: len(chunk)] = numpy.frombuffer(chunk, dtype="u1")
+
+        self.header["write_count"] = write_count + n_records
+
+        return True
+
+    def drain(self) -> numpy.ndarray:
+        """Returns a copy of all the records waiting to be read."""
+
+        read_count = int(self.header["read_count"])
+        n_records = int(self.header["write_count"]) - read_count
+        if n_records <= 0:
+            return self.records[:0].copy()
+
+        start = read_count % self.capacity
+        end = start + n_records
+        if end <= self.capacity:
+            records = self.records[start:end].copy()
+        else:
+            records = numpy.concatenate(
+                [self.records[start:], self.records[: end - self.capacity]]
+            )
+
+        self.header["read_count"] = read_count + n_records
+
+        return records
+
+    def close(self, unlink: bool = False):
+        """Closes and optionally removes the segment."""
+
+        del self.header
+        del self.records
+
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+async def _worker_loop(
+    channel: str,
+    bus_kwargs: Dict[str, Any],
+    ring_name: str,
+    control: socket.socket,
+):
+    """Reads, parses, and writes frames to the ring. Runs in the worker process."""
+
+    reader, writer = await asyncio.open_unix_connection(sock=control)
+
+    bus = CANNetBus(channel, **bus_kwargs)
+    try:
+        connected = await bus.open()
+    except Exception:
+        connected = False
+
+    writer.write(b"OPEN 1\n" if connected else b"OPEN 0\n")
+    if not connected:
+        writer.close()
+        return
+
+    ring = FrameRing(ring_name)
+    loop = asyncio.get_running_loop()
+    notify_pending = False
+
+    def notify():
+        # Called once the worker waits for more data from the device, so that
+        # the main process is woken up once per batch of frames.
+        nonlocal notify_pending
+        notify_pending = False
+        if not writer.is_closing():
+            writer.write(b"\x00")
+
+    async def forward_writes():
+        # Lines from the main process are written to the device as they are.
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            bus.write(line.rstrip(b"\n").decode())
+
+    # The worker stops when the main process closes the control connection.
+    main_task = asyncio.current_task()
+    forward_task = asyncio.create_task(forward_writes())
+    forward_task.add_done_callback(lambda _: main_task and main_task.cancel())
+
+    try:
+        while True:
+            message = await bus.get()
+            if message is None:
+                continue
+
+            ring.push(message)
+            if not notify_pending:
+                notify_pending = True
+                loop.call_soon(notify)
+
+    except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+        pass
+
+    finally:
+        forward_task.cancel()
+        bus.close()
+        ring.close()
+        writer.close()
+
+
+def _worker_main(
+    channel: str,
+    bus_kwargs: Dict[str, Any],
+    ring_name: str,
+    control: socket.socket,
+):
+    """The worker process target."""
+
+    try:
+        asyncio.run(_worker_loop(channel, bus_kwargs, ring_name, control))
+    except KeyboardInterrupt:
+        pass
+
+
+class CANNetWorkerBus(CANNetBus):
+    r"""A CAN\@net bus that reads and parses frames in a worker process.
+
+    Behaves as `.CANNetBus` but the connection to the device is handled by a
+    separate process, which parses the incoming lines and writes the decoded
+    frames to a `.FrameRing` in shared memory. `.get` drains the ring in batches.
+    Outgoing lines are forwarded to the worker. With several interfaces, this
+    spreads reading and parsing across cores.
+
+    Parameters
+    ----------
+    channel
+        The IP address of the remote device.
+    ring_size
+        The number of records that the ring can hold.
+    kwargs
+        Other parameters to pass to `.CANNetBus`.
+
+    """
+
+    def __init__(self, channel, ring_size: int = 65536, **kwargs):
+        super().__init__(channel, **kwargs)
+
+        self.ring_size = ring_size
+
+        self._bus_kwargs = {
+            "port": self.port,
+            "bitrate": self.bitrate,
+            "buses": self.buses,
+            "timeout": self._timeout,
+        }
+
+        self.ring: FrameRing | None = None
+        self.process: multiprocessing.process.BaseProcess | None = None
+
+        self._pending: Deque[CANNetMessage] = collections.deque()
+        self._n_dropped: int = 0
+
+        self.channel_info += " (worker)"
+
+    async def _open_internal(self, timeout=None):
+        timeout = timeout or self._timeout
+
+        self.close()
+
+        self.ring = FrameRing(
+            f"jaeger_ring_{uuid.uuid4().hex[:12]}",
+            capacity=self.ring_size,
+            create=True,
+        )
+
+        parent_sock, child_sock = socket.socketpair()
+
+        # Spawn instead of fork since the parent may be running threads.
+        context = multiprocessing.get_context("spawn")
+        self.process = context.Process(
+            target=_worker_main,
+            args=(self.channel, self._bus_kwargs, self.ring.name, child_sock),
+            daemon=True,
+        )
+        self.process.start()
+        child_sock.close()
+
+        self.reader, self.writer = await asyncio.open_unix_connection(sock=parent_sock)
+
+        try:
+            # Starting the interpreter can take a few seconds.
+            status = await asyncio.wait_for(self.reader.readline(), timeout + 10)
+        except asyncio.TimeoutError:
+            status = b""
+
+        if status.strip() != b"OPEN 1":
+            self.close()
+            return False
+
+        self.connected = True
+
+        return True
+
+    def close(self, buses=None):
+        if self.writer and not self.writer.is_closing():
+            # Closing the control connection stops the worker, which also
+            # stops the buses in the device. Shut down the socket so that the
+            # worker receives the EOF now and not in the next loop iteration.
+            sock = self.writer.get_extra_info("socket")
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            self.writer.close()
+
+        if self.process is not None:
+            self.process.join(timeout=2)
+            if self.process.is_alive():
+                self.process.terminate()
+            self.process = None
+
+        if self.ring is not None:
+            self.ring.close(unlink=True)
+            self.ring = None
+
+        self.connected = False
+        self.writer = self.reader = None
+        self._pending.clear()
+
+    def write(self, string):
+        if not self.connected or not self.writer:
+            raise ConnectionError(f"Interface {self.channel} is not connected.")
+
+        # The control connection uses \n to separate lines.
+        self.writer.write(string.encode() + b"\n")
+
+    def _drain(self):
+        """Converts the records in the ring into messages."""
+
+        assert self.ring is not None
+
+        records = self.ring.drain()
+
+        continued = b""
+        for record in records.tolist():
+            timestamp, arbitration_id, size, bus, flags, data = record
+
+            if flags & FLAG_CONTINUED:
+                continued += bytes(data[:size])
+                continue
+
+            payload = continued + bytes(data[:size])
+            continued = b""
+
+            msg = CANNetMessage(
+                arbitration_id=arbitration_id,
+                is_extended_id=bool(flags & FLAG_EXTENDED),
+                timestamp=timestamp,
+                is_remote_frame=bool(flags & FLAG_REMOTE),
+                dlc=0 if flags & FLAG_DEVICE else len(payload),
+                data=payload,
+            )
+            msg.interface = self
+            msg.bus = None if flags & FLAG_DEVICE else bus
+
+            self._pending.append(msg)
+
+        if self.ring.dropped > self._n_dropped:
+            can_log.warning(
+                f"{self.channel}: {self.ring.dropped - self._n_dropped} "
+                "frames dropped because the receive ring was full."
+            )
+            self._n_dropped = self.ring.dropped
+
+    async def get(self):
+        if self.reader is None or self.ring is None:
+            raise ConnectionError(f"Interface {self.channel} is not connected.")
+
+        while len(self._pending) == 0:
+            self._drain()
+            if len(self._pending) > 0:
+                break
+
+            # Wait until the worker reports new frames.
+            data = await self.reader.read(4096)
+            if not data:
+                raise ConnectionError(f"Worker for {self.channel} has stopped.")
+
+        return self._pending.popleft()
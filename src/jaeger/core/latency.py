@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: latency.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import bisect
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import numpy
+
+from jaeger.core import config
+
+
+if TYPE_CHECKING:
+    from jaeger.core.positioner.commands import Command
+
+
+__all__ = [
+    "LATENCY_BINS",
+    "LATENCY_GROUPS",
+    "LATENCY_METRICS",
+    "LatencyHistogram",
+    "LatencyStats",
+    "latency_stats",
+]
+
+
+#: The upper edges of the histogram bins, in seconds. Log-spaced from 0.1 ms to
+#: 100 s. Values larger than the last edge are counted in an overflow bin.
+LATENCY_BINS: List[float] = numpy.geomspace(1e-4, 100, 37).tolist()
+
+#: The groups in which latencies are recorded.
+LATENCY_GROUPS = ["command", "bus", "positioner"]
+
+#: The latencies recorded. ``queue`` is the time from the creation of the command
+#: until it is sent, ``first_reply`` and ``last_reply`` the time from when the
+#: command is sent until the first and last replies are received.
+LATENCY_METRICS = ["queue", "first_reply", "last_reply"]
+
+
+class LatencyHistogram:
+    """A histogram of latencies with fixed bins.
+
+    Uses a fixed amount of memory regardless of the number of values recorded.
+    Percentiles are estimated from the bins and are accurate to the width of a
+    bin (about 20%).
+
+    """
+
+    __slots__ = ("counts", "n", "total", "max")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * (len(LATENCY_BINS) + 1)
+        self.n: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def record(self, value: float):
+        """Records a latency, in seconds."""
+
+        self.counts[bisect.bisect_left(LATENCY_BINS, value)] += 1
+        self.n += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        """The mean latency."""
+
+        return self.total / self.n if self.n > 0 else numpy.nan
+
+    def percentile(self, q: float) -> float:
+        """Returns an estimate of the ``q`` percentile (0-100) of the latencies.
+
+        The estimate is the upper edge of the bin that contains the percentile,
+        or the maximum recorded value if it is lower.
+
+        """
+
+        if self.n == 0:
+            return numpy.nan
+
+        target = q / 100.0 * self.n
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target and count > 0:
+                if index == len(LATENCY_BINS):
+                    return self.max
+                return min(LATENCY_BINS[index], self.max)
+
+        return self.max
+
+    def to_dict(self) -> Dict[str, float]:
+        """Returns a summary of the histogram."""
+
+        return {
+            "n": self.n,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max if self.n > 0 else numpy.nan,
+        }
+
+
+class LatencyStats:
+    """Collects latency histograms for the commands sent to the positioners.
+
+    Each finished command is recorded by `.record_command`. Latencies are grouped
+    by command name, by bus, and by positioner (see `.LATENCY_GROUPS` and
+    `.LATENCY_METRICS`). The bus is identified as ``<channel>/<bus>`` from the
+    replies of multibus interfaces (e.g., CAN@net) and is not recorded for other
+    interfaces. The number of commands, and of those that timed out, are also
+    counted for each key. For positioners and buses, a timeout means that the
+    positioner did not reply to a command that timed out; the bus of a positioner
+    is the one from which it last replied.
+
+    Parameters
+    ----------
+    enabled
+        Whether to record commands.
+
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+
+        self.histograms: Dict[str, Dict[Any, Dict[str, LatencyHistogram]]] = {}
+        self.counts: Dict[str, Dict[Any, Dict[str, int]]] = {}
+
+        self._positioner_bus: Dict[int, str] = {}
+
+        self.reset()
+
+    def reset(self):
+        """Clears all the histograms and counts."""
+
+        self.histograms = {group: {} for group in LATENCY_GROUPS}
+        self.counts = {group: {} for group in LATENCY_GROUPS}
+
+    def _get(self, group: str, key: Any) -> Dict[str, LatencyHistogram]:
+        """Returns the histograms for a key, creating them if needed."""
+
+        histograms = self.histograms[group].get(key, None)
+        if histograms is None:
+            histograms = {metric: LatencyHistogram() for metric in LATENCY_METRICS}
+            self.histograms[group][key] = histograms
+            self.counts[group][key] = {"n_commands": 0, "n_timeouts": 0}
+
+        return histograms
+
+    def _count(self, group: str, key: Any, timed_out: bool):
+        self._get(group, key)
+        counts = self.counts[group][key]
+        counts["n_commands"] += 1
+        if timed_out:
+            counts["n_timeouts"] += 1
+
+    def record_command(self, command: Command):
+        """Records the latencies of a finished command."""
+
+        if not self.enabled or command.start_time is None:
+            return
+
+        start_time = command.start_time
+        timed_out = command.status.timed_out and command._n_replies is not None
+
+        name = command.name
+        histograms = self._get("command", name)
+        self._count("command", name, timed_out)
+
+        histograms["queue"].record(start_time - command.created_time)
+
+        # First and last reply per positioner and per bus.
+        positioners: Dict[int, List[float]] = {}
+        buses: Dict[str, List[float]] = {}
+
+        for reply in command.replies:
+            received_time = reply.received_time
+
+            times = positioners.get(reply.positioner_id, None)
+            if times is None:
+                positioners[reply.positioner_id] = [received_time, received_time]
+            elif received_time < times[0]:
+                times[0] = received_time
+            elif received_time > times[1]:
+                times[1] = received_time
+
+            message = reply.message
+            bus = getattr(message, "bus", None)
+            if bus is None:
+                continue
+
+            bus_key = f"{message.interface.channel}/{bus}"
+            self._positioner_bus[reply.positioner_id] = bus_key
+
+            times = buses.get(bus_key, None)
+            if times is None:
+                buses[bus_key] = [received_time, received_time]
+            elif received_time < times[0]:
+                times[0] = received_time
+            elif received_time > times[1]:
+                times[1] = received_time
+
+        if len(positioners) > 0:
+            first = min(times[0] for times in positioners.values())
+            last = max(times[1] for times in positioners.values())
+            histograms["first_reply"].record(first - start_time)
+            histograms["last_reply"].record(last - start_time)
+
+        # Positioners and buses that did not reply to a command that timed out.
+        missing: List[int] = []
+        if timed_out and not command.is_broadcast:
+            missing = command.get_missing_positioners()
+
+        missing_buses = set()
+        for pid in missing:
+            self._count("positioner", pid, True)
+            if pid in self._positioner_bus:
+                missing_buses.add(self._positioner_bus[pid])
+
+        for group, group_times in (("positioner", positioners), ("bus", buses)):
+            for key, (first, last) in group_times.items():
+                histograms = self._get(group, key)
+                histograms["first_reply"].record(first - start_time)
+                histograms["last_reply"].record(last - start_time)
+
+                if group == "bus":
+                    self._count(group, key, key in missing_buses)
+                    missing_buses.discard(key)
+                elif key not in missing:
+                    self._count(group, key, False)
+
+        for bus_key in missing_buses:
+            self._count("bus", bus_key, True)
+
+    def summary(
+        self,
+        group: str = "command",
+        metric: str = "last_reply",
+        keys: Optional[List[Any]] = None,
+    ) -> Dict[Any, Dict[str, float]]:
+        """Returns the statistics of a metric for each key in a group.
+
+        Parameters
+        ----------
+        group
+            One of `.LATENCY_GROUPS`.
+        metric
+            One of `.LATENCY_METRICS`.
+        keys
+            The keys to return. If `None`, returns all of them.
+
+        Returns
+        -------
+        summary
+            A dictionary of key to the number of commands and timeouts and the
+            statistics returned by `.LatencyHistogram.to_dict`, in seconds.
+
+        """
+
+        if group not in LATENCY_GROUPS:
+            raise ValueError(f"Invalid group {group!r}.")
+        if metric not in LATENCY_METRICS:
+            raise ValueError(f"Invalid metric {metric!r}.")
+
+        summary = {}
+        for key, histograms in self.histograms[group].items():
+            if keys is not None and key not in keys:
+                continue
+
+            summary[key] = {
+                **histograms[metric].to_dict(),
+                **self.counts[group][key],
+            }
+
+        return summary
+
+
+#: The latency statistics for all the commands.
+latency_stats = LatencyStats(enabled=config["fps"].get("latency_stats", True))
@@ -0,0 +1,560 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: metrics.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import math
+import threading
+
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+from jaeger.core import config, log
+from jaeger.core.latency import LATENCY_BINS, LatencyHistogram, latency_stats
+
+
+if TYPE_CHECKING:
+    from jaeger.core.fps import FPS
+
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "MetricsServer",
+    "collect_fps_metrics",
+    "metrics",
+]
+
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Formats a sample value for the text exposition format."""
+
+    if value is None or math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escapes a label value."""
+
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Returns the ``{name="value",...}`` string for a sample."""
+
+    if len(names) == 0:
+        return ""
+
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+
+    return "{" + ",".join(pairs) + "}"
+
+
+class _Metric(abc.ABC):
+    """Base class for metrics.
+
+    Metrics can be updated from any thread (e.g., the CAN I/O thread). Updates
+    and the snapshot of the samples taken by `.expose` are protected by a lock.
+
+    """
+
+    type: str = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def clear(self):
+        """Removes all the samples."""
+
+        pass
+
+    @abc.abstractmethod
+    def _samples(self) -> List[str]:
+        """Returns the lines with the samples of the metric."""
+
+        pass
+
+    def expose(self) -> str:
+        """Returns the metric in the Prometheus text format."""
+
+        lines = [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        lines += self._samples()
+
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    """A value that only increases (e.g., number of frames received).
+
+    Samples are identified by a tuple with a value for each of the ``labels``.
+
+    """
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+
+        self.values: Dict[LabelValues, float] = {}
+        if len(self.labels) == 0:
+            self.values[()] = 0
+
+    def clear(self):
+        with self._lock:
+            self.values = {} if len(self.labels) > 0 else {(): 0}
+
+    def inc(self, value: float = 1, labels: LabelValues = ()):
+        """Increases the counter."""
+
+        with self._lock:
+            self.values[labels] = self.values.get(labels, 0) + value
+
+    def get(self, labels: LabelValues = ()) -> float:
+        """Returns the value of the counter."""
+
+        return self.values.get(labels, 0)
+
+    def _samples(self):
+        with self._lock:
+            values = list(self.values.items())
+
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+            for key, value in values
+        ]
+
+
+class Gauge(Counter):
+    """A value that can go up and down (e.g., a queue depth)."""
+
+    type = "gauge"
+
+    def set(self, value: float, labels: LabelValues = ()):
+        """Sets the value of the gauge."""
+
+        with self._lock:
+            self.values[labels] = value
+
+
+class Histogram(_Metric):
+    """A distribution of values, in seconds.
+
+    Uses the bins of `.LatencyHistogram` as the buckets.
+
+    """
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+
+        self.histograms: Dict[LabelValues, LatencyHistogram] = {}
+
+    def clear(self):
+        with self._lock:
+            self.histograms = {}
+
+    def observe(self, value: float, labels: LabelValues = ()):
+        """Records a value."""
+
+        with self._lock:
+            histogram = self.histograms.get(labels, None)
+            if histogram is None:
+                histogram = self.histograms[labels] = LatencyHistogram()
+
+            histogram.record(value)
+
+    def _samples(self):
+        with self._lock:
+            snapshot = [
+                (key, list(histogram.counts), histogram.n, histogram.total)
+                for key, histogram in self.histograms.items()
+            ]
+
+        lines = []
+        bucket_labels = self.labels + ("le",)
+
+        for key, counts, n, total in snapshot:
+            cumulative = 0
+            for edge, count in zip(LATENCY_BINS, counts):
+                cumulative += count
+                label_str = _format_labels(bucket_labels, key + (f"{edge:.6g}",))
+                lines.append(f"{self.name}_bucket{label_str} {cumulative}")
+
+            label_str = _format_labels(bucket_labels, key + ("+Inf",))
+            lines.append(f"{self.name}_bucket{label_str} {n}")
+
+            label_str = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_str} {n}")
+
+        return lines
+
+
+class MetricsRegistry:
+    """A collection of metrics that can be exposed in Prometheus format.
+
+    Metrics are created with `.counter`, `.gauge`, and `.histogram`. Calling any
+    of them again with the same name returns the existing metric. Values that
+    are cheap to read but would be expensive to track (queue depths, poller
+    timings) are updated by collectors, callbacks that are only called when the
+    metrics are exposed (see `.set_collector`).
+
+    Code that updates metrics should check `.enabled` first so that nothing is
+    recorded when the metrics are disabled ::
+
+        if metrics.enabled:
+            FRAMES_RECEIVED.inc(labels=(channel,))
+
+    Parameters
+    ----------
+    enabled
+        Whether metrics are recorded.
+
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], None]] = {}
+
+    def _get_or_create(self, MetricClass, name: str, help: str, labels):
+        metric = self._metrics.get(name, None)
+        if metric is None:
+            metric = self._metrics[name] = MetricClass(name, help, labels)
+        elif type(metric) is not MetricClass:
+            raise ValueError(f"Metric {name!r} already exists with another type.")
+
+        return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        """Returns a counter, creating it if needed."""
+
+        return self._get_or_create(Counter, name, help, labels)
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        """Returns a gauge, creating it if needed."""
+
+        return self._get_or_create(Gauge, name, help, labels)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+    ) -> Histogram:
+        """Returns a histogram, creating it if needed."""
+
+        return self._get_or_create(Histogram, name, help, labels)
+
+    def __getitem__(self, name: str) -> _Metric:
+        return self._metrics[name]
+
+    def set_collector(self, name: str, callback: Callable[[], None]):
+        """Adds or replaces a collector."""
+
+        self._collectors[name] = callback
+
+    def remove_collector(self, name: str):
+        """Removes a collector."""
+
+        self._collectors.pop(name, None)
+
+    def reset(self):
+        """Clears the values of all the metrics."""
+
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def collect(self):
+        """Calls the collectors."""
+
+        for name, callback in list(self._collectors.items()):
+            try:
+                callback()
+            except Exception as err:
+                log.warning(f"Metrics collector {name!r} failed: {err}")
+
+    def expose(self) -> str:
+        """Calls the collectors and returns all the metrics in text format."""
+
+        self.collect()
+
+        return "".join(metric.expose() for metric in list(self._metrics.values()))
+
+
+#: The metrics registry.
+metrics = MetricsRegistry(
+    enabled=(config["fps"].get("metrics", None) or {}).get("enabled", False)
+)
+
+
+#: Metrics exposed by the collectors.
+_COMMAND_LATENCY = metrics.histogram(
+    "jaeger_command_latency_seconds",
+    "Latency of the commands (queue, first_reply, or last_reply).",
+    ["command", "metric"],
+)
+_COMMAND_QUEUE_DEPTH = metrics.gauge(
+    "jaeger_can_command_queue_depth",
+    "Number of commands waiting to be sent.",
+)
+_RUNNING_COMMANDS = metrics.gauge(
+    "jaeger_can_running_commands",
+    "Number of commands waiting for replies.",
+)
+_RECEIVE_RING_DEPTH = metrics.gauge(
+    "jaeger_can_receive_ring_depth",
+    "Number of frames waiting in the receive ring of a worker interface.",
+    ["interface"],
+)
+_RECEIVE_RING_DROPPED = metrics.counter(
+    "jaeger_can_receive_ring_dropped_total",
+    "Number of frames dropped because the receive ring was full.",
+    ["interface"],
+)
+_UID_POOL_USED = metrics.gauge(
+    "jaeger_uid_pool_used",
+    "Number of message UIDs in use.",
+    ["command"],
+)
+_UID_POOL_SIZE = metrics.gauge(
+    "jaeger_uid_pool_size",
+    "Total number of message UIDs.",
+    ["command"],
+)
+_FPS_LOCKED = metrics.gauge(
+    "jaeger_fps_locked",
+    "Whether the FPS is locked.",
+)
+_N_POSITIONERS = metrics.gauge(
+    "jaeger_fps_positioners",
+    "Number of positioners by state (connected, disabled, or quarantined).",
+    ["state"],
+)
+_POLLER_CALLS = metrics.counter(
+    "jaeger_poller_calls_total",
+    "Number of calls to a poller callback.",
+    ["poller"],
+)
+_POLLER_OVERRUNS = metrics.counter(
+    "jaeger_poller_overruns_total",
+    "Number of times a poller callback took longer than the delay.",
+    ["poller"],
+)
+_POLLER_TIMES = metrics.gauge(
+    "jaeger_poller_seconds",
+    "Poller timings (delay, period, jitter, max_jitter, or last_duration).",
+    ["poller", "metric"],
+)
+
+
+def collect_fps_metrics(fps: FPS):
+    """Updates the metrics that are read from the state of the FPS.
+
+    Added as a collector by `.FPS` when the metrics are enabled.
+
+    """
+
+    from jaeger.core.positioner.commands import CommandID
+    from jaeger.core.positioner.commands.core import UID_POOL
+
+    # The latency histograms are shared with the latency statistics.
+    _COMMAND_LATENCY.histograms = {
+        (name, metric): histogram
+        for name, histograms in latency_stats.histograms["command"].items()
+        for metric, histogram in histograms.items()
+    }
+
+    can = fps.can
+    if can is not None and not isinstance(can, str):
+        queue = can.command_queue
+        _COMMAND_QUEUE_DEPTH.set(queue.qsize() if queue is not None else 0)
+        _RUNNING_COMMANDS.set(
+            sum(1 for cmd in list(can.running_commands.values()) if not cmd.done())
+        )
+
+        for interface in can.interfaces:
+            ring = getattr(interface, "ring", None)
+            if ring is not None:
+                labels = (str(interface.channel),)
+                _RECEIVE_RING_DEPTH.set(len(ring), labels)
+                _RECEIVE_RING_DROPPED.values[labels] = ring.dropped
+
+    uid_bits = config["positioner"]["uid_bits"]
+    _UID_POOL_USED.clear()
+    _UID_POOL_SIZE.clear()
+    for command_id, pool in list(UID_POOL.items()):
+        size = used = 0
+        for positioner_id, uids in list(pool.items()):
+            # Broadcasts only use UID=0.
+            n_uids = 1 if positioner_id == 0 else 2**uid_bits - 1
+            size += n_uids
+            used += n_uids - len(uids)
+
+        labels = (CommandID(command_id).name,)
+        _UID_POOL_USED.set(used, labels)
+        _UID_POOL_SIZE.set(size, labels)
+
+    _FPS_LOCKED.set(int(fps.locked))
+    _N_POSITIONERS.set(len(fps.positioners), ("connected",))
+    _N_POSITIONERS.set(len(fps.disabled), ("disabled",))
+    _N_POSITIONERS.set(len(fps.quarantined), ("quarantined",))
+
+    # The poller and ring counters are kept by the pollers and rings themselves
+    # and are copied as they are.
+    pollers = list(fps.pollers) + [fps.quarantine_poller, fps.hotplug_poller]
+    device_poller = getattr(can, "device_status_poller", None)
+    if device_poller is not None:
+        pollers.append(device_poller)
+
+    for poller in pollers:
+        poller_metrics = poller.metrics
+        labels = (poller.name,)
+        _POLLER_CALLS.values[labels] = poller_metrics["n_calls"]
+        _POLLER_OVERRUNS.values[labels] = poller_metrics["n_overruns"]
+        for key in ["delay", "period", "jitter", "max_jitter", "last_duration"]:
+            value = poller_metrics[key]
+            _POLLER_TIMES.set(math.nan if value is None else value, labels + (key,))
+
+
+class MetricsServer:
+    """Serves the metrics over HTTP in Prometheus text format.
+
+    A minimal HTTP/1.0 server that replies to ``GET /metrics`` and closes the
+    connection after each response. The metrics can be read with any HTTP
+    client, for example ::
+
+        curl http://127.0.0.1:19996/metrics
+
+    Parameters
+    ----------
+    registry
+        The `.MetricsRegistry` to expose.
+    host
+        The host on which to listen.
+    port
+        The port on which to listen.
+
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(
+        self,
+        registry: Optional[MetricsRegistry] = None,
+        host: str = "127.0.0.1",
+        port: int = 19996,
+    ):
+        self.registry = registry or metrics
+
+        self.host = host
+        self.port = port
+
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the server is running."""
+
+        return self._server is not None
+
+    async def start(self):
+        """Starts the server."""
+
+        if self._server is not None:
+            return
+
+        self._server = await asyncio.start_server(
+            self._handle_client,
+            host=self.host,
+            port=self.port,
+        )
+
+        # Update the port in case it was assigned by the system (port=0).
+        sockets = self._server.sockets
+        if sockets:
+            self.port = sockets[0].getsockname()[1]
+
+        log.info(f"Serving metrics on http://{self.host}:{self.port}/metrics.")
+
+    async def stop(self):
+        """Stops the server."""
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        """Replies to a single request."""
+
+        try:
+            request = await asyncio.wait_for(reader.readline(), 5)
+
+            # Skip the headers.
+            while True:
+                line = await asyncio.wait_for(reader.readline(), 5)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+
+            parts = request.decode("latin-1").split()
+            if len(parts) < 2:
+                status, body = "400 Bad Request", "Bad request.\n"
+            elif parts[0] not in ("GET", "HEAD"):
+                status, body = "405 Method Not Allowed", "Method not allowed.\n"
+            elif parts[1].split("?")[0] not in ("/metrics", "/"):
+                status, body = "404 Not Found", "Not found.\n"
+            else:
+                status, body = "200 OK", self.registry.expose()
+
+            data = body.encode()
+            headers = (
+                f"HTTP/1.0 {status}\r\n"
+                f"Content-Type: {self.CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                "Connection: close\r\n"
+                "\r\n"
+            )
+
+            writer.write(headers.encode())
+            if len(parts) > 0 and parts[0] != "HEAD":
+                writer.write(data)
+
+            await writer.drain()
+
+        except (ConnectionError, asyncio.TimeoutError, UnicodeDecodeError):
+            pass
+
+        finally:
+            writer.close()
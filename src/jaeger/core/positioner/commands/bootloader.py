@@ -140,102 +140,101 @@ async def load_firmware(
         else:
             raise JaegerError(msg)
 
-    log.info("stopping pollers")
-    await fps.pollers.stop()
+    log.info("suspending pollers")
+    async with fps.suspend_pollers():
+        log.info(f"upgrading firmware on {len(valid_positioners)} positioners.")
 
-    log.info(f"upgrading firmware on {len(valid_positioners)} positioners.")
+        start_firmware_payload = int_to_bytes(filesize) + int_to_bytes(crc32)
 
-    start_firmware_payload = int_to_bytes(filesize) + int_to_bytes(crc32)
+        log.info(f"CRC32: {crc32}")
+        log.info(f"File size: {filesize} bytes")
 
-    log.info(f"CRC32: {crc32}")
-    log.info(f"File size: {filesize} bytes")
+        pids = [pos.positioner_id for pos in valid_positioners]
 
-    pids = [pos.positioner_id for pos in valid_positioners]
-
-    cmd = await fps.send_command(
-        CommandID.START_FIRMWARE_UPGRADE,
-        positioner_ids=pids,
-        data=[start_firmware_payload],
-    )
-
-    if cmd.status.failed or cmd.status.timed_out:
-        log.error("firmware upgrade failed.")
-        return False
-
-    # Restore pointer to start of file
-    firmware_data.seek(0)
+        cmd = await fps.send_command(
+            CommandID.START_FIRMWARE_UPGRADE,
+            positioner_ids=pids,
+            data=[start_firmware_payload],
+        )
 
-    log.info("starting data send.")
+        if cmd.status.failed or cmd.status.timed_out:
+            log.error("firmware upgrade failed.")
+            return False
 
-    if stop_logging and can_log.fh:
-        fh_handler = can_log.handlers.pop(can_log.handlers.index(can_log.fh))
-    else:
-        fh_handler = None
+        # Restore pointer to start of file
+        firmware_data.seek(0)
 
-    chunk_size = 8
-    n_chunks = int(numpy.ceil(filesize / chunk_size))
+        log.info("starting data send.")
 
-    with contextlib.ExitStack() as stack:
-        if show_progressbar and progressbar:
-            bar = stack.enter_context(progressbar.ProgressBar(max_value=n_chunks))
+        if stop_logging and can_log.fh:
+            fh_handler = can_log.handlers.pop(can_log.handlers.index(can_log.fh))
         else:
-            bar = None
-
-        messages_default = config["positioner"]["firmware_messages_per_positioner"]
-        messages_per_positioner = messages_per_positioner or messages_default
-        assert isinstance(messages_per_positioner, int)
-
-        ii = 0
-        while True:
-            cmds = []
-            stop = False
-            for __ in range(messages_per_positioner):
-                chunk = firmware_data.read(chunk_size)
-                packetdata = bytearray(chunk)
-                # packetdata.reverse()  # IMPORTANT! no longer needed for P1
-
-                if len(packetdata) == 0:
-                    stop = True
-                    break
-
-                cmds.append(
-                    fps.send_command(
-                        CommandID.SEND_FIRMWARE_DATA,
-                        positioner_ids=pids,
-                        data=[packetdata],
-                        timeout=15,
+            fh_handler = None
+
+        chunk_size = 8
+        n_chunks = int(numpy.ceil(filesize / chunk_size))
+
+        with contextlib.ExitStack() as stack:
+            if show_progressbar and progressbar:
+                bar = stack.enter_context(progressbar.ProgressBar(max_value=n_chunks))
+            else:
+                bar = None
+
+            messages_default = config["positioner"]["firmware_messages_per_positioner"]
+            messages_per_positioner = messages_per_positioner or messages_default
+            assert isinstance(messages_per_positioner, int)
+
+            ii = 0
+            while True:
+                cmds = []
+                stop = False
+                for __ in range(messages_per_positioner):
+                    chunk = firmware_data.read(chunk_size)
+                    packetdata = bytearray(chunk)
+                    # packetdata.reverse()  # IMPORTANT! no longer needed for P1
+
+                    if len(packetdata) == 0:
+                        stop = True
+                        break
+
+                    cmds.append(
+                        fps.send_command(
+                            CommandID.SEND_FIRMWARE_DATA,
+                            positioner_ids=pids,
+                            data=[packetdata],
+                            timeout=15,
+                        )
                     )
-                )
 
-            await asyncio.gather(*cmds)
+                await asyncio.gather(*cmds)
 
-            if any(cmd.status.failed or cmd.status.timed_out for cmd in cmds):
-                log.error("firmware upgrade failed.")
-                if fh_handler:
-                    can_log.addHandler(fh_handler)
-                return False
+                if any(cmd.status.failed or cmd.status.timed_out for cmd in cmds):
+                    log.error("firmware upgrade failed.")
+                    if fh_handler:
+                        can_log.addHandler(fh_handler)
+                    return False
 
-            ii += messages_per_positioner
+                ii += messages_per_positioner
 
-            if show_progressbar and bar:
-                if ii < n_chunks:
-                    bar.update(ii)
+                if show_progressbar and bar:
+                    if ii < n_chunks:
+                        bar.update(ii)
 
-            if progress_callback:
-                progress_callback(ii, n_chunks)
+                if progress_callback:
+                    progress_callback(ii, n_chunks)
 
-            if stop:
-                break
+                if stop:
+                    break
 
-    log.info("firmware upgrade complete.")
+        log.info("firmware upgrade complete.")
 
-    if fh_handler:
-        can_log.addHandler(fh_handler)
+        if fh_handler:
+            can_log.addHandler(fh_handler)
 
-    total_time = time.time() - start_time
-    log.info(f"upgrading firmware took {total_time:.2f} s.")
+        total_time = time.time() - start_time
+        log.info(f"upgrading firmware took {total_time:.2f} s.")
 
-    return True
+        return True
 
 
 class GetFirmwareVersion(Command):
@@ -95,99 +95,97 @@ async def calibrate_positioners(
         if positioner_id not in fps.positioners:
             raise JaegerError(f"Positioner {positioner_id} not found.")
 
-    if fps.pollers.running:
-        log.debug("Stopping pollers")
-        await fps.pollers.stop()
+    log.debug("Suspending pollers")
+    async with fps.suspend_pollers():
+        if motors:
+            log.info("Starting motor calibration.")
 
-    if motors:
-        log.info("Starting motor calibration.")
+            if axis == "alpha":
+                motor_command = CommandID.START_MOTOR_CALIBRATION_ALPHA
+            elif axis == "beta":
+                motor_command = CommandID.START_MOTOR_CALIBRATION_BETA
+            else:
+                motor_command = CommandID.START_MOTOR_CALIBRATION
 
-        if axis == "alpha":
-            motor_command = CommandID.START_MOTOR_CALIBRATION_ALPHA
-        elif axis == "beta":
-            motor_command = CommandID.START_MOTOR_CALIBRATION_BETA
-        else:
-            motor_command = CommandID.START_MOTOR_CALIBRATION
-
-        cmd = await fps.send_command(motor_command, positioner_ids=positioner_ids)
-
-        if cmd.status.failed:
-            raise JaegerError("Motor calibration failed.")
-
-        await asyncio.sleep(1)
+            cmd = await fps.send_command(motor_command, positioner_ids=positioner_ids)
 
-        statuses = [
-            PS.DISPLACEMENT_COMPLETED,
-            PS.MOTOR_ALPHA_CALIBRATED,
-            PS.MOTOR_BETA_CALIBRATED,
-        ]
-        await _wait_status(fps, positioner_ids, statuses)
+            if cmd.status.failed:
+                raise JaegerError("Motor calibration failed.")
 
-    else:
-        log.warning("Skipping motor calibration.")
+            await asyncio.sleep(1)
 
-    if datums:
-        log.info("Starting datum calibration.")
+            statuses = [
+                PS.DISPLACEMENT_COMPLETED,
+                PS.MOTOR_ALPHA_CALIBRATED,
+                PS.MOTOR_BETA_CALIBRATED,
+            ]
+            await _wait_status(fps, positioner_ids, statuses)
 
-        if axis == "alpha":
-            datums_command = CommandID.START_DATUM_CALIBRATION_ALPHA
-        elif axis == "beta":
-            datums_command = CommandID.START_DATUM_CALIBRATION_BETA
         else:
-            datums_command = CommandID.START_DATUM_CALIBRATION
+            log.warning("Skipping motor calibration.")
 
-        cmd = await fps.send_command(datums_command, positioner_ids=positioner_ids)
+        if datums:
+            log.info("Starting datum calibration.")
 
-        if cmd.status.failed:
-            raise JaegerError("Datum calibration failed.")
+            if axis == "alpha":
+                datums_command = CommandID.START_DATUM_CALIBRATION_ALPHA
+            elif axis == "beta":
+                datums_command = CommandID.START_DATUM_CALIBRATION_BETA
+            else:
+                datums_command = CommandID.START_DATUM_CALIBRATION
 
-        await asyncio.sleep(1)
+            cmd = await fps.send_command(datums_command, positioner_ids=positioner_ids)
 
-        statuses = [
-            PS.DISPLACEMENT_COMPLETED,
-            PS.DATUM_ALPHA_CALIBRATED,
-            PS.DATUM_BETA_CALIBRATED,
-        ]
-        await _wait_status(fps, positioner_ids, statuses)
+            if cmd.status.failed:
+                raise JaegerError("Datum calibration failed.")
 
-    else:
-        log.warning("Skipping datum calibration.")
+            await asyncio.sleep(1)
 
-    if cogging:
-        log.info("Starting cogging calibration.")
+            statuses = [
+                PS.DISPLACEMENT_COMPLETED,
+                PS.DATUM_ALPHA_CALIBRATED,
+                PS.DATUM_BETA_CALIBRATED,
+            ]
+            await _wait_status(fps, positioner_ids, statuses)
 
-        if axis == "alpha":
-            cogging_command = CommandID.START_COGGING_CALIBRATION_ALPHA
-        elif axis == "beta":
-            cogging_command = CommandID.START_COGGING_CALIBRATION_BETA
         else:
-            cogging_command = CommandID.START_COGGING_CALIBRATION
+            log.warning("Skipping datum calibration.")
 
-        cmd = await fps.send_command(cogging_command, positioner_ids=positioner_ids)
+        if cogging:
+            log.info("Starting cogging calibration.")
 
-        if cmd.status.failed:
-            raise JaegerError("Cogging calibration failed.")
+            if axis == "alpha":
+                cogging_command = CommandID.START_COGGING_CALIBRATION_ALPHA
+            elif axis == "beta":
+                cogging_command = CommandID.START_COGGING_CALIBRATION_BETA
+            else:
+                cogging_command = CommandID.START_COGGING_CALIBRATION
 
-        await asyncio.sleep(1)
+            cmd = await fps.send_command(cogging_command, positioner_ids=positioner_ids)
 
-        statuses = [PS.COGGING_ALPHA_CALIBRATED, PS.COGGING_BETA_CALIBRATED]
-        await _wait_status(fps, positioner_ids, statuses)
+            if cmd.status.failed:
+                raise JaegerError("Cogging calibration failed.")
 
-    else:
-        log.warning("Skipping cogging calibration.")
+            await asyncio.sleep(1)
+
+            statuses = [PS.COGGING_ALPHA_CALIBRATED, PS.COGGING_BETA_CALIBRATED]
+            await _wait_status(fps, positioner_ids, statuses)
+
+        else:
+            log.warning("Skipping cogging calibration.")
 
-    if motors or datums or cogging:
-        log.info("Saving calibration.")
-        cmd = await fps.send_command(
-            CommandID.SAVE_INTERNAL_CALIBRATION,
-            positioner_ids=positioner_ids,
-        )
-        if cmd.status.failed:
-            raise JaegerError("Saving calibration failed.")
+        if motors or datums or cogging:
+            log.info("Saving calibration.")
+            cmd = await fps.send_command(
+                CommandID.SAVE_INTERNAL_CALIBRATION,
+                positioner_ids=positioner_ids,
+            )
+            if cmd.status.failed:
+                raise JaegerError("Saving calibration failed.")
 
-        log.info(f"Positioners {positioner_ids} have been calibrated.")
+            log.info(f"Positioners {positioner_ids} have been calibrated.")
 
-    return
+        return
 
 
 async def _wait_status(fps: FPS, positioner_ids: list[int], statuses: list[PS]):
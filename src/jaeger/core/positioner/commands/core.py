@@ -21,7 +21,9 @@ from typing import Any, Callable, Dict, List, Optional, Union
 from jaeger.core import can_log, config, log, maskbits
 from jaeger.core.exceptions import CommandError, JaegerError, JaegerUserWarning
 from jaeger.core.interfaces import BusABC, Message
+from jaeger.core.latency import latency_stats
 from jaeger.core.maskbits import CommandStatus, ResponseCode
+from jaeger.core.metrics import metrics
 from jaeger.core.utils import StatusMixIn, get_identifier, parse_identifier
 
 from . import CommandID
@@ -39,6 +41,17 @@ UID_POOL = collections.defaultdict(dict)
 # Starting value for command UID.
 COMMAND_UID = 0
 
+_COMMANDS = metrics.counter(
+    "jaeger_commands_total",
+    "Number of finished commands by final status.",
+    ["command", "status"],
+)
+_COMMAND_TIMEOUTS = metrics.counter(
+    "jaeger_command_timeouts_total",
+    "Number of commands that timed out before receiving all the replies.",
+    ["command"],
+)
+
 
 class SuperMessage(Message):
     """An extended CAN ``Message`` class.
@@ -120,6 +133,10 @@ class Reply(object):
         #: The data from the message.
         self.data = message.data
 
+        #: The time at which the reply was received. Uses the timestamp set when
+        #: the message was read from the bus, if available.
+        self.received_time = getattr(message, "timestamp", None) or time.time()
+
         #: The `~.maskbits.ResponseCode` bit returned by the reply.
         self.response_code: maskbits.ResponseCode
 
@@ -186,6 +203,16 @@ class Command(StatusMixIn[CommandStatus], Future_co):
     times out. Broadcast commands only get marked done by timing out or
     manually.
 
+    Replies can also be consumed as they arrive by iterating over the
+    command ::
+
+        async for reply in command:
+            ...
+
+    The iteration finishes when the command is done. This allows to process
+    the replies from the positioners that responded without waiting for the
+    ones that time out.
+
     Parameters
     ----------
     positioner_ids
@@ -211,6 +238,11 @@ class Command(StatusMixIn[CommandStatus], Future_co):
     ignore_unknown
         Ignores ``UNKNOWN_COMMAND`` replies from positioners that do now
         support this command.
+    bus_done_callback
+        A function or coroutine to call when all the messages sent to a given bus
+        have received a reply. It is called with the ``(interface index, bus)``
+        route of the completed bus. Only used for non-broadcast commands sent
+        through a multibus interface.
 
     """
 
@@ -235,6 +267,7 @@ class Command(StatusMixIn[CommandStatus], Future_co):
         n_positioners: Optional[int] = None,
         data: Union[None, data_co, Dict[int, data_co]] = None,
         ignore_unknown: bool = True,
+        bus_done_callback: Optional[Callable] = None,
     ):
         global COMMAND_UID
 
@@ -307,7 +340,8 @@ class Command(StatusMixIn[CommandStatus], Future_co):
         self.command_uid = COMMAND_UID
         COMMAND_UID += 1
 
-        # Starting and end time
+        # Creation, starting, and end time
+        self.created_time: float = time.time()
         self.start_time: float | None = None
         self.end_time: float | None = None
 
@@ -330,6 +364,15 @@ class Command(StatusMixIn[CommandStatus], Future_co):
 
         self._done_callback = done_callback
 
+        # Route of each message and number of messages pending a reply for each
+        # route. Filled by JaegerCAN when the messages are sent.
+        self._message_routes: Dict[tuple[int, int], Any] = {}
+        self._bus_pending: Dict[Any, int] = {}
+        self._bus_done_callback = bus_done_callback
+
+        # Futures for the async iterators waiting for new replies.
+        self._reply_waiters: List[asyncio.Future] = []
+
         self._timeout_handle = None
 
         self._ignore_unknown = ignore_unknown
@@ -382,6 +425,65 @@ class Command(StatusMixIn[CommandStatus], Future_co):
 
         return CommandID(self.command_id).name
 
+    async def __aiter__(self):
+        """Yields the replies as they are received until the command is done."""
+
+        n_yielded = 0
+
+        while True:
+            while n_yielded < len(self.replies):
+                yield self.replies[n_yielded]
+                n_yielded += 1
+
+            if self.done():
+                return
+
+            waiter = self.loop.create_future()
+            self._reply_waiters.append(waiter)
+            await waiter
+
+    def _wake_reply_waiters(self):
+        """Notifies the async iterators that new replies are available."""
+
+        for waiter in self._reply_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        self._reply_waiters = []
+
+    def add_message_route(self, message: SuperMessage, route: Any):
+        """Records the ``(interface index, bus)`` route to which a message was sent.
+
+        Used to determine when all the messages sent to a bus have been replied
+        and call ``bus_done_callback``. Broadcasts are not tracked.
+
+        """
+
+        if self.is_broadcast or route is None:
+            return
+
+        self._message_routes[(message.positioner_id, message.uid)] = route
+        self._bus_pending[route] = self._bus_pending.get(route, 0) + 1
+
+    def _update_bus_pending(self, reply: Reply):
+        """Updates the pending replies per bus and calls ``bus_done_callback``."""
+
+        route = self._message_routes.pop((reply.positioner_id, reply.uid), None)
+        if route is None:
+            return
+
+        self._bus_pending[route] -= 1
+        if self._bus_pending[route] > 0:
+            return
+
+        self._log(f"all replies received from bus {route!r}.")
+
+        if self._bus_done_callback:
+            if asyncio.iscoroutinefunction(self._bus_done_callback):
+                asyncio.create_task(self._bus_done_callback(route))
+            else:
+                self._bus_done_callback(route)
+
     def _check_replies(self):
         """Checks if the UIDs of the replies match the messages."""
 
@@ -455,6 +557,10 @@ class Command(StatusMixIn[CommandStatus], Future_co):
                 return
 
         self.replies.append(reply)
+        self._wake_reply_waiters()
+
+        if self._bus_pending:
+            self._update_bus_pending(reply)
 
         data_hex = binascii.hexlify(reply.data).decode()
         self._log(
@@ -550,6 +656,16 @@ class Command(StatusMixIn[CommandStatus], Future_co):
             self.set_result(self)
             self.end_time = time.time()
 
+            if latency_stats.enabled and self.status != CommandStatus.CANCELLED:
+                latency_stats.record_command(self)
+
+            if metrics.enabled:
+                _COMMANDS.inc(labels=(self.name, self.status.name))
+                if self.status.timed_out and self._n_replies is not None:
+                    _COMMAND_TIMEOUTS.inc(labels=(self.name,))
+
+            self._wake_reply_waiters()
+
             is_done = self.status in [CommandStatus.TIMEDOUT, CommandStatus.DONE]
 
             if is_done and self._done_callback:
@@ -630,6 +746,32 @@ class Command(StatusMixIn[CommandStatus], Future_co):
 
         return messages
 
+    def get_missing_positioners(
+        self,
+        expected: Optional[List[int]] = None,
+    ) -> List[int]:
+        """Returns the positioners that have not replied to all their messages.
+
+        Parameters
+        ----------
+        expected
+            The list of positioners expected to reply. Required for broadcasts.
+            If `None`, uses the commanded positioners.
+
+        """
+
+        if expected is None:
+            if self.is_broadcast:
+                raise CommandError("expected is required for broadcasts.")
+            expected = self.positioner_ids
+
+        n_replies = collections.Counter(reply.positioner_id for reply in self.replies)
+
+        if self.is_broadcast:
+            return [pid for pid in expected if n_replies[pid] == 0]
+
+        return [pid for pid in expected if n_replies[pid] < len(self.data.get(pid, []))]
+
     def get_replies(self) -> Dict[int, Any]:
         """Returns the formatted replies as a dictionary.
 
@@ -81,15 +81,18 @@ class GetActualPosition(Command):
 
         positions = {}
         for reply in self.replies:
-            pid = reply.positioner_id
-            data = reply.data
+            positions[reply.positioner_id] = self.decode(reply.data)
 
-            beta = bytes_to_int(data[4:], dtype="i4")
-            alpha = bytes_to_int(data[0:4], dtype="i4")
+        return positions
 
-            positions[pid] = motor_steps_to_angle(alpha, beta)
+    @staticmethod
+    def decode(data: bytearray) -> Tuple[float, float]:
+        """Returns the alpha and beta positions in degrees from a reply payload."""
 
-        return positions
+        beta = bytes_to_int(data[4:], dtype="i4")
+        alpha = bytes_to_int(data[0:4], dtype="i4")
+
+        return motor_steps_to_angle(alpha, beta)
 
     @staticmethod
     def encode(alpha, beta):
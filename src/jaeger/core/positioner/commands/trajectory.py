@@ -23,6 +23,7 @@ from sdsstools import read_yaml_file
 from jaeger.core import config, log
 from jaeger.core.exceptions import JaegerUserWarning, TrajectoryError
 from jaeger.core.maskbits import FPSStatus, ResponseCode
+from jaeger.core.metrics import metrics
 from jaeger.core.positioner.commands import Command, CommandID
 from jaeger.core.utils import int_to_bytes
 
@@ -53,6 +54,17 @@ TIME_STEP = config["positioner"]["time_step"]
 TrajectoryDataType = Dict[int, Dict[str, List[Tuple[float, float]]]]
 
 
+_TRAJECTORY_SEND_TIME = metrics.histogram(
+    "jaeger_trajectory_send_seconds",
+    "Time to send the trajectory data to the positioners.",
+)
+_TRAJECTORY_RUN_TIME = metrics.histogram(
+    "jaeger_trajectory_run_seconds",
+    "Time from the start of a trajectory until it finishes or fails.",
+    ["result"],
+)
+
+
 async def send_trajectory(
     fps: FPS,
     trajectories: str | pathlib.Path | TrajectoryDataType,
@@ -339,7 +351,17 @@ class Trajectory(object):
                             )
 
     async def send(self):
-        """Sends the trajectory but does not start it."""
+        """Sends the trajectory but does not start it.
+
+        The pollers are suspended while the trajectory is sent.
+
+        """
+
+        async with self.fps.suspend_pollers():
+            return await self._send()
+
+    async def _send(self):
+        """Sends the trajectory."""
 
         if self.fps.locked:
             raise TrajectoryError(f"FPS is locked by {self.fps.locked_by}.", self)
@@ -482,6 +504,9 @@ class Trajectory(object):
 
         self.data_send_time = time.time() - start_trajectory_send_time
 
+        if metrics.enabled:
+            _TRAJECTORY_SEND_TIME.observe(self.data_send_time)
+
         self._ready_to_start = True
         self.failed = False
 
@@ -497,7 +522,7 @@ class Trajectory(object):
             raise TrajectoryError("move_time not set.", self)
 
         # Start trajectories
-        n_expected = len([pos for pos in self.fps.values() if not pos.offline])
+        n_expected = len(self.fps._get_expected_positioners())
         command = await self.fps.send_command(
             "START_TRAJECTORY",
             positioner_ids=0,
@@ -512,9 +537,6 @@ class Trajectory(object):
             self.failed = True
             raise TrajectoryError("START_TRAJECTORY failed", self)
 
-        restart_pollers = True if self.fps.pollers.running else False
-        await self.fps.pollers.stop()
-
         self.start_time = time.time()
 
         try:
@@ -527,7 +549,7 @@ class Trajectory(object):
                         self,
                     )
 
-                await self.fps.update_status()
+                await self._update_status()
 
                 if self.fps.status & FPSStatus.IDLE:
                     self.failed = False
@@ -578,11 +600,43 @@ class Trajectory(object):
                 self.dump_trajectory()
 
             self.end_time = time.time()
-            if restart_pollers:
-                self.fps.pollers.start()
+
+            if metrics.enabled:
+                result = "failed" if self.failed else "success"
+                _TRAJECTORY_RUN_TIME.observe(
+                    self.end_time - self.start_time,
+                    labels=(result,),
+                )
 
         return True
 
+    async def _update_status(self):
+        """Updates the status of the FPS during the trajectory.
+
+        If the pollers are running they already update the status, at the rate
+        of the moving policy during the move. Sending another ``GET_STATUS``
+        broadcast would compete with them for the broadcast UID, so the status
+        pollers are woken and their next update is used instead.
+
+        """
+
+        status_pollers = [
+            poller
+            for poller in self.fps.pollers
+            if poller.name in ["status", "telemetry"] and poller.running
+        ]
+
+        if len(status_pollers) == 0:
+            await self.fps.update_status()
+            return
+
+        since = time.time()
+        for poller in status_pollers:
+            poller.wake(rerun=True)
+
+        if not await self.fps.wait_for_status_update(since, timeout=5):
+            await self.fps.update_status()
+
     def dump_trajectory(self, path: str | None = None):
         """Dumps the trajectory to a JSON file."""
 
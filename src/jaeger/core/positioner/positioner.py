@@ -60,10 +60,13 @@ class Positioner(StatusMixIn):
         self.alpha = None
         self.beta = None
         self.speed = (None, None)
-        self.firmware: str | None = None
 
-        self.disabled = False
-        self.offline = False
+        # These are exposed as properties so that the FPS indexes are updated
+        # when they change.
+        self._firmware: str | None = None
+        self._disabled = False
+        self._offline = False
+
         self.precise_moves = True
 
         super().__init__(
@@ -71,6 +74,45 @@ class Positioner(StatusMixIn):
             initial_status=maskbits.PositionerStatus.UNKNOWN,
         )
 
+    @property
+    def firmware(self) -> str | None:
+        """The firmware version of the positioner."""
+
+        return self._firmware
+
+    @firmware.setter
+    def firmware(self, value: str | None):
+        self._firmware = value
+        self._update_fps_index()
+
+    @property
+    def disabled(self) -> bool:
+        """Whether the positioner is disabled."""
+
+        return self._disabled
+
+    @disabled.setter
+    def disabled(self, value: bool):
+        self._disabled = value
+        self._update_fps_index()
+
+    @property
+    def offline(self) -> bool:
+        """Whether the positioner is offline."""
+
+        return self._offline
+
+    @offline.setter
+    def offline(self, value: bool):
+        self._offline = value
+        self._update_fps_index()
+
+    def _update_fps_index(self):
+        """Updates the FPS indexes for this positioner."""
+
+        if self.fps is not None:
+            self.fps._update_index(self)
+
     @property
     def position(self):
         """Returns a tuple with the ``(alpha, beta)`` position."""
@@ -200,7 +242,12 @@ class Positioner(StatusMixIn):
         status: maskbits.PositionerStatus | int | None = None,
         timeout=1.0,
     ):
-        """Updates the status of the positioner."""
+        """Updates the status of the positioner.
+
+        If ``status`` is passed and the firmware version is known, no commands
+        are sent to the positioner.
+
+        """
 
         assert self.fps, "FPS is not set."
 
@@ -208,7 +255,8 @@ class Positioner(StatusMixIn):
         if not self.firmware:
             await self.update_firmware_version()
 
-        if not status:
+        # A status of zero (no bits set) is a valid reply.
+        if status is None:
             command = await self.send_command(
                 CommandID.GET_STATUS,
                 timeout=timeout,
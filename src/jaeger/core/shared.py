@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: shared.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import os
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+from typing import Optional, Tuple
+
+import numpy
+
+from jaeger.core import log
+from jaeger.core.exceptions import JaegerError
+from jaeger.core.telemetry import STATE_DTYPE
+
+
+__all__ = ["SHARED_HEADER_DTYPE", "SharedStateWriter", "SharedStateReader"]
+
+
+#: The header of the shared memory segment. It is followed by an array of
+#: ``capacity`` rows with `.STATE_DTYPE`, of which the first ``n_positioners``
+#: are valid. ``owner_pid`` is the process ID of the writer. ``sequence`` is
+#: odd while the segment is being written.
+SHARED_HEADER_DTYPE = numpy.dtype(
+    [
+        ("magic", "S4"),
+        ("version", "<u2"),
+        ("header_size", "<u2"),
+        ("capacity", "<u4"),
+        ("n_positioners", "<u4"),
+        ("owner_pid", "<i8"),
+        ("sequence", "<u8"),
+        ("time", "<f8"),
+    ]
+)
+
+SHARED_MAGIC = b"JGRM"
+SHARED_VERSION = 2
+
+
+def _get_views(buffer: memoryview, capacity: int):
+    """Returns the header and state views of a shared memory buffer."""
+
+    header = numpy.ndarray((), dtype=SHARED_HEADER_DTYPE, buffer=buffer)
+    state = numpy.ndarray(
+        (capacity,),
+        dtype=STATE_DTYPE,
+        buffer=buffer,
+        offset=SHARED_HEADER_DTYPE.itemsize,
+    )
+
+    return header, state
+
+
+def _is_process_alive(pid: int) -> bool:
+    """Returns whether a process with a given PID is running."""
+
+    if pid <= 0:
+        return False
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but belongs to another user.
+        return True
+
+    return True
+
+
+class SharedStateWriter:
+    """Exports the state of the FPS to a shared memory segment.
+
+    The segment contains a `.SHARED_HEADER_DTYPE` header followed by a
+    `.STATE_DTYPE` array, and is updated in place. Writes are protected by a
+    sequence counter (a seqlock): the counter is incremented before and after
+    each write, so readers can detect a write in progress (odd counter) or a
+    write that happened while they were reading (different counter). See
+    `.SharedStateReader`.
+
+    If a segment with the same name already exists, it is only replaced if it
+    was left behind by a writer that is no longer running. Otherwise a
+    `.JaegerError` is raised.
+
+    Parameters
+    ----------
+    name
+        The name of the shared memory segment.
+    capacity
+        The maximum number of positioners.
+
+    """
+
+    def __init__(self, name: str = "jaeger_fps_state", capacity: int = 600):
+        self.name = name
+        self.capacity = capacity
+
+        size = SHARED_HEADER_DTYPE.itemsize + capacity * STATE_DTYPE.itemsize
+
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            self._remove_stale_segment()
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        self.header, self.state = _get_views(self.shm.buf, capacity)
+
+        self.header["magic"] = SHARED_MAGIC
+        self.header["version"] = SHARED_VERSION
+        self.header["header_size"] = SHARED_HEADER_DTYPE.itemsize
+        self.header["capacity"] = capacity
+        self.header["n_positioners"] = 0
+        self.header["owner_pid"] = os.getpid()
+        self.header["sequence"] = 0
+        self.header["time"] = numpy.nan
+
+    def _remove_stale_segment(self):
+        """Removes an existing segment left behind by a writer that has exited.
+
+        Raises `.JaegerError` if the segment is not a jaeger shared state segment
+        of the current version or if its writer is still running.
+
+        """
+
+        existing = shared_memory.SharedMemory(name=self.name)
+
+        try:
+            if existing.size < SHARED_HEADER_DTYPE.itemsize:
+                raise JaegerError(
+                    f"{self.name!r} is not a jaeger shared state segment."
+                )
+
+            header = numpy.ndarray((), dtype=SHARED_HEADER_DTYPE, buffer=existing.buf)
+            magic = bytes(header["magic"])
+            version = int(header["version"])
+            owner_pid = int(header["owner_pid"])
+            del header
+
+            if magic != SHARED_MAGIC or version != SHARED_VERSION:
+                raise JaegerError(
+                    f"{self.name!r} is not a jaeger shared state segment "
+                    f"with version {SHARED_VERSION}. Remove it manually."
+                )
+
+            if _is_process_alive(owner_pid):
+                raise JaegerError(
+                    f"Shared state segment {self.name!r} is in use "
+                    f"by process {owner_pid}."
+                )
+
+        finally:
+            existing.close()
+
+        # Left behind by a process that did not shut down cleanly.
+        log.warning(f"Removing stale shared state segment {self.name!r}.")
+        existing.unlink()
+
+    def update(self, state: numpy.ndarray, t: Optional[float] = None):
+        """Writes a `.STATE_DTYPE` array to the segment.
+
+        Parameters
+        ----------
+        state
+            The state array. Rows beyond the capacity of the segment are ignored.
+        t
+            The Unix time of the update. Defaults to `time.time`.
+
+        """
+
+        n_positioners = min(len(state), self.capacity)
+        sequence = int(self.header["sequence"])
+
+        self.header["sequence"] = sequence + 1
+
+        self.state[:n_positioners] = state[:n_positioners]
+        self.header["n_positioners"] = n_positioners
+        self.header["time"] = time.time() if t is None else t
+
+        self.header["sequence"] = sequence + 2
+
+    def close(self, unlink: bool = True):
+        """Closes and optionally removes the segment."""
+
+        # Release the views before closing the buffer.
+        del self.header
+        del self.state
+
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+class SharedStateReader:
+    """Reads the FPS state exported by a `.SharedStateWriter`.
+
+    Can be used from any process in the same host ::
+
+        reader = SharedStateReader()
+        sequence, t, state = reader.read()
+
+    Parameters
+    ----------
+    name
+        The name of the shared memory segment.
+
+    """
+
+    def __init__(self, name: str = "jaeger_fps_state"):
+        self.name = name
+
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13 registers the segment with the resource tracker of
+            # the reader process, which would remove it when the reader exits.
+            self.shm = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(self.shm._name, "shared_memory")  # type: ignore
+
+        header = numpy.ndarray((), dtype=SHARED_HEADER_DTYPE, buffer=self.shm.buf)
+        if header["magic"] != SHARED_MAGIC or header["version"] != SHARED_VERSION:
+            raise JaegerError(f"{name!r} is not a jaeger shared state segment.")
+
+        capacity = int(header["capacity"])
+        del header
+
+        self.header, self.state = _get_views(self.shm.buf, capacity)
+
+    @property
+    def sequence(self) -> int:
+        """The current sequence number. Changes with each update."""
+
+        return int(self.header["sequence"])
+
+    def read(self, max_tries: int = 1000) -> Tuple[int, float, numpy.ndarray]:
+        """Returns a consistent copy of the state.
+
+        Parameters
+        ----------
+        max_tries
+            The maximum number of attempts if the segment is being written.
+
+        Returns
+        -------
+        state
+            A tuple with the sequence number, the Unix time of the update, and a
+            copy of the `.STATE_DTYPE` array.
+
+        """
+
+        for _ in range(max_tries):
+            sequence = int(self.header["sequence"])
+            if sequence % 2 == 1:
+                time.sleep(0)
+                continue
+
+            n_positioners = int(self.header["n_positioners"])
+            state = self.state[:n_positioners].copy()
+            t = float(self.header["time"])
+
+            if int(self.header["sequence"]) == sequence:
+                return sequence, t, state
+
+        raise JaegerError("Failed getting a consistent read of the shared state.")
+
+    def close(self):
+        """Closes the segment. The segment is not removed."""
+
+        del self.header
+        del self.state
+
+        self.shm.close()
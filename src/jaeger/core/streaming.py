@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: streaming.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import os
+import struct
+import time
+
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import numpy
+
+from jaeger.core import log
+from jaeger.core.telemetry import STATE_DTYPE, get_state_array
+
+
+if TYPE_CHECKING:
+    from jaeger.core.fps import FPS
+    from jaeger.core.telemetry import TelemetrySubscription
+
+
+__all__ = [
+    "FRAME_HEADER",
+    "FRAME_MAGIC",
+    "FRAME_VERSION",
+    "TelemetryStreamServer",
+    "decode_frame",
+    "read_frame",
+]
+
+
+#: The frame header: magic, version, header size, sequence number, Unix time,
+#: and number of positioners. Padded to 32 bytes.
+FRAME_HEADER = struct.Struct("<4sHHQdI4x")
+
+FRAME_MAGIC = b"JGRS"
+FRAME_VERSION = 1
+
+
+def decode_frame(frame: bytes) -> Tuple[int, float, numpy.ndarray]:
+    """Decodes a binary telemetry frame.
+
+    Parameters
+    ----------
+    frame
+        The frame, including the header.
+
+    Returns
+    -------
+    decoded
+        A tuple of sequence number, Unix time, and a `.STATE_DTYPE` array with
+        the state of the positioners.
+
+    """
+
+    magic, version, header_size, sequence, t, n_positioners = FRAME_HEADER.unpack(
+        frame[: FRAME_HEADER.size]
+    )
+
+    if magic != FRAME_MAGIC or version != FRAME_VERSION:
+        raise ValueError("Invalid telemetry frame.")
+
+    state = numpy.frombuffer(
+        frame,
+        dtype=STATE_DTYPE,
+        count=n_positioners,
+        offset=header_size,
+    )
+
+    return sequence, t, state
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[int, float, numpy.ndarray]:
+    """Reads and decodes the next frame from a telemetry stream."""
+
+    header = await reader.readexactly(FRAME_HEADER.size)
+    __, __, header_size, __, __, n_positioners = FRAME_HEADER.unpack(header)
+
+    if header_size < FRAME_HEADER.size:
+        raise ValueError("Invalid telemetry frame.")
+
+    # Future versions may extend the header. Skip to the end of it.
+    if header_size > FRAME_HEADER.size:
+        header += await reader.readexactly(header_size - FRAME_HEADER.size)
+
+    data = await reader.readexactly(n_positioners * STATE_DTYPE.itemsize)
+
+    return decode_frame(header + data)
+
+
+class _StreamClient:
+    """A client connected to the `.TelemetryStreamServer`."""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.task = asyncio.current_task()
+
+        self.interval: float = 0.0
+        self.last_sent: float = 0.0
+
+        self.n_sent: int = 0
+        self.n_dropped: int = 0
+        self.n_consecutive_dropped: int = 0
+
+        # A frame scheduled for the end of the interval, if one was skipped.
+        self.trailing: asyncio.TimerHandle | None = None
+
+
+class TelemetryStreamServer:
+    """Streams the state of the FPS to local clients as binary frames.
+
+    Each frame is a `.FRAME_HEADER` followed by a `.STATE_DTYPE` array with the
+    state of all the positioners (see `.decode_frame` and `.read_frame`). A frame
+    is published when the FPS telemetry hub reports a change, at most
+    ``max_rate`` times per second. The sequence number increases by one with each
+    published frame so that clients can detect skipped frames.
+
+    A frame with the current state is sent to each client when it connects.
+    A client can limit the rate at which it receives frames by sending the line
+    ``rate <Hz>``. If frames are skipped because of the rate limit, the latest
+    state is sent at the end of the interval so that the client does not miss
+    the last change. Frames are not sent to a client whose write buffer exceeds
+    ``max_buffer`` bytes, and clients that miss more than ``max_dropped``
+    consecutive frames are disconnected. Slow clients never block the FPS.
+
+    Parameters
+    ----------
+    fps
+        The `.FPS` instance.
+    path
+        The path of a Unix socket to listen on. If `None`, listens on a TCP
+        socket on ``host`` and ``port``.
+    host
+        The host for the TCP server.
+    port
+        The port for the TCP server.
+    max_rate
+        The maximum rate at which frames are published, in Hz.
+    max_buffer
+        The maximum size of the write buffer of a client, in bytes.
+    max_dropped
+        The maximum number of consecutive dropped frames before a client is
+        disconnected.
+
+    """
+
+    def __init__(
+        self,
+        fps: FPS,
+        path: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 19995,
+        max_rate: float = 10.0,
+        max_buffer: int = 1_000_000,
+        max_dropped: int = 100,
+    ):
+        self.fps = fps
+
+        self.path = os.path.expanduser(path) if path else None
+        self.host = host
+        self.port = port
+
+        self.max_rate = max_rate
+        self.max_buffer = max_buffer
+        self.max_dropped = max_dropped
+
+        self.clients: List[_StreamClient] = []
+        self.sequence: int = 0
+
+        self._server: asyncio.AbstractServer | None = None
+        self._subscription: TelemetrySubscription | None = None
+        self._publish_task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the server is running."""
+
+        return self._server is not None
+
+    async def start(self):
+        """Starts the server."""
+
+        if self._server is not None:
+            return
+
+        if self.path:
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            self._server = await asyncio.start_unix_server(
+                self._handle_client,
+                path=self.path,
+            )
+            log.info(f"Started telemetry stream on {self.path}.")
+        else:
+            self._server = await asyncio.start_server(
+                self._handle_client,
+                host=self.host,
+                port=self.port,
+            )
+            log.info(f"Started telemetry stream on {self.host}:{self.port}.")
+
+        # A queue of one event. Events arriving while a frame is being published
+        # are merged so the next frame always reflects the latest state.
+        self._subscription = self.fps.subscribe(maxsize=1)
+        self._publish_task = asyncio.create_task(self._publish_loop())
+
+    async def stop(self):
+        """Stops the server and disconnects the clients."""
+
+        if self._publish_task is not None:
+            self._publish_task.cancel()
+            await asyncio.gather(self._publish_task, return_exceptions=True)
+            self._publish_task = None
+
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+
+        # Closing the connection ends the client handlers.
+        tasks = [client.task for client in self.clients if client.task]
+        for client in list(self.clients):
+            self._disconnect(client)
+        if len(tasks) > 0:
+            await asyncio.wait(tasks, timeout=1)
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        if self.path and os.path.exists(self.path):
+            os.unlink(self.path)
+
+    async def _handle_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        """Registers a client and processes its requests."""
+
+        client = _StreamClient(writer)
+        self.clients.append(client)
+
+        self._send(client, self.get_frame(), time.monotonic())
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                parts = line.decode().split()
+                if len(parts) == 2 and parts[0] == "rate":
+                    try:
+                        rate = float(parts[1])
+                    except ValueError:
+                        continue
+                    client.interval = 1.0 / rate if rate > 0 else 0.0
+
+        except (ConnectionError, UnicodeDecodeError):
+            pass
+
+        finally:
+            self._disconnect(client)
+
+    def _disconnect(self, client: _StreamClient):
+        """Closes and removes a client."""
+
+        if client in self.clients:
+            self.clients.remove(client)
+
+        if client.trailing is not None:
+            client.trailing.cancel()
+            client.trailing = None
+
+        client.writer.close()
+
+    async def _publish_loop(self):
+        """Publishes a frame when the FPS state changes."""
+
+        assert self._subscription is not None
+
+        min_interval = 1.0 / self.max_rate if self.max_rate > 0 else 0.0
+
+        while True:
+            await self._subscription.get()
+
+            t0 = time.monotonic()
+            if len(self.clients) > 0:
+                self.publish()
+
+            await asyncio.sleep(max(min_interval - (time.monotonic() - t0), 0))
+
+    def get_frame(self) -> bytes:
+        """Returns a frame with the current state of the FPS."""
+
+        state = get_state_array(
+            self.fps.positioners.values(),
+            times=self.fps.telemetry_times,
+        )
+
+        header = FRAME_HEADER.pack(
+            FRAME_MAGIC,
+            FRAME_VERSION,
+            FRAME_HEADER.size,
+            self.sequence,
+            time.time(),
+            len(state),
+        )
+
+        return header + state.tobytes()
+
+    def publish(self):
+        """Sends a frame with the current state to all the clients."""
+
+        self.sequence += 1
+        frame = self.get_frame()
+
+        now = time.monotonic()
+
+        for client in list(self.clients):
+            if client.interval > 0 and now - client.last_sent < client.interval:
+                if client.trailing is None:
+                    delay = client.interval - (now - client.last_sent)
+                    client.trailing = asyncio.get_running_loop().call_later(
+                        delay,
+                        self._send_trailing,
+                        client,
+                    )
+                continue
+
+            self._send(client, frame, now)
+
+    def _send_trailing(self, client: _StreamClient):
+        """Sends the latest state to a client that skipped frames."""
+
+        client.trailing = None
+
+        if client in self.clients:
+            self._send(client, self.get_frame(), time.monotonic())
+
+    def _send(self, client: _StreamClient, frame: bytes, now: float):
+        """Sends a frame to a client unless its write buffer is full."""
+
+        if client.trailing is not None:
+            client.trailing.cancel()
+            client.trailing = None
+
+        transport = client.writer.transport
+        if transport.is_closing():
+            self._disconnect(client)
+            return
+
+        if transport.get_write_buffer_size() > self.max_buffer:
+            client.n_dropped += 1
+            client.n_consecutive_dropped += 1
+            if client.n_consecutive_dropped > self.max_dropped:
+                log.warning("Disconnecting slow telemetry stream client.")
+                self._disconnect(client)
+            return
+
+        client.writer.write(frame)
+        client.last_sent = now
+        client.n_sent += 1
+        client.n_consecutive_dropped = 0
@@ -0,0 +1,910 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: telemetry.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import enum
+import json
+import os
+import pathlib
+import time
+import warnings
+from dataclasses import dataclass, field
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy
+
+from jaeger.core import log
+from jaeger.core.exceptions import JaegerUserWarning
+from jaeger.core.maskbits import FPSStatus
+from jaeger.core.utils import run_in_executor
+
+
+if TYPE_CHECKING:
+    from jaeger.core.positioner import Positioner
+
+
+__all__ = [
+    "STATE_DTYPE",
+    "StateFlags",
+    "get_state_array",
+    "TelemetryEvent",
+    "TelemetrySubscription",
+    "TelemetryHub",
+    "TelemetryHistory",
+    "TelemetryArchive",
+    "read_telemetry_archive",
+    "get_archive_mjd",
+]
+
+
+#: The columns in the telemetry archive and their data types.
+ARCHIVE_COLUMNS: Dict[str, str] = {
+    "time": "f8",
+    "positioner_id": "i4",
+    "alpha": "f8",
+    "beta": "f8",
+    "status": "i8",
+    "latency": "f8",
+}
+
+
+#: The layout of the FPS state array shared with external consumers. Positions
+#: that are not known are NaN. ``time`` is the Unix time of the last update.
+STATE_DTYPE = numpy.dtype(
+    [
+        ("positioner_id", "<i4"),
+        ("flags", "<u4"),
+        ("alpha", "<f8"),
+        ("beta", "<f8"),
+        ("status", "<u8"),
+        ("time", "<f8"),
+    ]
+)
+
+
+class StateFlags(enum.IntFlag):
+    """Flags in the ``flags`` field of the state array."""
+
+    DISABLED = 1
+    OFFLINE = 2
+    BOOTLOADER = 4
+
+
+def get_state_array(
+    positioners: Iterable[Positioner],
+    times: Optional[Dict[int, float]] = None,
+) -> numpy.ndarray:
+    """Returns the state of a list of positioners as a `.STATE_DTYPE` array.
+
+    Parameters
+    ----------
+    positioners
+        The positioners to include, in order.
+    times
+        A dictionary of positioner ID to the Unix time of its last update.
+
+    """
+
+    times = times or {}
+    nan = numpy.nan
+
+    rows = []
+    for positioner in positioners:
+        flags = 0
+        if positioner.disabled:
+            flags |= StateFlags.DISABLED
+        if positioner.offline:
+            flags |= StateFlags.OFFLINE
+        if positioner.is_bootloader():
+            flags |= StateFlags.BOOTLOADER
+
+        pid = positioner.positioner_id
+        rows.append(
+            (
+                pid,
+                flags,
+                nan if positioner.alpha is None else positioner.alpha,
+                nan if positioner.beta is None else positioner.beta,
+                int(positioner.status),
+                times.get(pid, nan),
+            )
+        )
+
+    return numpy.array(rows, dtype=STATE_DTYPE)
+
+
+#: A positioner row: ``(alpha, beta, status)``.
+PositionerRow = Tuple[Optional[float], Optional[float], int]
+
+
+@dataclass
+class TelemetryEvent:
+    """An event published by the `.TelemetryHub`.
+
+    Parameters
+    ----------
+    time
+        The Unix time of the event.
+    status
+        The new status of the FPS, or `None` if it has not changed.
+    positioners
+        A dictionary of positioner ID to ``(alpha, beta, status)`` with only the
+        positioners that have changed since the previous event.
+
+    """
+
+    time: float
+    status: Optional[FPSStatus] = None
+    positioners: Dict[int, PositionerRow] = field(default_factory=dict)
+
+    def merge(self, event: TelemetryEvent):
+        """Merges a later event into this one."""
+
+        self.time = event.time
+        if event.status is not None:
+            self.status = event.status
+        self.positioners.update(event.positioners)
+
+
+class TelemetrySubscription:
+    """A subscription to a `.TelemetryHub`.
+
+    Events are queued for each subscription independently. If the queue is full
+    the new event is merged into the last queued event, so a slow subscriber
+    skips intermediate states but always receives the latest status and
+    positions. Subscriptions can be iterated ::
+
+        with fps.hub.subscribe() as subscription:
+            async for event in subscription:
+                ...
+
+    Parameters
+    ----------
+    hub
+        The `.TelemetryHub` that publishes the events.
+    maxsize
+        The maximum number of queued events.
+    positioners
+        If `False`, only FPS status changes are received.
+
+    """
+
+    def __init__(self, hub: TelemetryHub, maxsize: int = 100, positioners=True):
+        self.hub = hub
+        self.maxsize = max(maxsize, 1)
+        self.positioners = positioners
+
+        #: The number of events that have been merged into a queued event.
+        self.n_coalesced: int = 0
+
+        self._events: collections.deque[TelemetryEvent] = collections.deque()
+        self._ready = asyncio.Event()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excinfo):
+        self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> TelemetryEvent:
+        return await self.get()
+
+    def __len__(self):
+        return len(self._events)
+
+    def put(self, event: TelemetryEvent):
+        """Queues an event, merging it with the last one if the queue is full."""
+
+        if not self.positioners:
+            if event.status is None:
+                return
+            event = TelemetryEvent(event.time, status=event.status)
+
+        if len(self._events) >= self.maxsize:
+            self._events[-1].merge(event)
+            self.n_coalesced += 1
+        else:
+            self._events.append(event)
+
+        self._ready.set()
+
+    async def get(self) -> TelemetryEvent:
+        """Waits for and returns the next event."""
+
+        while len(self._events) == 0:
+            self._ready.clear()
+            await self._ready.wait()
+
+        return self._events.popleft()
+
+    def close(self):
+        """Unsubscribes from the hub."""
+
+        self.hub.unsubscribe(self)
+
+
+class TelemetryHub:
+    """Publishes FPS status changes and positioner deltas to subscribers.
+
+    Each subscriber receives its own copy of the events (see
+    `.TelemetrySubscription`). Positioner updates are compared with the last
+    published values so that only the rows that have changed are sent. If there
+    are no subscribers publishing is a no-op.
+
+    """
+
+    def __init__(self):
+        self.subscriptions: List[TelemetrySubscription] = []
+
+        self._rows: Dict[int, PositionerRow] = {}
+
+    def __len__(self):
+        return len(self.subscriptions)
+
+    def subscribe(self, maxsize: int = 100, positioners: bool = True):
+        """Returns a new `.TelemetrySubscription`.
+
+        Parameters
+        ----------
+        maxsize
+            The maximum number of queued events before they are coalesced.
+        positioners
+            If `False`, only FPS status changes are received.
+
+        """
+
+        subscription = TelemetrySubscription(
+            self,
+            maxsize=maxsize,
+            positioners=positioners,
+        )
+        self.subscriptions.append(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: TelemetrySubscription):
+        """Removes a subscription."""
+
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+
+        if len(self.subscriptions) == 0:
+            self._rows = {}
+
+    def publish(
+        self,
+        status: Optional[FPSStatus] = None,
+        positioners: Optional[Dict[int, PositionerRow]] = None,
+    ):
+        """Publishes an FPS status change and/or positioner updates.
+
+        Parameters
+        ----------
+        status
+            The new FPS status.
+        positioners
+            A dictionary of positioner ID to ``(alpha, beta, status)``. Rows that
+            have not changed since they were last published are not sent.
+
+        """
+
+        if len(self.subscriptions) == 0:
+            return
+
+        changed: Dict[int, PositionerRow] = {}
+        for positioner_id, row in (positioners or {}).items():
+            if self._rows.get(positioner_id, None) != row:
+                changed[positioner_id] = row
+                self._rows[positioner_id] = row
+
+        if status is None and len(changed) == 0:
+            return
+
+        t = time.time()
+        for subscription in self.subscriptions:
+            event = TelemetryEvent(t, status=status, positioners=changed.copy())
+            subscription.put(event)
+
+
+class TelemetryHistory:
+    """A fixed-size, time-indexed history of positioner positions and statuses.
+
+    The history is stored in preallocated arrays with shape
+    ``(size, max_positioners)`` used as a ring buffer. Each call to `.record`
+    adds a row with a monotonic timestamp. Values not measured in that row are
+    stored as NaN (positions) or -1 (statuses).
+
+    Parameters
+    ----------
+    size
+        The number of rows (updates) to keep.
+    max_positioners
+        The maximum number of positioners that can be recorded. Positioners are
+        assigned a column the first time they are recorded.
+
+    """
+
+    def __init__(self, size: int = 1000, max_positioners: int = 600):
+        self.size = size
+        self.max_positioners = max_positioners
+
+        self.times = numpy.full(size, numpy.nan, dtype=numpy.float64)
+        self.alpha = numpy.full((size, max_positioners), numpy.nan)
+        self.beta = numpy.full((size, max_positioners), numpy.nan)
+        self.status = numpy.full((size, max_positioners), -1, dtype=numpy.int64)
+
+        self._columns: Dict[int, int] = {}
+
+        self._next = 0
+        self._n_rows = 0
+
+        self._warned_full = False
+
+    def __len__(self):
+        return self._n_rows
+
+    @property
+    def nbytes(self) -> int:
+        """The memory used by the history arrays, in bytes."""
+
+        arrays = [self.times, self.alpha, self.beta, self.status]
+        return sum([array.nbytes for array in arrays])
+
+    def clear(self):
+        """Clears the history."""
+
+        self.times[:] = numpy.nan
+        self.alpha[:] = numpy.nan
+        self.beta[:] = numpy.nan
+        self.status[:] = -1
+
+        self._columns = {}
+        self._next = 0
+        self._n_rows = 0
+
+    def _get_column(self, positioner_id: int) -> int | None:
+        """Returns the column for a positioner, assigning one if needed."""
+
+        column = self._columns.get(positioner_id, None)
+        if column is not None:
+            return column
+
+        if len(self._columns) >= self.max_positioners:
+            if not self._warned_full:
+                warnings.warn(
+                    "Telemetry history is full. New positioners will not be recorded.",
+                    JaegerUserWarning,
+                )
+                self._warned_full = True
+            return None
+
+        column = len(self._columns)
+        self._columns[positioner_id] = column
+
+        return column
+
+    def record(
+        self,
+        positions: Optional[Dict[int, Tuple[float, float]]] = None,
+        statuses: Optional[Dict[int, int]] = None,
+        t: Optional[float] = None,
+    ):
+        """Records a row of positions and/or statuses.
+
+        Parameters
+        ----------
+        positions
+            A dictionary of positioner ID to ``(alpha, beta)``.
+        statuses
+            A dictionary of positioner ID to status as an integer.
+        t
+            The monotonic time of the update. Defaults to `time.monotonic`.
+
+        """
+
+        if not positions and not statuses:
+            return
+
+        row = self._next
+
+        self.times[row] = time.monotonic() if t is None else t
+        self.alpha[row, :] = numpy.nan
+        self.beta[row, :] = numpy.nan
+        self.status[row, :] = -1
+
+        for positioner_id, (alpha, beta) in (positions or {}).items():
+            column = self._get_column(positioner_id)
+            if column is None or alpha is None or beta is None:
+                continue
+            self.alpha[row, column] = alpha
+            self.beta[row, column] = beta
+
+        for positioner_id, status in (statuses or {}).items():
+            column = self._get_column(positioner_id)
+            if column is None:
+                continue
+            self.status[row, column] = int(status)
+
+        self._next = (row + 1) % self.size
+        self._n_rows = min(self._n_rows + 1, self.size)
+
+    def _get_rows(self) -> numpy.ndarray:
+        """Returns the indices of the recorded rows in chronological order."""
+
+        if self._n_rows < self.size:
+            return numpy.arange(self._n_rows)
+
+        return numpy.roll(numpy.arange(self.size), -self._next)
+
+    def _get_columns(
+        self,
+        positioner_ids: Optional[List[int]] = None,
+    ) -> Tuple[List[int], List[int]]:
+        """Returns the recorded positioner IDs and their columns."""
+
+        if positioner_ids is None:
+            positioner_ids = list(self._columns)
+
+        pids = [pid for pid in positioner_ids if pid in self._columns]
+
+        return pids, [self._columns[pid] for pid in pids]
+
+    def query(
+        self,
+        seconds: Optional[float] = None,
+        positioner_ids: Optional[List[int]] = None,
+    ) -> Dict[str, numpy.ndarray | List[int]]:
+        """Returns the history for the last ``seconds``.
+
+        Parameters
+        ----------
+        seconds
+            How far back to query, in seconds. If `None`, returns all the
+            recorded history.
+        positioner_ids
+            The positioners to return. If `None`, returns all the recorded
+            positioners.
+
+        Returns
+        -------
+        history
+            A dictionary with the ``positioner_ids``, the ``times`` array with
+            shape ``(n_rows,)``, and the ``alpha``, ``beta``, and ``status``
+            arrays with shape ``(n_rows, n_positioners)``, in chronological order.
+
+        """
+
+        rows = self._get_rows()
+        if seconds is not None:
+            rows = rows[self.times[rows] >= time.monotonic() - seconds]
+
+        pids, columns = self._get_columns(positioner_ids)
+
+        return {
+            "positioner_ids": pids,
+            "times": self.times[rows],
+            "alpha": self.alpha[numpy.ix_(rows, columns)],
+            "beta": self.beta[numpy.ix_(rows, columns)],
+            "status": self.status[numpy.ix_(rows, columns)],
+        }
+
+    def at(
+        self,
+        t: float,
+        positioner_ids: Optional[List[int]] = None,
+    ) -> Dict[int, Tuple[float, float, int]]:
+        """Returns the last values measured at or before a given time.
+
+        Parameters
+        ----------
+        t
+            The monotonic time.
+        positioner_ids
+            The positioners to return. If `None`, returns all the recorded
+            positioners.
+
+        Returns
+        -------
+        values
+            A dictionary of positioner ID to ``(alpha, beta, status)``. Values
+            that had not been measured at time ``t`` are NaN or -1.
+
+        """
+
+        rows = self._get_rows()
+        rows = rows[self.times[rows] <= t]
+
+        pids, columns = self._get_columns(positioner_ids)
+
+        values = {}
+        for pid, column in zip(pids, columns):
+            alpha_col = self.alpha[rows, column]
+            status_col = self.status[rows, column]
+
+            measured = numpy.nonzero(~numpy.isnan(alpha_col))[0]
+            if len(measured) > 0:
+                alpha = float(alpha_col[measured[-1]])
+                beta = float(self.beta[rows[measured[-1]], column])
+            else:
+                alpha = beta = numpy.nan
+
+            measured = numpy.nonzero(status_col >= 0)[0]
+            status = int(status_col[measured[-1]]) if len(measured) > 0 else -1
+
+            values[pid] = (alpha, beta, status)
+
+        return values
+
+    def velocity(
+        self,
+        positioner_ids: Optional[List[int]] = None,
+        seconds: float = 5.0,
+    ) -> Dict[int, Tuple[float, float]]:
+        """Estimates the velocity of each positioner, in degrees per second.
+
+        The velocity is the slope of a linear fit to the positions measured in
+        the last ``seconds``. Positioners with fewer than two measurements in
+        that period have NaN velocities.
+
+        """
+
+        history = self.query(seconds=seconds, positioner_ids=positioner_ids)
+        times = history["times"]
+
+        velocities = {}
+        for ii, pid in enumerate(history["positioner_ids"]):
+            alpha = history["alpha"][:, ii]
+            beta = history["beta"][:, ii]
+
+            measured = ~numpy.isnan(alpha)
+            if measured.sum() < 2:
+                velocities[pid] = (numpy.nan, numpy.nan)
+                continue
+
+            tt = times[measured] - times[measured][0]
+            valpha = numpy.polyfit(tt, alpha[measured], 1)[0]
+            vbeta = numpy.polyfit(tt, beta[measured], 1)[0]
+
+            velocities[pid] = (float(valpha), float(vbeta))
+
+        return velocities
+
+
+def get_archive_mjd(t: float | numpy.ndarray) -> int | numpy.ndarray:
+    """Returns the MJD used to group the archive data for a Unix time.
+
+    The MJD is offset by 0.3 days, as is the SDSS convention, so that a night
+    is not split at UTC midnight. If ``t`` is an array, returns an array of
+    MJDs.
+
+    """
+
+    mjd = t / 86400.0 + 40587.3
+
+    if isinstance(mjd, numpy.ndarray):
+        return mjd.astype(int)
+
+    return int(mjd)
+
+
+class TelemetryArchive:
+    """Appends telemetry to rotating columnar files on disk.
+
+    Each row contains the ``time`` (Unix time), ``positioner_id``, ``alpha``,
+    ``beta``, ``status``, and the ``latency`` of the reply, in seconds. The data
+    are grouped by MJD (see `.get_archive_mjd`) and stored as ::
+
+        <path>/<mjd>/index.json
+        <path>/<mjd>/<segment>/<column>.npy
+
+    where each segment contains one ``.npy`` file per column preallocated with
+    ``segment_size`` rows. A new segment is started when the current one is full
+    or the MJD changes. The index records the number of rows written to each
+    segment. Rows are buffered and written in batches in an executor so that
+    writing does not block the event loop. Use `.read_telemetry_archive` to
+    read the data back.
+
+    Parameters
+    ----------
+    path
+        The root directory of the archive.
+    segment_size
+        The number of rows in each segment.
+    batch_size
+        The number of buffered rows that triggers a write.
+    flush_interval
+        Maximum time, in seconds, that rows are buffered before being written.
+
+    """
+
+    def __init__(
+        self,
+        path: str | pathlib.Path,
+        segment_size: int = 1_000_000,
+        batch_size: int = 5000,
+        flush_interval: float = 10.0,
+    ):
+        self.path = pathlib.Path(os.path.expanduser(os.path.expandvars(str(path))))
+
+        self.segment_size = segment_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._pending: List[Dict[str, numpy.ndarray]] = []
+        self._n_pending: int = 0
+        self._last_flush = time.monotonic()
+
+        self._flush_lock = asyncio.Lock()
+        self._flush_tasks: set[asyncio.Task] = set()
+
+        # The current segment. Only accessed while writing, under the lock.
+        self._mjd: int | None = None
+        self._index: Dict[str, Any] | None = None
+        self._memmaps: Dict[str, numpy.memmap] = {}
+
+    def append(
+        self,
+        positions: Optional[Dict[int, Tuple[float, float]]] = None,
+        statuses: Optional[Dict[int, int]] = None,
+        latencies: Optional[Dict[int, float]] = None,
+        t: Optional[float] = None,
+    ):
+        """Buffers one row per positioner. Writes them if the buffer is full.
+
+        Parameters
+        ----------
+        positions
+            A dictionary of positioner ID to ``(alpha, beta)``.
+        statuses
+            A dictionary of positioner ID to status as an integer.
+        latencies
+            A dictionary of positioner ID to reply latency, in seconds.
+        t
+            The Unix time of the update. Defaults to `time.time`.
+
+        """
+
+        positions = positions or {}
+        statuses = statuses or {}
+        latencies = latencies or {}
+
+        pids = sorted(set(positions) | set(statuses))
+        if len(pids) == 0:
+            return
+
+        nan = numpy.nan
+
+        rows = {
+            "time": numpy.full(len(pids), time.time() if t is None else t),
+            "positioner_id": numpy.array(pids, dtype=ARCHIVE_COLUMNS["positioner_id"]),
+            "alpha": numpy.array([positions.get(pid, (nan, nan))[0] for pid in pids]),
+            "beta": numpy.array([positions.get(pid, (nan, nan))[1] for pid in pids]),
+            "status": numpy.array([statuses.get(pid, -1) for pid in pids]),
+            "latency": numpy.array([latencies.get(pid, nan) for pid in pids]),
+        }
+
+        self._pending.append(rows)
+        self._n_pending += len(pids)
+
+        elapsed = time.monotonic() - self._last_flush
+        if self._n_pending >= self.batch_size or elapsed >= self.flush_interval:
+            task = asyncio.create_task(self.flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self):
+        """Writes the buffered rows to disk."""
+
+        async with self._flush_lock:
+            if len(self._pending) == 0:
+                return
+
+            batch = {
+                column: numpy.concatenate([rows[column] for rows in self._pending])
+                for column in ARCHIVE_COLUMNS
+            }
+
+            self._pending = []
+            self._n_pending = 0
+            self._last_flush = time.monotonic()
+
+            try:
+                await run_in_executor(self._write, batch)
+            except Exception as err:
+                log.error(f"Failed writing to the telemetry archive: {err}")
+
+    async def close(self):
+        """Writes the buffered rows and closes the current segment."""
+
+        await self.flush()
+
+        async with self._flush_lock:
+            self._close_segment()
+
+    def _write(self, batch: Dict[str, numpy.ndarray]):
+        """Writes a batch of rows. Runs in an executor."""
+
+        mjds = get_archive_mjd(batch["time"])
+
+        for mjd in numpy.unique(mjds):
+            mask = mjds == mjd
+            n_rows = int(mask.sum())
+
+            written = 0
+            while written < n_rows:
+                if (
+                    self._mjd != mjd
+                    or self._index is None
+                    or self._index["segments"][-1]["n_rows"] >= self.segment_size
+                ):
+                    self._open_segment(int(mjd))
+
+                assert self._index is not None
+                segment = self._index["segments"][-1]
+
+                start = segment["n_rows"]
+                n_write = min(n_rows - written, self.segment_size - start)
+
+                for column in ARCHIVE_COLUMNS:
+                    values = batch[column][mask][written : written + n_write]
+                    self._memmaps[column][start : start + n_write] = values
+
+                times = batch["time"][mask][written : written + n_write]
+                if segment["t_min"] is None:
+                    segment["t_min"] = float(times.min())
+                segment["t_max"] = float(times.max())
+
+                segment["n_rows"] = start + n_write
+                written += n_write
+
+            for memmap in self._memmaps.values():
+                memmap.flush()
+
+            self._write_index()
+
+    def _open_segment(self, mjd: int):
+        """Starts a new segment."""
+
+        self._close_segment()
+
+        mjd_path = self.path / str(mjd)
+        mjd_path.mkdir(parents=True, exist_ok=True)
+
+        index_path = mjd_path / "index.json"
+        if index_path.exists():
+            index = json.loads(index_path.read_text())
+        else:
+            index = {"mjd": mjd, "columns": ARCHIVE_COLUMNS, "segments": []}
+
+        name = f"{len(index['segments']):04d}"
+        segment_path = mjd_path / name
+        segment_path.mkdir(parents=True, exist_ok=True)
+
+        self._memmaps = {
+            column: numpy.lib.format.open_memmap(
+                segment_path / f"{column}.npy",
+                mode="w+",
+                dtype=numpy.dtype(dtype),
+                shape=(self.segment_size,),
+            )
+            for column, dtype in ARCHIVE_COLUMNS.items()
+        }
+
+        index["segments"].append(
+            {"name": name, "n_rows": 0, "t_min": None, "t_max": None}
+        )
+
+        self._mjd = mjd
+        self._index = index
+
+        self._write_index()
+
+    def _close_segment(self):
+        """Flushes and closes the current segment."""
+
+        for memmap in self._memmaps.values():
+            memmap.flush()
+
+        self._write_index()
+
+        self._memmaps = {}
+        self._mjd = None
+        self._index = None
+
+    def _write_index(self):
+        """Writes the index of the current MJD atomically."""
+
+        if self._index is None or self._mjd is None:
+            return
+
+        index_path = self.path / str(self._mjd) / "index.json"
+        tmp_path = index_path.with_suffix(".json.tmp")
+
+        tmp_path.write_text(json.dumps(self._index))
+        os.replace(tmp_path, index_path)
+
+
+def read_telemetry_archive(
+    path: str | pathlib.Path,
+    mjd: int,
+    positioner_ids: Optional[List[int]] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> Dict[str, numpy.ndarray]:
+    """Reads the telemetry archive for an MJD.
+
+    Parameters
+    ----------
+    path
+        The root directory of the archive.
+    mjd
+        The MJD to read.
+    positioner_ids
+        The positioners to return. If `None`, returns all the positioners.
+    start
+        If set, only rows with a Unix time equal or greater are returned.
+    end
+        If set, only rows with a Unix time equal or smaller are returned.
+
+    Returns
+    -------
+    data
+        A dictionary of column name to array.
+
+    """
+
+    mjd_path = pathlib.Path(os.path.expanduser(str(path))) / str(mjd)
+
+    index_path = mjd_path / "index.json"
+    if not index_path.exists():
+        raise FileNotFoundError(f"No telemetry archive found for MJD {mjd}.")
+
+    index = json.loads(index_path.read_text())
+
+    columns: Dict[str, List[numpy.ndarray]] = {col: [] for col in ARCHIVE_COLUMNS}
+
+    for segment in index["segments"]:
+        n_rows = segment["n_rows"]
+        if n_rows == 0:
+            continue
+
+        if start is not None and segment["t_max"] < start:
+            continue
+        if end is not None and segment["t_min"] > end:
+            continue
+
+        data = {
+            column: numpy.load(mjd_path / segment["name"] / f"{column}.npy", "r")
+            for column in ARCHIVE_COLUMNS
+        }
+
+        mask = numpy.ones(n_rows, dtype=bool)
+        times = data["time"][:n_rows]
+        if start is not None:
+            mask &= times >= start
+        if end is not None:
+            mask &= times <= end
+        if positioner_ids is not None:
+            mask &= numpy.isin(data["positioner_id"][:n_rows], positioner_ids)
+
+        for column in ARCHIVE_COLUMNS:
+            columns[column].append(data[column][:n_rows][mask])
+
+    return {
+        column: numpy.concatenate(arrays)
+        if len(arrays) > 0
+        else numpy.array([], dtype=ARCHIVE_COLUMNS[column])
+        for column, arrays in columns.items()
+    }
@@ -9,7 +9,7 @@
 import asyncio
 import zlib
 
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import jaeger.core
 from jaeger.core import config, utils
@@ -19,7 +19,7 @@ from jaeger.core.positioner.positioner import CommandID
 from jaeger.core.utils.helpers import StatusMixIn
 
 
-__all__ = ["VirtualFPS", "VirtualPositioner"]
+__all__ = ["VirtualFPS", "VirtualPositioner", "VirtualCANnet"]
 
 
 TIME_STEP = config["positioner"]["time_step"]
@@ -42,10 +42,9 @@ class VirtualFPS(jaeger.core.FPS):
         self._vpositioner_bus = VirtualBus(config["profiles"]["virtual"]["channel"])
         self._vpositioners = {}
 
-        asyncio.create_task(self.process_messages())
+        self._process_messages_task = asyncio.create_task(self.process_messages())
 
     def add_virtual_positioner(self, pid: int):
-        print(pid)
         self._vpositioners[pid] = VirtualPositioner(pid, bus=self._vpositioner_bus)
 
     def _check_fibre_assignments(self, *args, **kwargs):
@@ -394,3 +393,157 @@ class VirtualPositioner(StatusMixIn):
             self.status = self._initial_status
 
         self.firmware = ".".join(firmware_chunks)
+
+
+class _VirtualCANnetBus:
+    """Sends the replies of virtual positioners to a `.VirtualCANnet` client."""
+
+    def __init__(self, bus: int):
+        self.bus = bus
+        self.writer: asyncio.StreamWriter | None = None
+
+    def send(self, msg: Message):
+        if self.writer is None or self.writer.is_closing():
+            return
+
+        line = f"M {self.bus} CED {msg.arbitration_id:08X}"
+        line += "".join([" %02X" % b for b in msg.data])
+
+        self.writer.write(line.encode() + b"\n")
+
+
+class VirtualCANnet:
+    r"""A virtual CAN\@net device with virtual positioners.
+
+    Listens on a TCP port and speaks the subset of the CAN\@net ASCII protocol
+    used by `.CANNetBus`. Frames sent to a bus are processed by the virtual
+    positioners in that bus, which reply through the same connection. Useful to
+    test and benchmark the CAN\@net code without hardware.
+
+    Parameters
+    ----------
+    host
+        The host to listen on.
+    port
+        The port to listen on.
+    positioners
+        A mapping of bus number to a list of positioner IDs in that bus.
+
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 19228,
+        positioners: Dict[int, List[int]] = {},
+    ):
+        self.host = host
+        self.port = port
+
+        self._buses: Dict[int, _VirtualCANnetBus] = {}
+        self.positioners: Dict[int, Dict[int, VirtualPositioner]] = {}
+
+        for bus, positioner_ids in positioners.items():
+            self._buses[bus] = _VirtualCANnetBus(bus)
+            self.positioners[bus] = {
+                pid: VirtualPositioner(pid, bus=self._buses[bus])  # type: ignore
+                for pid in positioner_ids
+            }
+
+        self._server: asyncio.AbstractServer | None = None
+        self._clients: Dict[asyncio.StreamWriter, asyncio.Task | None] = {}
+
+    async def start(self):
+        """Starts the server."""
+
+        self._server = await asyncio.start_server(
+            self._handle_client,
+            host=self.host,
+            port=self.port,
+        )
+
+        return self
+
+    async def stop(self):
+        """Stops the server."""
+
+        # Closing the connections ends the client handlers.
+        tasks = [task for task in self._clients.values() if task]
+        for writer in list(self._clients):
+            writer.close()
+        if len(tasks) > 0:
+            await asyncio.wait(tasks, timeout=1)
+
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        """Processes the lines from a client."""
+
+        for bus in self._buses.values():
+            bus.writer = writer
+
+        self._clients[writer] = asyncio.current_task()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                reply = await self.process_line(line.decode().strip())
+                if reply:
+                    writer.write(reply.encode() + b"\n")
+
+        except ConnectionError:
+            pass
+
+        finally:
+            self._clients.pop(writer, None)
+            writer.close()
+
+    async def process_line(self, line: str) -> str | None:
+        """Processes a line and returns the reply from the device, if any."""
+
+        parts = line.split()
+        if len(parts) == 0:
+            return None
+
+        if parts[0] == "M":
+            await self.process_frame(int(parts[1]), int(parts[3], 16), parts[4:])
+            return None
+
+        if line == "DEV IDENTIFY":
+            return "R CAN@net NT 420"
+        elif line == "DEV VERSION":
+            return "R V1.0.0"
+        elif len(parts) == 3 and parts[0] == "CAN" and parts[2] == "STATUS":
+            return f"R CAN {parts[1]} ----- 0"
+
+        return "R OK"
+
+    async def process_frame(self, bus: int, arbitration_id: int, data: List[str]):
+        """Sends a frame to the virtual positioners in a bus."""
+
+        positioners = self.positioners.get(bus, {})
+
+        msg = Message(
+            arbitration_id=arbitration_id,
+            is_extended_id=True,
+            data=bytearray([int(byte, 16) for byte in data]),
+        )
+
+        positioner_id, command_id, uid, __ = utils.parse_identifier(arbitration_id)
+
+        if positioner_id == 0:
+            for vp in positioners.values():
+                await vp.process_message(msg, positioner_id, command_id, uid)
+        elif positioner_id in positioners:
+            vp = positioners[positioner_id]
+            await vp.process_message(msg, positioner_id, command_id, uid)
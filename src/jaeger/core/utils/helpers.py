@@ -12,15 +12,18 @@ import asyncio
 import concurrent.futures
 import enum
 import logging
+import multiprocessing
+import time
 import warnings
 from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import suppress
 from functools import partial
 from threading import Thread
 
-from typing import TYPE_CHECKING, Callable, Generic, Optional, Type, TypeVar
+from typing import TYPE_CHECKING, Callable, Dict, Generic, Optional, Type, TypeVar
 
-from jaeger.core import log
+from jaeger.core import config, log
 
 
 if TYPE_CHECKING:
@@ -34,6 +37,9 @@ __all__ = [
     "PollerList",
     "Poller",
     "AsyncioExecutor",
+    "get_executor",
+    "prewarm_process_executor",
+    "shutdown_executors",
     "run_in_executor",
     "BaseBot",
 ]
@@ -276,6 +282,9 @@ class PollerList(list):
 class Poller(object):
     """A task that runs a callback periodically.
 
+    The callback is scheduled at fixed deadlines on the event loop clock, so the
+    period does not drift with the time the callback takes to run.
+
     Parameters
     ----------
     name : str
@@ -284,34 +293,116 @@ class Poller(object):
         A function or coroutine to call periodically.
     delay : float
         Initial delay between calls to the callback.
+    overrun : str
+        What to do when the callback takes longer than ``delay``. With
+        ``'skip'``, the missed deadlines are dropped and the poller waits until
+        the next deadline. With ``'catch_up'``, the callback is called
+        immediately until the poller is back on schedule.
 
     """
 
-    def __init__(self, name, callback, delay=1.0):
+    def __init__(self, name, callback, delay=1.0, overrun="skip"):
         self.name = name
         self.callback = callback
 
         self._orig_delay = delay
         self.delay = delay
 
+        if overrun not in ["skip", "catch_up"]:
+            raise ValueError(f"Invalid overrun policy {overrun!r}.")
+        self.overrun = overrun
+
         # Create two tasks, one for the sleep timer and another for the poller
         # itself. We do this because we want to be able to cancell the sleep
         # coroutine if we are going to change the delay.
         self._sleep_task = None
         self._task = None
 
+        # Set if wake() is called while the callback is running.
+        self._wake_pending = False
+
+        # Prevents a manual call from overlapping with a scheduled one.
+        self._lock = asyncio.Lock()
+
+        self.reset_metrics()
+
+    def reset_metrics(self):
+        """Resets the timing metrics."""
+
+        self.n_calls: int = 0
+        self.n_overruns: int = 0
+        self.period: float | None = None
+        self.jitter: float | None = None
+        self.max_jitter: float | None = None
+        self.last_duration: float | None = None
+
+        self._last_start: float | None = None
+
+    @property
+    def metrics(self):
+        """Returns a dictionary with the timing metrics.
+
+        ``period`` is the time between the last two calls, ``jitter`` and
+        ``max_jitter`` the mean and maximum delay of a call with respect to its
+        deadline, and ``n_overruns`` the number of times the callback took longer
+        than the delay.
+
+        """
+
+        return {
+            "delay": self.delay,
+            "n_calls": self.n_calls,
+            "period": self.period,
+            "jitter": self.jitter,
+            "max_jitter": self.max_jitter,
+            "n_overruns": self.n_overruns,
+            "last_duration": self.last_duration,
+        }
+
+    def _update_metrics(self, start: float, deadline: float):
+        """Records the timing of a scheduled call."""
+
+        lateness = max(start - deadline, 0.0)
+
+        if self._last_start is not None:
+            self.period = start - self._last_start
+
+        self.n_calls += 1
+
+        if self.jitter is None or self.max_jitter is None:
+            self.jitter = self.max_jitter = lateness
+        else:
+            self.jitter += (lateness - self.jitter) / self.n_calls
+            self.max_jitter = max(self.max_jitter, lateness)
+
+        self._last_start = start
+
+    async def _run_callback(self):
+        """Runs the callback."""
+
+        async with self._lock:
+            if asyncio.iscoroutinefunction(self.callback):
+                await self.callback()
+            else:
+                self.callback()
+
     async def poller(self):
         """The polling loop."""
 
         if self._task is None:
             raise RuntimeError("Task is not running.")
 
+        loop = asyncio.get_running_loop()
+
+        self._last_start = None
+        deadline = loop.time()
+
         while True:
+            start = loop.time()
+            self._update_metrics(start, deadline)
+
             try:
-                if asyncio.iscoroutinefunction(self.callback):
-                    await self.callback()
-                else:
-                    self.callback()
+                await self._run_callback()
             except Exception as ee:
                 if ee.__class__ == asyncio.CancelledError:
                     raise
@@ -320,9 +411,34 @@ class Poller(object):
                         {"message": "failed running callback", "exception": ee}
                     )
 
-            self._sleep_task = asyncio.create_task(asyncio.sleep(self.delay))
+            end = loop.time()
+            self.last_duration = end - start
+
+            deadline += self.delay
+            if end > deadline:
+                self.n_overruns += 1
+                if self.overrun == "skip" and self.delay > 0:
+                    # Drop the missed deadlines but keep the phase of the schedule.
+                    n_missed = (end - deadline) // self.delay + 1
+                    deadline += n_missed * self.delay
+
+            if self._wake_pending:
+                # Woken while the callback was running. Call it again now.
+                self._wake_pending = False
+                deadline = loop.time()
+                continue
+
+            # Wait for the sleep task without propagating its cancellation. The
+            # sleep can be cut short with wake().
+            self._sleep_task = asyncio.create_task(
+                asyncio.sleep(max(deadline - loop.time(), 0))
+            )
+
+            await asyncio.wait([self._sleep_task])
 
-            await self._sleep_task
+            if self._sleep_task.cancelled():
+                # Woken up. Restart the schedule from now.
+                deadline = loop.time()
 
     async def set_delay(self, delay=None, immediate=False):
         """Sets the delay for polling.
@@ -367,6 +483,7 @@ class Poller(object):
         if self.running:
             return
 
+        self._wake_pending = False
         self._task = asyncio.create_task(self.poller())
 
         return self
@@ -378,27 +495,38 @@ class Poller(object):
             return
 
         self._task.cancel()
+        self.wake()
 
         with suppress(asyncio.CancelledError):
             if self._task is not None:
                 await self._task
 
+    def wake(self, rerun: bool = False):
+        """Interrupts the current delay so that the callback is called now.
+
+        Parameters
+        ----------
+        rerun
+            If `True` and the callback is running, it is called again as soon
+            as it finishes. Use it when the result of a call that started
+            earlier is not enough.
+
+        """
+
+        if self._sleep_task is not None and not self._sleep_task.done():
+            self._sleep_task.cancel()
+        elif rerun and self.running:
+            self._wake_pending = True
+
     async def call_now(self):
-        """Calls the callback immediately."""
+        """Calls the callback immediately.
 
-        restart = False
-        delay = self.delay
-        if self.running:
-            await self.stop()
-            restart = True
+        If a scheduled call is running, waits until it is done. The schedule of
+        the poller is not modified.
 
-        if asyncio.iscoroutinefunction(self.callback):
-            await asyncio.create_task(self.callback())
-        else:
-            self.callback()
+        """
 
-        if restart:
-            self.start(delay=delay)
+        await self._run_callback()
 
     @property
     def running(self):
@@ -424,13 +552,26 @@ class AsyncioExecutor(Executor):
 
     def __init__(self):
         self._loop = asyncio.new_event_loop()
-        self._thread = Thread(target=self._target)
+        self._thread = Thread(target=self._target, daemon=True)
         self._thread.start()
 
     def _target(self):
         asyncio.set_event_loop(self._loop)
         self._loop.run_forever()
 
+        # Cancel the tasks still pending once the loop is stopped, and close it.
+        tasks = asyncio.all_tasks(self._loop)
+        for task in tasks:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._loop.close()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop running in the executor thread."""
+
+        return self._loop
+
     def submit(self, fn, *args, **kwargs):
         """Submit a coroutine to the executor."""
 
@@ -443,6 +584,85 @@ class AsyncioExecutor(Executor):
             self._thread.join()
 
 
+#: The persistent executors used by `.run_in_executor`, created on first use.
+_EXECUTORS: Dict[str, Executor] = {}
+
+
+def _init_process_worker():
+    """Imports jaeger in a new worker process."""
+
+    import jaeger.core  # noqa: F401
+
+
+def get_executor(executor: str = "thread") -> Executor:
+    """Returns the persistent executor used by `.run_in_executor`.
+
+    The executors are created the first time they are requested and reused
+    afterwards. The number of workers and the start method of the process pool
+    are read from the ``executors`` section of the configuration. Worker
+    processes import jaeger when they start.
+
+    Parameters
+    ----------
+    executor
+        Either ``"thread"`` or ``"process"``.
+
+    """
+
+    if executor in _EXECUTORS:
+        return _EXECUTORS[executor]
+
+    executor_config = config.get("executors", {})
+
+    pool: Executor
+    if executor == "thread":
+        pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=executor_config.get("thread_workers", None),
+            thread_name_prefix="jaeger",
+        )
+    elif executor == "process":
+        start_method = executor_config.get("start_method", None)
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=executor_config.get("process_workers", None),
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_process_worker,
+        )
+    else:
+        raise ValueError("Invalid executor name.")
+
+    _EXECUTORS[executor] = pool
+
+    return pool
+
+
+async def prewarm_process_executor():
+    """Starts all the worker processes of the process executor.
+
+    Worker processes are otherwise started when the first tasks are submitted,
+    which delays those tasks while the interpreter starts and imports jaeger.
+
+    """
+
+    pool = get_executor("process")
+    n_workers = getattr(pool, "_max_workers", 1)
+
+    # Enough concurrent tasks to start all the workers.
+    futures = [pool.submit(time.sleep, 0.1) for _ in range(n_workers)]
+    await asyncio.gather(*[asyncio.wrap_future(future) for future in futures])
+
+
+def shutdown_executors(wait: bool = True):
+    """Shuts down the persistent executors.
+
+    Tasks that have not started are cancelled. The executors are created again
+    if `.run_in_executor` is called afterwards.
+
+    """
+
+    for name in list(_EXECUTORS):
+        _EXECUTORS.pop(name).shutdown(wait=wait, cancel_futures=True)
+
+
 async def run_in_executor(fn, *args, catch_warnings=False, executor="thread", **kwargs):
     """Runs a function in an executor.
 
@@ -452,6 +672,9 @@ async def run_in_executor(fn, *args, catch_warnings=False, executor="thread", **
     actor log handler since inside the executor there is no loop that
     CLU can use to output the warnings.
 
+    The executors are persistent and shared (see `.get_executor`) so that
+    tasks do not wait for a new pool of threads or processes to start.
+
     In general, note that the function must not try to do anything with
     the actor since they run on different loops.
 
@@ -459,24 +682,25 @@ async def run_in_executor(fn, *args, catch_warnings=False, executor="thread", **
 
     fn = partial(fn, *args, **kwargs)
 
-    if executor == "thread":
-        executor = concurrent.futures.ThreadPoolExecutor
-    elif executor == "process":
-        executor = concurrent.futures.ProcessPoolExecutor
-    else:
-        raise ValueError("Invalid executor name.")
+    pool = get_executor(executor)
+    loop = asyncio.get_running_loop()
 
-    if catch_warnings:
-        with warnings.catch_warnings(record=True) as records:
-            with executor() as pool:
-                result = await asyncio.get_event_loop().run_in_executor(pool, fn)
+    try:
+        if catch_warnings:
+            with warnings.catch_warnings(record=True) as records:
+                result = await loop.run_in_executor(pool, fn)
 
-        for ww in records:
-            warnings.warn(ww.message, ww.category)
+            for ww in records:
+                warnings.warn(ww.message, ww.category)
 
-    else:
-        with executor() as pool:
-            result = await asyncio.get_running_loop().run_in_executor(pool, fn)
+        else:
+            result = await loop.run_in_executor(pool, fn)
+
+    except BrokenProcessPool:
+        # A worker died. Discard the pool so that a new one is created.
+        if _EXECUTORS.get(executor, None) is pool:
+            _EXECUTORS.pop(executor)
+        raise
 
     return result
 
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: conftest.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import pytest
+
+from jaeger.core import config
+from jaeger.core.fps import _FPS_INSTANCES
+from jaeger.core.maskbits import PositionerStatus
+from jaeger.core.testing import VirtualFPS, VirtualPositioner
+
+
+@pytest.fixture
+def fps_config(monkeypatch):
+    """Uses short timeouts and does not read or write the roster cache."""
+
+    monkeypatch.setitem(config["fps"], "initialise_timeouts", 0.2)
+    monkeypatch.setitem(config["fps"], "roster_file", None)
+    monkeypatch.setitem(config["fps"], "warm_start", False)
+    monkeypatch.setitem(config["fps"], "start_pollers", False)
+
+    # Virtual positioners do not need to be homed.
+    monkeypatch.setattr(
+        VirtualPositioner,
+        "_initial_status",
+        VirtualPositioner._initial_status & ~PositionerStatus.POSITION_RESTORED,
+    )
+
+    yield config
+
+
+@pytest.fixture
+async def vfps(fps_config):
+    """An initialised `.VirtualFPS` with five virtual positioners."""
+
+    fps = VirtualFPS()
+    for pid in range(1, 6):
+        fps.add_virtual_positioner(pid)
+
+    await fps.start_can()
+    await fps.initialise()
+
+    yield fps
+
+    await fps.pollers.stop()
+    await fps.quarantine_poller.stop()
+    await fps.hotplug_poller.stop()
+
+    fps.can.stop()
+    fps._process_messages_task.cancel()
+    fps._vpositioner_bus.close()
+    _FPS_INSTANCES.clear()
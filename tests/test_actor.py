@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_actor.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import asyncio
+import json
+
+import pytest
+
+from jaeger.core import log
+from jaeger.core.actor import JaegerActor
+
+
+@pytest.fixture
+async def status_actor(vfps, monkeypatch):
+    """A bare `.JaegerActor` that only runs the status server."""
+
+    actor = JaegerActor.__new__(JaegerActor)
+    actor.fps = vfps
+    actor.host = "127.0.0.1"
+    actor.log = log
+
+    n_reports = []
+    report_status = vfps.report_status
+
+    async def record():
+        n_reports.append(actor._status_tick)
+        return await report_status()
+
+    monkeypatch.setattr(vfps, "report_status", record)
+    actor.n_reports = n_reports
+
+    yield actor
+
+    actor._status_task.cancel()
+    actor.status_server.stop()
+
+
+async def test_status_server_delta(status_actor):
+    await status_actor.start_status_server(port=0, delay=0.2, delta=True)
+    port = status_actor.status_server._server.sockets[0].getsockname()[1]
+
+    clients = [await asyncio.open_connection("127.0.0.1", port) for _ in range(2)]
+
+    messages = []
+    for reader, __ in clients:
+        messages.append([json.loads(await reader.readline()) for _ in range(2)])
+
+    for writer in [writer for __, writer in clients]:
+        writer.close()
+
+    for first, second in messages:
+        assert "delta" not in first
+        assert len(first["positioners"]) == 5
+        assert second["delta"] is True
+        assert len(second["positioners"]) == 0
+
+    # The status is serialised once per period for all the clients.
+    assert len(status_actor.n_reports) == len(set(status_actor.n_reports))
+
+
+async def test_status_server_config(status_actor, fps_config, monkeypatch):
+    monkeypatch.setitem(
+        fps_config["actor"],
+        "status",
+        {"port": 0, "delay": 0.2, "delta": True},
+    )
+
+    await status_actor.start_status_server()
+
+    assert status_actor._status_delay == 0.2
+    assert status_actor._status_delta is True
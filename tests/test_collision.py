@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_collision.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import asyncio
+
+import pytest
+
+from jaeger.core.fps import _FPS_INSTANCES
+from jaeger.core.maskbits import PositionerStatus
+from jaeger.core.positioner import CommandID
+from jaeger.core.testing import VirtualFPS, VirtualPositioner
+
+
+@pytest.mark.parametrize("io_thread", [False, True])
+async def test_collision_abort_and_lock(fps_config, monkeypatch, io_thread):
+    monkeypatch.setitem(fps_config["profiles"]["virtual"], "io_thread", io_thread)
+
+    aborted = []
+    process_message = VirtualPositioner.process_message
+
+    async def record_abort(self, msg, positioner_id, command_id, uid):
+        if command_id == CommandID.SEND_TRAJECTORY_ABORT:
+            aborted.append(self.positioner_id)
+        await process_message(self, msg, positioner_id, command_id, uid)
+
+    monkeypatch.setattr(VirtualPositioner, "process_message", record_abort)
+
+    fps = VirtualFPS()
+    for pid in range(1, 6):
+        fps.add_virtual_positioner(pid)
+
+    try:
+        await fps.start_can()
+        await fps.initialise()
+
+        assert (fps.can._io_executor is not None) is io_thread
+        assert not fps.locked
+
+        # Initialise also aborts any running trajectory.
+        aborted.clear()
+
+        vpositioner = fps._vpositioners[3]
+        vpositioner.status |= PositionerStatus.COLLISION_ALPHA
+        # The abort is sent only once, even if the collision is reported twice.
+        vpositioner.reply(CommandID.COLLISION_DETECTED, 0)
+        vpositioner.reply(CommandID.COLLISION_DETECTED, 0)
+
+        # The FPS is locked before the positioners have stopped.
+        await asyncio.sleep(0.1)
+        assert fps.locked
+        assert fps.locked_by == [3]
+
+        await asyncio.sleep(1.5)
+
+        assert sorted(aborted) == [1, 2, 3, 4, 5]
+        assert fps.locked
+        assert fps.locked_by == [3]
+        assert fps.can._collision_abort_sent is False
+
+    finally:
+        fps.can.stop()
+        fps._process_messages_task.cancel()
+        fps._vpositioner_bus.close()
+        _FPS_INSTANCES.clear()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_fps.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import pytest
+
+from jaeger.core.maskbits import PositionerStatus
+from jaeger.core.positioner import CommandID
+from jaeger.core.testing import VirtualPositioner
+
+
+@pytest.fixture
+def sent_commands(vfps, monkeypatch):
+    """Records the IDs and positioners of the commands sent by the FPS."""
+
+    sent = []
+    send_command = vfps.send_command
+
+    def record(command, *args, **kwargs):
+        command = send_command(command, *args, **kwargs)
+        sent.append((command.command_id, command.positioner_ids))
+        return command
+
+    monkeypatch.setattr(vfps, "send_command", record)
+
+    yield sent
+
+
+async def test_update_telemetry_status_zero(vfps, sent_commands):
+    vfps._vpositioners[2].status = PositionerStatus(0)
+
+    assert await vfps.update_telemetry(timeout=0.5)
+
+    assert vfps[2].status == 0
+    assert sorted(command_id for command_id, __ in sent_commands) == [
+        CommandID.GET_FIRMWARE_VERSION,
+        CommandID.GET_STATUS,
+        CommandID.GET_ACTUAL_POSITION,
+    ]
+
+
+async def test_update_telemetry_no_firmware(
+    vfps,
+    sent_commands,
+    fps_config,
+    monkeypatch,
+):
+    monkeypatch.setitem(fps_config["fps"], "max_retries", 0)
+
+    process_message = VirtualPositioner.process_message
+
+    async def no_firmware(self, msg, positioner_id, command_id, uid):
+        if self.positioner_id == 3 and command_id == CommandID.GET_FIRMWARE_VERSION:
+            return
+        await process_message(self, msg, positioner_id, command_id, uid)
+
+    monkeypatch.setattr(VirtualPositioner, "process_message", no_firmware)
+
+    status = vfps[3].status
+    vfps[3].firmware = None
+
+    assert await vfps.update_telemetry(timeout=0.2)
+
+    # The status of positioner 3 is not updated and no commands are sent to it.
+    assert vfps[3].status == status
+    assert len(sent_commands) == 3
+
+
+async def test_update_status_not_connected(vfps, sent_commands):
+    vfps._vpositioners.pop(4)
+    vfps[4].offline = True
+
+    assert await vfps.update_status(positioner_ids=[1, 4, 10], timeout=0.2)
+
+    # Offline and unknown positioners are not commanded or retried.
+    assert sent_commands[-1] == (CommandID.GET_STATUS, [1])
+    assert 4 not in vfps._n_missed
+
+
+@pytest.mark.parametrize("is_retry,n_commands", [(False, 2), (True, 1)])
+async def test_update_status_is_retry(vfps, sent_commands, is_retry, n_commands):
+    vfps._vpositioners.pop(3)
+
+    await vfps.update_status(positioner_ids=[1, 3], timeout=0.1, is_retry=is_retry)
+
+    status_commands = [
+        pids for command_id, pids in sent_commands if command_id == CommandID.GET_STATUS
+    ]
+    assert status_commands == [[1, 3], [3]][:n_commands]
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_latency.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import numpy
+import pytest
+
+from jaeger.core.latency import LATENCY_BINS, LatencyHistogram, latency_stats
+
+
+def test_histogram_empty():
+    histogram = LatencyHistogram()
+
+    assert numpy.isnan(histogram.mean)
+    assert numpy.isnan(histogram.percentile(50))
+
+    summary = histogram.to_dict()
+    assert summary["n"] == 0
+    assert numpy.isnan(summary["p99"])
+    assert numpy.isnan(summary["max"])
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+
+    values = numpy.geomspace(1e-3, 1, 1000)
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.n == 1000
+    assert histogram.mean == pytest.approx(values.mean())
+    assert histogram.max == values.max()
+
+    # The estimate is the upper edge of the bin, which is within a bin width
+    # of the true percentile. numpy interpolates between values so allow for a
+    # small tolerance at the edges.
+    width = LATENCY_BINS[1] / LATENCY_BINS[0]
+    for q in [10, 50, 90, 99]:
+        expected = numpy.percentile(values, q)
+        estimate = histogram.percentile(q)
+        assert estimate in LATENCY_BINS
+        assert expected / 1.01 <= estimate <= expected * width * 1.01
+
+    assert histogram.percentile(100) == values.max()
+
+
+def test_histogram_max():
+    histogram = LatencyHistogram()
+
+    # The bin edge is capped at the maximum value.
+    histogram.record(0.0015)
+    assert histogram.percentile(50) == 0.0015
+
+    # Values larger than the last edge go to the overflow bin.
+    histogram.record(500.0)
+    assert histogram.counts[-1] == 1
+    assert histogram.percentile(99) == 500.0
+
+    summary = histogram.to_dict()
+    assert summary["n"] == 2
+    assert summary["max"] == 500.0
+
+
+async def test_latency_stats_commands(vfps):
+    latency_stats.reset()
+
+    await vfps.update_position()
+
+    summary = latency_stats.summary(group="command", metric="last_reply")
+    assert "GET_ACTUAL_POSITION" in summary
+    assert summary["GET_ACTUAL_POSITION"]["n_commands"] == 1
+    assert summary["GET_ACTUAL_POSITION"]["n_timeouts"] == 0
+    assert summary["GET_ACTUAL_POSITION"]["p50"] >= 0
+
+    positioners = latency_stats.summary(group="positioner", metric="first_reply")
+    assert sorted(positioners) == sorted(vfps.positioners)
+
+    with pytest.raises(ValueError):
+        latency_stats.summary(group="invalid")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_metrics.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import asyncio
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from jaeger.core.metrics import MetricsRegistry, MetricsServer, _Metric
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry(enabled=True)
+
+    frames = registry.counter("test_frames_total", "Frames.", ["channel"])
+    frames.inc(labels=("can0",))
+    frames.inc(2, labels=("can1",))
+
+    registry.gauge("test_queue_depth", "Queue depth.").set(5)
+
+    latency = registry.histogram("test_latency_seconds", "Latency.", ["command"])
+    latency.observe(0.001, labels=("GET_STATUS",))
+    latency.observe(0.002, labels=("GET_STATUS",))
+
+    yield registry
+
+
+@pytest.fixture
+async def server(registry):
+    server = MetricsServer(registry, host="127.0.0.1", port=0)
+    await server.start()
+
+    yield server
+
+    await server.stop()
+
+
+def get_url(url: str):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.status, response.headers, response.read().decode()
+
+
+async def test_expose_http(server):
+    url = f"http://127.0.0.1:{server.port}/metrics"
+    status, headers, body = await asyncio.to_thread(get_url, url)
+
+    assert status == 200
+    assert headers["Content-Type"].startswith("text/plain; version=0.0.4")
+
+    lines = body.splitlines()
+    assert "# TYPE test_frames_total counter" in lines
+    assert 'test_frames_total{channel="can0"} 1' in lines
+    assert 'test_frames_total{channel="can1"} 2' in lines
+    assert "# TYPE test_queue_depth gauge" in lines
+    assert "test_queue_depth 5" in lines
+    assert "# TYPE test_latency_seconds histogram" in lines
+    assert 'test_latency_seconds_bucket{command="GET_STATUS",le="+Inf"} 2' in lines
+    assert 'test_latency_seconds_count{command="GET_STATUS"} 2' in lines
+    assert 'test_latency_seconds_sum{command="GET_STATUS"} 0.003' in lines
+
+    # Buckets are cumulative.
+    buckets = [
+        int(line.split()[-1])
+        for line in lines
+        if line.startswith("test_latency_seconds_bucket")
+    ]
+    assert buckets == sorted(buckets)
+
+
+async def test_expose_not_found(server):
+    url = f"http://127.0.0.1:{server.port}/other"
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        await asyncio.to_thread(get_url, url)
+
+    assert error.value.code == 404
+
+
+async def test_collector(registry, server):
+    gauge = registry.gauge("test_collected", "Collected value.")
+    registry.set_collector("test", lambda: gauge.set(42))
+
+    url = f"http://127.0.0.1:{server.port}/metrics"
+    __, __, body = await asyncio.to_thread(get_url, url)
+
+    assert "test_collected 42" in body.splitlines()
+
+
+def test_registry_type_mismatch(registry):
+    with pytest.raises(ValueError):
+        registry.gauge("test_frames_total", "Frames.")
+
+
+def test_metric_abstract():
+    class Incomplete(_Metric):
+        def clear(self):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete("test_incomplete", "Incomplete metric.")
+
+
+def test_update_from_threads(registry):
+    counter = registry.counter("test_threads_total", "Updates.", ["thread"])
+    histogram = registry.histogram("test_threads_seconds", "Updates.")
+
+    n_threads = 4
+    n_updates = 10000
+
+    def update(index: int):
+        for _ in range(n_updates):
+            counter.inc(labels=(str(index),))
+            counter.inc(labels=("all",))
+            histogram.observe(0.001)
+
+    threads = [threading.Thread(target=update, args=(ii,)) for ii in range(n_threads)]
+    for thread in threads:
+        thread.start()
+
+    # Expose while the other threads add new samples.
+    while any(thread.is_alive() for thread in threads):
+        registry.expose()
+
+    for thread in threads:
+        thread.join()
+
+    assert counter.get(("all",)) == n_threads * n_updates
+    assert histogram.histograms[()].n == n_threads * n_updates
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_roster.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import time
+
+import pytest
+
+from jaeger.core import JaegerError
+from jaeger.core.maskbits import FPSStatus, PositionerStatus
+from jaeger.core.positioner import CommandID
+
+
+async def test_update_roster_no_changes(vfps):
+    assert await vfps.update_roster() == ([], [])
+    assert sorted(vfps) == [1, 2, 3, 4, 5]
+
+
+async def test_update_roster_added(vfps):
+    vfps.add_virtual_positioner(10)
+
+    assert await vfps.update_roster() == ([10], [])
+    assert 10 in vfps
+    assert vfps[10].initialised
+
+
+async def test_update_roster_removed_after_threshold(vfps, fps_config):
+    threshold = fps_config["fps"]["roster_remove_threshold"]
+
+    vfps._vpositioners.pop(3)
+
+    for _ in range(threshold - 1):
+        assert await vfps.update_roster() == ([], [])
+        assert 3 in vfps
+
+    assert await vfps.update_roster() == ([], [3])
+    assert 3 not in vfps
+
+
+async def test_update_roster_missed_reset(vfps, fps_config, monkeypatch):
+    monkeypatch.setitem(fps_config["fps"], "roster_remove_threshold", 2)
+
+    vpositioner = vfps._vpositioners.pop(3)
+    assert await vfps.update_roster() == ([], [])
+
+    vfps._vpositioners[3] = vpositioner
+    assert await vfps.update_roster() == ([], [])
+
+    vfps._vpositioners.pop(3)
+    assert await vfps.update_roster() == ([], [])
+    assert 3 in vfps
+
+
+async def test_update_roster_and_polls(vfps, fps_config, monkeypatch):
+    monkeypatch.setitem(fps_config["fps"], "roster_remove_threshold", 3)
+    monkeypatch.setitem(fps_config["fps"], "quarantine_threshold", 3)
+    monkeypatch.setitem(fps_config["fps"], "max_retries", 0)
+
+    vfps._vpositioners.pop(4)
+
+    # Polls and roster updates count their misses separately.
+    for _ in range(2):
+        await vfps.update_status(timeout=0.1)
+        assert await vfps.update_roster() == ([], [])
+
+    assert 4 in vfps
+    assert vfps.quarantined == set()
+    assert vfps._n_missed == {4: 2}
+    assert vfps._n_roster_missed == {4: 2}
+
+    assert await vfps.update_roster() == ([], [4])
+    assert 4 not in vfps
+    assert vfps._n_missed == {}
+
+
+async def test_update_roster_skips_quarantined(vfps, fps_config, monkeypatch):
+    monkeypatch.setitem(fps_config["fps"], "roster_remove_threshold", 1)
+
+    vfps._vpositioners.pop(5)
+    vfps.quarantine([5])
+
+    assert await vfps.update_roster() == ([], [])
+    assert 5 in vfps
+    assert vfps.quarantined == {5}
+
+
+async def test_update_roster_not_initialised(fps_config):
+    from jaeger.core.fps import _FPS_INSTANCES
+    from jaeger.core.testing import VirtualFPS
+
+    fps = VirtualFPS()
+
+    try:
+        with pytest.raises(JaegerError):
+            await fps.update_roster()
+    finally:
+        _FPS_INSTANCES.clear()
+
+
+async def test_quarantine_after_missed_replies(vfps, fps_config, monkeypatch):
+    monkeypatch.setitem(fps_config["fps"], "quarantine_threshold", 2)
+    monkeypatch.setitem(fps_config["fps"], "max_retries", 0)
+
+    vpositioner = vfps._vpositioners.pop(4)
+
+    # A single poll, including the firmware and position updates, is one miss.
+    await vfps.update_status(timeout=0.1)
+    await vfps.update_position(timeout=0.1)
+    assert vfps.quarantined == set()
+    assert vfps._n_missed == {4: 1}
+
+    await vfps.update_status(timeout=0.1)
+    assert vfps.quarantined == {4}
+    assert 4 not in vfps._get_expected_positioners()
+
+    vfps._vpositioners[4] = vpositioner
+    await vfps._probe_quarantined()
+
+    assert vfps.quarantined == set()
+    assert 4 in vfps._get_expected_positioners()
+
+
+async def test_warm_start_finds_new_positioners(
+    vfps, fps_config, monkeypatch, tmp_path
+):
+    monkeypatch.setitem(fps_config["fps"], "roster_file", str(tmp_path / "roster.json"))
+    monkeypatch.setitem(fps_config["fps"], "warm_start", True)
+
+    # Initialise again to write the roster file, and then with a new positioner.
+    await vfps.initialise()
+    assert (tmp_path / "roster.json").exists()
+
+    vfps.add_virtual_positioner(10)
+    await vfps.initialise()
+
+    assert sorted(vfps) == [1, 2, 3, 4, 5, 10]
+    assert vfps[10].initialised
+
+
+async def test_discovery_ignores_quarantined(vfps, fps_config, monkeypatch):
+    monkeypatch.setitem(fps_config["fps"], "initialise_timeouts", 2)
+
+    vfps._vpositioners.pop(5)
+    vfps.quarantine([5])
+
+    t0 = time.time()
+    command = await vfps._send_discovery_broadcast(
+        CommandID.GET_FIRMWARE_VERSION,
+        roster=[1, 2, 3, 4, 5],
+    )
+
+    assert time.time() - t0 < 1
+    assert sorted(reply.positioner_id for reply in command.replies) == [1, 2, 3, 4]
+
+
+async def test_quarantined_collision_status(vfps):
+    vfps.quarantine([2])
+    vfps[2].status |= PositionerStatus.COLLISION_BETA
+    vfps[3].status &= ~PositionerStatus.DISPLACEMENT_COMPLETED
+
+    vfps._update_fps_status()
+    assert vfps.status & FPSStatus.COLLIDED
+
+    vfps[2].status &= ~PositionerStatus.COLLISION_BETA
+    vfps[2].status &= ~PositionerStatus.DISPLACEMENT_COMPLETED
+    vfps[3].status |= PositionerStatus.DISPLACEMENT_COMPLETED
+
+    vfps._update_fps_status()
+    assert vfps.status & FPSStatus.IDLE
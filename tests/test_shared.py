@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_shared.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import subprocess
+import sys
+import threading
+import uuid
+
+import numpy
+import pytest
+
+from jaeger.core import JaegerError
+from jaeger.core.shared import SharedStateReader, SharedStateWriter
+from jaeger.core.telemetry import STATE_DTYPE
+
+
+@pytest.fixture
+def writer():
+    writer = SharedStateWriter(name=f"jaeger_test_{uuid.uuid4().hex[:8]}", capacity=10)
+
+    yield writer
+
+    if hasattr(writer, "header"):
+        writer.close()
+
+
+def get_state(n_positioners: int, value: float):
+    state = numpy.zeros(n_positioners, dtype=STATE_DTYPE)
+    state["positioner_id"] = numpy.arange(1, n_positioners + 1)
+    state["alpha"] = value
+    state["beta"] = value
+
+    return state
+
+
+def test_read(writer):
+    reader = SharedStateReader(writer.name)
+
+    sequence, t, state = reader.read()
+    assert sequence == 0
+    assert len(state) == 0
+
+    writer.update(get_state(5, 10.0), t=100.0)
+
+    sequence, t, state = reader.read()
+    assert sequence == 2
+    assert t == 100.0
+    assert list(state["positioner_id"]) == [1, 2, 3, 4, 5]
+    assert (state["alpha"] == 10.0).all()
+
+    reader.close()
+
+
+def test_read_capacity(writer):
+    writer.update(get_state(20, 1.0))
+
+    reader = SharedStateReader(writer.name)
+    assert len(reader.read()[2]) == 10
+
+    reader.close()
+
+
+def test_read_while_writing(writer):
+    reader = SharedStateReader(writer.name)
+
+    # Simulate a write in progress.
+    writer.header["sequence"] = 1
+
+    with pytest.raises(JaegerError):
+        reader.read(max_tries=10)
+
+    writer.header["sequence"] = 2
+    assert reader.read()[0] == 2
+
+    reader.close()
+
+
+def test_read_consistent(writer):
+    reader = SharedStateReader(writer.name)
+    done = threading.Event()
+
+    def write():
+        value = 0.0
+        while not done.is_set():
+            value += 1
+            writer.update(get_state(10, value))
+
+    thread = threading.Thread(target=write)
+    thread.start()
+
+    try:
+        for _ in range(2000):
+            sequence, __, state = reader.read(max_tries=100_000)
+            assert sequence % 2 == 0
+            if len(state) > 0:
+                # All the rows must come from the same update.
+                assert (state["alpha"] == state["alpha"][0]).all()
+                assert (state["beta"] == state["alpha"][0]).all()
+    finally:
+        done.set()
+        thread.join()
+
+    reader.close()
+
+
+def test_reader_invalid_segment():
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(
+        name=f"jaeger_test_{uuid.uuid4().hex[:8]}",
+        create=True,
+        size=1024,
+    )
+
+    try:
+        with pytest.raises(JaegerError):
+            SharedStateReader(shm.name)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_writer_in_use(writer):
+    with pytest.raises(JaegerError, match="in use"):
+        SharedStateWriter(name=writer.name, capacity=10)
+
+    # The existing segment has not been removed.
+    reader = SharedStateReader(writer.name)
+    assert int(reader.header["owner_pid"]) == writer.header["owner_pid"]
+    reader.close()
+
+
+def test_writer_reclaims_stale(writer):
+    # The PID of a process that has already exited.
+    output = subprocess.check_output(
+        [sys.executable, "-c", "import os; print(os.getpid())"]
+    )
+    dead_pid = int(output)
+
+    writer.header["owner_pid"] = dead_pid
+    writer.close(unlink=False)
+
+    new_writer = SharedStateWriter(name=writer.name, capacity=10)
+    assert new_writer.header["owner_pid"] != dead_pid
+
+    new_writer.close()
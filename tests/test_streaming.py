@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_streaming.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import asyncio
+import struct
+
+import numpy
+import pytest
+
+from jaeger.core.streaming import (
+    FRAME_HEADER,
+    FRAME_MAGIC,
+    FRAME_VERSION,
+    TelemetryStreamServer,
+    read_frame,
+)
+from jaeger.core.telemetry import STATE_DTYPE
+
+
+@pytest.fixture
+async def stream(vfps, tmp_path):
+    server = TelemetryStreamServer(vfps, path=str(tmp_path / "stream.sock"))
+    await server.start()
+
+    yield server
+
+    await server.stop()
+
+
+async def test_frame_on_connect(vfps, stream):
+    reader, writer = await asyncio.open_unix_connection(stream.path)
+
+    sequence, __, state = await asyncio.wait_for(read_frame(reader), 1)
+
+    assert sequence == 0
+    assert list(state["positioner_id"]) == list(vfps.positioners)
+
+    writer.close()
+
+
+async def test_trailing_frame(vfps, stream):
+    reader, writer = await asyncio.open_unix_connection(stream.path)
+    await read_frame(reader)
+
+    writer.write(b"rate 5\n")
+    await writer.drain()
+    await asyncio.sleep(0.3)
+
+    vfps[1].alpha = 10.0
+    stream.publish()
+
+    vfps[1].alpha = 20.0
+    stream.publish()
+
+    sequence, __, state = await asyncio.wait_for(read_frame(reader), 1)
+    assert sequence == 1
+    assert state["alpha"][0] == 10.0
+
+    # The second frame is skipped but the latest state is sent at the end of the
+    # interval.
+    sequence, __, state = await asyncio.wait_for(read_frame(reader), 1)
+    assert sequence == 2
+    assert state["alpha"][0] == 20.0
+
+    writer.close()
+
+
+async def test_read_frame_extended_header():
+    state = numpy.zeros(2, dtype=STATE_DTYPE)
+    state["positioner_id"] = [1, 2]
+
+    header_size = FRAME_HEADER.size + 8
+    header = FRAME_HEADER.pack(FRAME_MAGIC, FRAME_VERSION, header_size, 5, 1.0, 2)
+
+    reader = asyncio.StreamReader()
+    reader.feed_data(header + struct.pack("<Q", 0) + state.tobytes())
+    reader.feed_eof()
+
+    sequence, time, decoded = await read_frame(reader)
+
+    assert sequence == 5
+    assert time == 1.0
+    assert list(decoded["positioner_id"]) == [1, 2]
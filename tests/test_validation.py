@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_validation.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import json
+import os
+
+import jsonschema
+import pytest
+
+import jaeger.core
+from jaeger.core.actor.validation import compile_schema
+
+
+SCHEMA_FILE = os.path.join(os.path.dirname(jaeger.core.__file__), "config/schema.json")
+with open(SCHEMA_FILE) as fd:
+    SCHEMA = json.load(fd)
+
+
+#: Values to check against every keyword.
+VALUES = [
+    None,
+    True,
+    False,
+    0,
+    1,
+    -2,
+    1.5,
+    2.0,
+    "",
+    "alpha",
+    "both",
+    "?",
+    [],
+    [1, 2],
+    [1.5, "alpha"],
+    [True, None],
+    ["alpha", "beta"],
+    [[1, 2], [3, 4]],
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+    {},
+    {"key": 1},
+]
+
+
+def check_schema(schema, values):
+    checker = compile_schema(schema)
+    assert checker is not None
+
+    validator = jsonschema.Draft7Validator(schema)
+    for value in values:
+        assert checker(value) == validator.is_valid(value), (schema, value)
+
+
+@pytest.mark.parametrize("keyword", sorted(SCHEMA["properties"]))
+def test_compile_schema_keywords(keyword):
+    check_schema(SCHEMA["properties"][keyword], VALUES)
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        True,
+        False,
+        {},
+        {"title": "Anything"},
+        {"type": ["integer", "null"]},
+        {"type": "array", "items": [{"type": "string"}, {"type": "number"}]},
+        {"oneOf": [{"type": "number"}, {"type": "integer"}]},
+        {"anyOf": [{"type": "string"}, {"type": "boolean"}]},
+        {
+            "type": "object",
+            "properties": {"key": {"type": "integer"}},
+            "required": ["key"],
+            "additionalProperties": False,
+        },
+    ],
+)
+def test_compile_schema(schema):
+    check_schema(schema, VALUES + [{"key": 1.5}, {"key": 1, "other": 2}, ["a", 1]])
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"type": "string", "maxLength": 5},
+        {"type": "number", "minimum": 0},
+        {"type": "object", "additionalProperties": {"type": "number"}},
+        {"enum": [1, 2]},
+        "string",
+    ],
+)
+def test_compile_schema_unsupported(schema):
+    assert compile_schema(schema) is None
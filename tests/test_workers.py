@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-18
+# @Filename: test_workers.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import uuid
+
+import pytest
+
+from jaeger.core.interfaces.cannet import CANNetMessage
+from jaeger.core.interfaces.workers import (
+    FLAG_CONTINUED,
+    FLAG_DEVICE,
+    FLAG_EXTENDED,
+    RECORD_PAYLOAD,
+    CANNetWorkerBus,
+    FrameRing,
+)
+
+
+@pytest.fixture
+def ring():
+    ring = FrameRing(f"jaeger_test_{uuid.uuid4().hex[:8]}", capacity=4, create=True)
+
+    yield ring
+
+    ring.close(unlink=True)
+
+
+def make_message(index: int, bus: int | None = 1):
+    message = CANNetMessage(
+        arbitration_id=index,
+        is_extended_id=bus is not None,
+        timestamp=float(index),
+        data=bytes([index % 256] * 4),
+    )
+    message.bus = bus
+
+    return message
+
+
+def test_ring_push_drain(ring):
+    assert ring.push(make_message(1))
+    assert ring.push(make_message(2, bus=None))
+    assert len(ring) == 2
+
+    records = ring.drain()
+    assert len(records) == 2
+    assert len(ring) == 0
+
+    assert records["arbitration_id"].tolist() == [1, 2]
+    assert records["bus"].tolist() == [1, 0]
+    assert records["flags"].tolist() == [FLAG_EXTENDED, FLAG_DEVICE]
+    assert records["size"].tolist() == [4, 4]
+    assert bytes(records[0]["data"][:4]) == bytes([1] * 4)
+
+    assert len(ring.drain()) == 0
+
+
+def test_ring_wrap_around(ring):
+    # Advance the counters so that the next batch spans the end of the ring.
+    for ii in range(3):
+        ring.push(make_message(ii))
+    ring.drain()
+
+    for ii in range(3, 7):
+        assert ring.push(make_message(ii))
+
+    records = ring.drain()
+    assert records["arbitration_id"].tolist() == [3, 4, 5, 6]
+    assert records["timestamp"].tolist() == [3.0, 4.0, 5.0, 6.0]
+    assert [records[ii]["data"][0] for ii in range(4)] == [3, 4, 5, 6]
+
+    # Repeat for a few laps.
+    for lap in range(1, 4):
+        ids = list(range(lap * 10, lap * 10 + 3))
+        for id_ in ids:
+            ring.push(make_message(id_))
+        assert ring.drain()["arbitration_id"].tolist() == ids
+
+
+def test_ring_full(ring):
+    for ii in range(4):
+        assert ring.push(make_message(ii))
+
+    assert not ring.push(make_message(4))
+    assert ring.dropped == 1
+    assert len(ring) == 4
+
+    assert ring.drain()["arbitration_id"].tolist() == [0, 1, 2, 3]
+    assert ring.push(make_message(5))
+
+
+def test_ring_attach(ring):
+    attached = FrameRing(ring.name)
+    assert attached.capacity == 4
+
+    ring.push(make_message(1))
+    assert attached.drain()["arbitration_id"].tolist() == [1]
+    assert len(ring) == 0
+
+    attached.close()
+
+
+def test_ring_long_message(ring):
+    line = b"R " + bytes(range(48, 58)) * 15 + b"\r"
+    assert 2 * RECORD_PAYLOAD < len(line) <= 3 * RECORD_PAYLOAD
+
+    message = make_message(0, bus=None)
+    message.data = bytearray(line)
+
+    # Move the counters so that the message wraps around the end of the ring.
+    ring.push(make_message(0))
+    ring.drain()
+
+    # The message needs three records and is dropped if they do not fit.
+    for ii in range(2):
+        ring.push(make_message(ii))
+    assert not ring.push(message)
+    assert ring.dropped == 1
+    ring.drain()
+
+    assert ring.push(message)
+    assert len(ring) == 3
+    assert ring.records[[3, 0, 1]]["flags"].tolist() == [
+        FLAG_DEVICE | FLAG_CONTINUED,
+        FLAG_DEVICE | FLAG_CONTINUED,
+        FLAG_DEVICE,
+    ]
+
+    # The worker bus joins the records back into the original line.
+    bus = CANNetWorkerBus("127.0.0.1", bitrate=1000000)
+    bus.ring = ring
+    bus._drain()
+    bus.ring = None
+
+    assert len(ring) == 0
+    assert len(bus._pending) == 1
+    assert bytes(bus._pending[0].data) == line
+    assert bus._pending[0].bus is None